@@ -0,0 +1,155 @@
+import heapq
+import mmap
+import os
+import struct
+from typing import Iterator
+
+
+class SeenCheckpoint:
+    """
+    Compact binary file of commit identifiers already reported.
+    Raw object identifiers are stored as sorted fixed width records behind a small header,
+    so a lookup is a binary search on the memory mapped file
+    and loading does not need to parse anything.
+    Used by one-shot runs (e.g. called by cron) to only report new commits
+    """
+    MAGIC: bytes = b'GOCK'
+    VERSION: int = 2
+    HEADER: struct.Struct = struct.Struct('<4sHH')
+    """
+    Magic, format version and record width
+    """
+
+    width: int
+    """
+    Record width, which is the object identifier length of observed repository (20 for SHA1, 32 for SHA256).
+    A new checkpoint takes it from the first saved identifiers
+    """
+
+    def __init__(self, file: str):
+        """
+        Opens the checkpoint file. A missing file is treated as empty checkpoint
+        :param file: path of checkpoint file
+        """
+        self.file = file
+        self.width = 0
+        self.pending: set[bytes] = set()
+        self.__handle = None
+        self.__map: mmap.mmap | None = None
+        self.__count = 0
+        if os.path.isfile(file):
+            self.__open()
+
+    def __open(self):
+        """
+        Memory maps the existing checkpoint file and validates its header
+        :return: None
+        """
+        self.__handle = open(self.file, mode='rb')
+        self.__map = mmap.mmap(self.__handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.__map) < self.HEADER.size:
+            self.close()
+            raise RuntimeError(f'Invalid checkpoint file "{self.file}"')
+        magic, version, width = self.HEADER.unpack_from(self.__map)
+        payload = len(self.__map) - self.HEADER.size
+        if magic != self.MAGIC or version != self.VERSION or width == 0 or payload % width != 0:
+            self.close()
+            raise RuntimeError(f'Invalid checkpoint file "{self.file}"')
+        self.width = width
+        self.__count = payload // width
+
+    def close(self):
+        """
+        Releases the memory map of checkpoint file
+        :return: None
+        """
+        if self.__map:
+            self.__map.close()
+            self.__map = None
+        if self.__handle:
+            self.__handle.close()
+            self.__handle = None
+        self.__count = 0
+
+    def __len__(self) -> int:
+        """
+        :return: number of persisted identifiers, pending ones not included
+        """
+        return self.__count
+
+    def __contains__(self, oid: bytes) -> bool:
+        """
+        Checks if given identifier is persisted or pending
+        :param oid: raw object identifier
+        :return: TRUE when identifier is known
+        """
+        return oid in self.pending or self.__search(oid)
+
+    def __search(self, record: bytes) -> bool:
+        """
+        Binary search of record on memory mapped file
+        :param record: raw object identifier
+        :return: TRUE when record is persisted
+        """
+        if len(record) != self.width:
+            return False
+        low, high = 0, self.__count
+        while low < high:
+            mid = (low + high) // 2
+            current = self.__record(mid)
+            if current == record:
+                return True
+            if current < record:
+                low = mid + 1
+            else:
+                high = mid
+        return False
+
+    def __record(self, index: int) -> bytes:
+        """
+        :param index: record position
+        :return: record at given position of memory mapped file
+        """
+        start = self.HEADER.size + index * self.width
+        return self.__map[start:start + self.width]
+
+    def __records(self) -> Iterator[bytes]:
+        """
+        :return: all persisted records in sorted order
+        """
+        for index in range(self.__count):
+            yield self.__record(index)
+
+    def add(self, oid: bytes):
+        """
+        Marks given identifier as seen. It is persisted by next call of save
+        :param oid: raw object identifier
+        :return: None
+        """
+        if self.width and len(oid) != self.width:
+            raise ValueError(f'Object identifier of {len(oid)} bytes does not match checkpoint width {self.width}')
+        if not self.__search(oid):
+            self.pending.add(oid)
+
+    def save(self):
+        """
+        Merges pending identifiers into the sorted records and replaces the file atomically,
+        so an interrupted run never leaves a broken checkpoint behind
+        :return: None
+        """
+        if len(self.pending) == 0 and self.__map is not None:
+            return
+        if not self.width:
+            self.width = max((len(oid) for oid in self.pending), default=20)
+        temp_file = f'{self.file}.tmp'
+        with open(temp_file, mode='wb') as output:
+            output.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.width))
+            # Both sources are sorted and disjoint, a linear merge keeps the file sorted
+            for record in heapq.merge(self.__records(), sorted(self.pending)):
+                output.write(record)
+            output.flush()
+            os.fsync(output.fileno())
+        self.close()
+        os.replace(temp_file, self.file)
+        self.pending.clear()
+        self.__open()
@@ -15,13 +15,55 @@ class ConfigManager:
     """
     CONF_FILE_PARAM = 'config_file'
 
+    CLI_ONLY_KEYS: list[str] = ['once', 'profile', 'profile_sampling', 'profile_output', 'replay', 'record']
+    """
+    Switches of the run mode. Only taken from arguments, never read from or persisted to the config file,
+    otherwise saving the config once would e.g. turn every following start into a one-shot run
+    """
+
     config_defaults: dict = {
         'origin': 'https://github.com/worstprgr/git-observer/commit/',
         'filepath': c_paths.BASE_DIR,
         'logfolders': ['.'],
         'ignore': [],
+        'include_messages': [],
+        'exclude_messages': [],
+        'branches': [],
+        'exclude_branches': [],
+        'merges': 'all',
+        'folder_merges': [],
         'show_viewer': False,
-        'descending': False
+        'descending': False,
+        'streaming': False,
+        'viewer_max_rows': 5000,
+        'viewer_max_age_h': 168,
+        'viewer_window': 200,
+        'status_interval_ms': 500,
+        'viewer_columns': 8,
+        'viewer_group_folders': False,
+        'timeline': False,
+        'store': '',
+        'store_retention_d': 30,
+        'checkpoint': f'{c_paths.BASE_DIR}/checkpoint.bin',
+        'once': False,
+        'maintain_graph': False,
+        'git_concurrency': 2,
+        'git_timeout_s': 0.0,
+        'git_cpu_budget_s': 0.0,
+        'git_nice': 10,
+        'max_load': 0.0,
+        'replay': '',
+        'replay_latency': 0.0,
+        'record': '',
+        'metrics_file': '',
+        'profile': 0,
+        'profile_sampling': False,
+        'profile_output': '',
+        'memory_trace': False,
+        'memory_interval': 10,
+        'memory_budget_mb': 0.0,
+        'poll_deadline_s': 900.0,
+        'journal': ''
     }
 
     __active_config__: Namespace = None
@@ -63,17 +105,31 @@ class ConfigManager:
                 file_parser = IniConfigParser(ConfigManager.config_defaults, arg_config.config_file)
                 # Check, if config file provided by argument reference even exists
                 if file_parser.has_config():
-                    return file_parser.parse_config()
+                    return ConfigManager.__apply_cli_only__(file_parser.parse_config(), arg_config)
             # Return argument config if file not given or failed
             return arg_config
 
         # If no arguments are given, we check for INI file
         file_parser = IniConfigParser(ConfigManager.config_defaults)
         if file_parser.has_config():
-            return file_parser.parse_config()
+            return ConfigManager.__apply_cli_only__(file_parser.parse_config(), Namespace())
 
         return None
 
+    @staticmethod
+    def __apply_cli_only__(file_config: Namespace, arg_config: Namespace) -> Namespace:
+        """
+        Replaces the run mode switches of a file config by the ones given as arguments
+        :param file_config: config parsed from file
+        :param arg_config: config parsed from arguments
+        :return: file config
+        """
+        for key in ConfigManager.CLI_ONLY_KEYS:
+            file_config.__dict__.pop(key, None)
+            if key in arg_config:
+                file_config.__dict__[key] = arg_config.__dict__[key]
+        return file_config
+
     @staticmethod
     def get_defaults() -> Namespace:
         """
@@ -98,6 +154,8 @@ class ConfigManager:
         """
         result: dict[str, Any] = dict()
         for key in self.active_config.__dict__.keys():
+            if key in ConfigManager.CLI_ONLY_KEYS:
+                continue
             current_val = self.active_config.__dict__.get(key)
             value: Any
             if type(current_val) is list:
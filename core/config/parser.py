@@ -149,15 +149,123 @@ class ArgConfigParser(ConfigSourceParser):
         actions.append(parser.add_argument('-ig', '--ignore', metavar='Author',
                                            required=False, type=str, nargs='+',
                                            default=None, help='Author name to be ignored'))
+        actions.append(parser.add_argument('-im', '--include-messages', metavar='Pattern',
+                                           required=False, type=str, nargs='+', default=None,
+                                           help='Regular expression, only commits with matching message are observed'))
+        actions.append(parser.add_argument('-em', '--exclude-messages', metavar='Pattern',
+                                           required=False, type=str, nargs='+', default=None,
+                                           help='Regular expression, commits with matching message are ignored'))
+        actions.append(parser.add_argument('-br', '--branches', metavar='Pattern',
+                                           required=False, type=str, nargs='+', default=None,
+                                           help='Glob pattern of branches or refs to be observed. DEFAULT: all refs'))
+        actions.append(parser.add_argument('-eb', '--exclude-branches', metavar='Pattern',
+                                           required=False, type=str, nargs='+', default=None,
+                                           help='Glob pattern of branches or refs to be skipped'))
+        actions.append(parser.add_argument('-mm', '--merges', action='store',
+                                           required=False, default=None,
+                                           help='Merge commit handling: all, no-merges, merges-only or first-parent'))
+        actions.append(parser.add_argument('-fm', '--folder-merges', metavar='Folder=Mode',
+                                           required=False, type=str, nargs='+', default=None,
+                                           help='Merge commit handling of a specific folder'))
         actions.append(parser.add_argument('-ui', '--show-viewer', action='store_true',
                                            required=False, default=None,
                                            help='Flag to determine if application should open a grid in UI'))
         actions.append(parser.add_argument('-desc', '--descending', action='store_true',
                                            required=False, default=None,
                                            help='Flag if output should be descending. DEFAULT for --use-viewer'))
+        actions.append(parser.add_argument('-sm', '--streaming', action='store_true',
+                                           required=False, default=None,
+                                           help='Flag to let git stream commits unordered and sort them while reading'))
         actions.append(parser.add_argument('-cnf', '--config-file', action='store',
                                            required=False, default=None,
                                            help='Configuration file to receive application config from'))
+        actions.append(parser.add_argument('-vmr', '--viewer-max-rows', action='store',
+                                           required=False, default=None,
+                                           help='Maximum number of rows kept by viewer. 0 means unbounded'))
+        actions.append(parser.add_argument('-vma', '--viewer-max-age-h', action='store',
+                                           required=False, default=None,
+                                           help='Maximum age in hours of rows kept by viewer. 0 means unbounded'))
+        actions.append(parser.add_argument('-vw', '--viewer-window', action='store',
+                                           required=False, default=None,
+                                           help='Number of rows materialized at once in viewer grid'))
+        actions.append(parser.add_argument('-si', '--status-interval-ms', action='store',
+                                           required=False, default=None,
+                                           help='Minimum milliseconds between two status updates in viewer'))
+        actions.append(parser.add_argument('-vc', '--viewer-columns', action='store',
+                                           required=False, default=None,
+                                           help='Number of folder columns materialized at once in viewer grid'))
+        actions.append(parser.add_argument('-vg', '--viewer-group-folders', action='store_true',
+                                           required=False, default=None,
+                                           help='Flag to collapse folders sharing a path prefix into one column'))
+        actions.append(parser.add_argument('-tl', '--timeline', action='store_true',
+                                           required=False, default=None,
+                                           help='Flag to show commits of all folders in one time ordered timeline'))
+        actions.append(parser.add_argument('-st', '--store', action='store',
+                                           required=False, default=None,
+                                           help='SQLite file to persist observed commits for a warm start'))
+        actions.append(parser.add_argument('-sr', '--store-retention-d', action='store',
+                                           required=False, default=None,
+                                           help='Days persisted commits are kept in store. 0 means unbounded'))
+        actions.append(parser.add_argument('-cp', '--checkpoint', action='store',
+                                           required=False, default=None,
+                                           help='Checkpoint file of commits already reported by --once runs'))
+        actions.append(parser.add_argument('-on', '--once', action='store_true',
+                                           required=False, default=None,
+                                           help='Flag to observe once, print new commits and exit (e.g. for cron)'))
+        actions.append(parser.add_argument('-mg', '--maintain-graph', action='store_true',
+                                           required=False, default=None,
+                                           help='Flag to refresh the commit-graph of observed repository after fetching'))
+        actions.append(parser.add_argument('-gc', '--git-concurrency', action='store',
+                                           required=False, default=None,
+                                           help='Maximum number of git processes running at once'))
+        actions.append(parser.add_argument('-gt', '--git-timeout-s', action='store',
+                                           required=False, default=None,
+                                           help='Timeout in seconds of each git call. 0 means default per git command'))
+        actions.append(parser.add_argument('-gb', '--git-cpu-budget-s', action='store',
+                                           required=False, default=None,
+                                           help='CPU seconds all git processes may consume per minute. 0 means unlimited'))
+        actions.append(parser.add_argument('-gn', '--git-nice', action='store',
+                                           required=False, default=None,
+                                           help='Niceness increment of git processes. 0 keeps normal priority'))
+        actions.append(parser.add_argument('-ml', '--max-load', action='store',
+                                           required=False, default=None,
+                                           help='Load average per CPU above which fetch and maintenance are deferred'))
+        actions.append(parser.add_argument('-rp', '--replay', action='store',
+                                           required=False, default=None,
+                                           help='Fixture directory or "synthetic:commits=N,folders=N" replayed instead of calling git'))
+        actions.append(parser.add_argument('-rl', '--replay-latency', action='store',
+                                           required=False, default=None,
+                                           help='Factor applied to recorded durations of replayed git calls. 0 answers immediately'))
+        actions.append(parser.add_argument('-rc', '--record', action='store',
+                                           required=False, default=None,
+                                           help='Directory recording outputs of git calls as fixtures for --replay'))
+        actions.append(parser.add_argument('-mf', '--metrics-file', action='store',
+                                           required=False, default=None,
+                                           help='Prometheus textfile rewritten with metrics after each iteration'))
+        actions.append(parser.add_argument('-pf', '--profile', action='store',
+                                           required=False, default=None,
+                                           help='Number of iterations to profile, then print hot functions and exit'))
+        actions.append(parser.add_argument('-ps', '--profile-sampling', action='store_true',
+                                           required=False, default=None,
+                                           help='Flag to profile by sampling only, without the overhead of cProfile'))
+        actions.append(parser.add_argument('-po', '--profile-output', action='store',
+                                           required=False, default=None,
+                                           help='Path of profile files without extension. Default logs/profile'))
+        actions.append(parser.add_argument('-mt', '--memory-trace', action='store_true',
+                                           required=False, default=None,
+                                           help='Flag to log the top memory growth sites traced by tracemalloc'))
+        actions.append(parser.add_argument('-mi', '--memory-interval', action='store',
+                                           required=False, default=None,
+                                           help='Number of iterations between two memory snapshots'))
+        actions.append(parser.add_argument('-mb', '--memory-budget-mb', action='store',
+                                           required=False, default=None,
+                                           help='Traced memory in MiB above which the oldest observations are evicted'))
+        actions.append(parser.add_argument('-pd', '--poll-deadline-s', action='store',
+                                           required=False, default=None,
+                                           help='Seconds an iteration may take before its git processes get killed. 0 disables'))
+        actions.append(parser.add_argument('-jn', '--journal', action='store',
+                                           required=False, default=None,
+                                           help='JSON lines file each iteration appends a record of its timings to'))
 
         # Store default arguments as list in order to check against actual defaults
         for a in actions:
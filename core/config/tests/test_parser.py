@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 from core.config.management import ConfigManager
@@ -108,9 +110,45 @@ class TestArgConfigParser(unittest.TestCase):
             'testfp',
             ['testlog1', 'testlog2'],
             ['testignore1', 'testignore2'],
+            ['testinclude1', 'testinclude2'],
+            ['testexclude1', 'testexclude2'],
+            ['testbranch1', 'testbranch2'],
+            ['testexcludebranch1', 'testexcludebranch2'],
+            'no-merges',
+            ['testfolder1=first-parent', 'testfolder2=merges-only'],
             True,
             True,
-            'testconfig.file'
+            True,
+            'testconfig.file',
+            '5000',
+            '168',
+            '200',
+            '500',
+            '8',
+            True,
+            True,
+            'teststore.db',
+            '30',
+            'testcheckpoint.bin',
+            True,
+            True,
+            '2',
+            '60',
+            '30',
+            '10',
+            '1.5',
+            'synthetic:commits=1000,folders=10',
+            '1.0',
+            'fixtures',
+            '/tmp/git_observer.prom',
+            '3',
+            True,
+            'profile/run',
+            True,
+            '5',
+            '256',
+            '600',
+            'journal.jsonl'
         ]
 
         test_parser = cm.zip_options_with_args(test_arguments, all_available_args)
@@ -182,6 +220,33 @@ class IniConfigTest(unittest.TestCase):
         # It is expected to return True since test changed all bool to flip
         self.assertTrue(has_changed, 'Changed config expected to be interpreted as such')
 
+    def test_save_and_reload(self):
+        """
+        Tests if a saved config reads back with its flags, but without the switches of the run mode
+        """
+        # Given is a config of a one-shot run, whose timeline flag is edited to be shown
+        ConfigManager.__active_config__ = ConfigManager.get_defaults()
+        ConfigManager.__active_config__.once = True
+        ConfigManager.__active_config__.profile = 3
+        config_handler = ConfigManager()
+        edit_values = config_handler.get_simplified_config()
+        edit_values['timeline'] = True
+
+        with tempfile.TemporaryDirectory() as directory:
+            config_handler.persistent_handler.config_ini_file = os.path.join(directory, 'config.ini')
+
+            # When saving it and reading it back
+            config_handler.apply_changes(edit_values)
+            reloaded = IniConfigParser(ConfigManager.config_defaults,
+                                       config_handler.persistent_handler.config_ini_file).parse_config()
+
+        # It is expected that flags keep their value and the run mode is not persisted
+        self.assertTrue(reloaded.timeline)
+        self.assertFalse(reloaded.descending)
+        self.assertFalse(reloaded.show_viewer)
+        for key in ConfigManager.CLI_ONLY_KEYS:
+            self.assertNotIn(key, reloaded)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,259 @@
+import re
+from fnmatch import fnmatchcase
+from typing import Pattern
+
+from core.transport import Commit
+
+
+class FilterPlan:
+    """
+    Result of splitting a CommitFilter into arguments evaluated by git
+    and a predicate evaluated in Python for everything git could not handle
+    """
+    git_args: list[str]
+    """
+    Arguments appended to git log
+    """
+    authors: frozenset[str]
+    """
+    Ignored committer names still checked in Python
+    """
+    include: Pattern | None
+    """
+    Combined message pattern a commit needs to match, if still checked in Python
+    """
+    exclude: Pattern | None
+    """
+    Combined message pattern a commit must not match, if still checked in Python
+    """
+    exclude_args: list[str]
+    """
+    Arguments of a separate git log listing the commits matched by exclusion patterns,
+    if git evaluates them besides included patterns
+    """
+    excluded: set[bytes]
+    """
+    Commits listed by the exclusion call of current iteration
+    """
+
+    def __init__(self, git_args: list[str], authors: frozenset[str], include: Pattern | None, exclude: Pattern | None,
+                 exclude_args: list[str] = None):
+        self.git_args = git_args
+        self.authors = authors
+        self.include = include
+        self.exclude = exclude
+        self.exclude_args = exclude_args or []
+        self.excluded = set()
+
+    def accepts(self, commit: Commit) -> bool:
+        """
+        Checks the criteria left to Python
+        :param commit: parsed commit
+        :return: TRUE if commit passes the filter
+        """
+        if commit.author in self.authors:
+            return False
+        if self.excluded and commit.oid in self.excluded:
+            return False
+        if self.include and not self.include.search(commit.message):
+            return False
+        if self.exclude and self.exclude.search(commit.message):
+            return False
+        return True
+
+
+class CommitFilter:
+    """
+    Filter configuration of observed commits: ignored committers
+    and message patterns to include or exclude.
+    Criteria are pushed down into git log where git supports them,
+    so filtered commits are never formatted and piped at all
+    """
+
+    def __init__(self, ignore_authors: list[str] = None, include_messages: list[str] = None,
+                 exclude_messages: list[str] = None):
+        """
+        Instantiates a new filter configuration
+        :param ignore_authors: [Optional] committer names to be ignored
+        :param include_messages: [Optional] regular expressions, a message needs to match one of them
+        :param exclude_messages: [Optional] regular expressions, a message must not match any of them
+        """
+        self.authors = frozenset(author for author in ignore_authors or [] if author)
+        self.include_messages = [pattern for pattern in include_messages or [] if pattern]
+        self.exclude_messages = [pattern for pattern in exclude_messages or [] if pattern]
+
+    @staticmethod
+    def combine(patterns: list[str]) -> Pattern | None:
+        """
+        Compiles several patterns to one alternation, so each message is scanned once
+        :param patterns: regular expressions
+        :return: combined expression, None if no pattern given
+        """
+        if len(patterns) == 0:
+            return None
+        return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+    def plan(self, pushdown: bool = True, perl_regexp: bool = False) -> FilterPlan:
+        """
+        Splits the filter into git arguments and the remaining Python predicate.
+        Message patterns are given to git as perl compatible regular expressions if supported, which Python
+        shares the syntax with, otherwise as extended ones. Git matches them against every line of the full message,
+        while Python only knows the subject, so git evaluates them whenever possible.
+        Git can either include or exclude by message, so when both are configured
+        the excluded commits are listed by a separate call.
+        Ignored committers can only be expressed as negative lookahead, requiring perl compatible regexes
+        :param pushdown: flag if git evaluates criteria, FALSE evaluates all of them in Python on the subject
+        :param perl_regexp: flag if git supports perl compatible regular expressions
+        :return: FilterPlan
+        """
+        authors = self.authors
+        include = self.combine(self.include_messages)
+        exclude = self.combine(self.exclude_messages)
+        if not pushdown:
+            return FilterPlan([], authors, include, exclude)
+
+        git_args = []
+        exclude_args = []
+        if include:
+            git_args.extend(f'--grep={pattern}' for pattern in self.include_messages)
+            include = None
+            if exclude:
+                exclude_args.extend(f'--grep={pattern}' for pattern in self.exclude_messages)
+                exclude = None
+        elif exclude:
+            git_args.extend(f'--grep={pattern}' for pattern in self.exclude_messages)
+            git_args.append('--invert-grep')
+            exclude = None
+
+        if perl_regexp and len(authors) > 0:
+            names = '|'.join(re.escape(author) for author in sorted(authors))
+            git_args.append(f'--committer=^(?!(?:{names}) <)')
+            authors = frozenset()
+
+        regexp_type = '--perl-regexp' if perl_regexp else '--extended-regexp'
+        if len(git_args) > 0:
+            git_args.append(regexp_type)
+        if len(exclude_args) > 0:
+            exclude_args.append(regexp_type)
+        return FilterPlan(git_args, authors, include, exclude, exclude_args)
+
+
+class RefScope:
+    """
+    Refs git log starts its traversal from and decorates commits with.
+    Limiting them keeps traversal cost proportional to the branches of interest,
+    instead of walking stashes, notes, tags and stale remote branches by --all
+    """
+
+    def __init__(self, include: list[str] = None, exclude: list[str] = None):
+        """
+        Instantiates a new ref scope. Patterns starting with "refs/" are full ref globs,
+        others are branch names matched against local and remote tracking branches
+        :param include: [Optional] patterns of refs to observe, DEFAULT: all refs
+        :param exclude: [Optional] patterns of refs to skip
+        """
+        self.include = [ref for pattern in include or [] if pattern for ref in self.expand(pattern)]
+        self.exclude = [ref for pattern in exclude or [] if pattern for ref in self.expand(pattern)]
+
+    @staticmethod
+    def expand(pattern: str) -> list[str]:
+        """
+        Expands a pattern to full ref globs
+        :param pattern: full ref glob or branch name glob
+        :return: full ref globs
+        """
+        if pattern.startswith('refs/'):
+            return [pattern]
+        return [f'refs/heads/{pattern}', f'refs/remotes/*/{pattern}']
+
+    @staticmethod
+    def is_glob(pattern: str) -> bool:
+        """
+        :param pattern: full ref glob
+        :return: TRUE if pattern contains a wildcard, otherwise it names a single ref
+        """
+        return any(char in pattern for char in '*?[')
+
+    def get_traversal_args(self) -> list[str]:
+        """
+        Builds the revision arguments of git log.
+        Git resets exclusions after each ref option, so they precede every included glob.
+        Git appends /* to a glob without wildcard, so a single ref is passed as revision instead,
+        ignored if it does not exist. Exclusions do not apply to revisions, so they are checked here
+        :return: revision arguments
+        """
+        excludes = [f'--exclude={pattern}' for pattern in self.exclude]
+        if len(self.include) == 0:
+            return excludes + ['--all']
+        args = []
+        refs = [pattern for pattern in self.include if not self.is_glob(pattern) and
+                not any(fnmatchcase(pattern, exclude) for exclude in self.exclude)]
+        if len(refs) > 0:
+            args.append('--ignore-missing')
+        for pattern in self.include:
+            if self.is_glob(pattern):
+                args.extend(excludes)
+                args.append(f'--glob={pattern}')
+        return args + refs
+
+    def get_decoration_args(self) -> list[str]:
+        """
+        Builds the arguments limiting the refs shown as branch of a commit to the same scope
+        :return: decoration arguments
+        """
+        return ([f'--decorate-refs={pattern}' for pattern in self.include] +
+                [f'--decorate-refs-exclude={pattern}' for pattern in self.exclude])
+
+
+class MergeMode:
+    """
+    Handling of merge commits during traversal, globally and per observed folder.
+    Applied by git, so merge-heavy histories are not walked and piped completely
+    """
+    ARGS: dict[str, list[str]] = {
+        'all': [],
+        'no-merges': ['--no-merges'],
+        'merges-only': ['--merges'],
+        'first-parent': ['--first-parent']
+    }
+    """
+    Git log arguments by mode
+    """
+
+    def __init__(self, default: str = 'all', overrides: list[str] = None):
+        """
+        Instantiates a new merge configuration
+        :param default: [Optional] mode of folders without override, DEFAULT: all commits
+        :param overrides: [Optional] modes of specific folders formatted as "folder=mode"
+        """
+        self.default = self.validate(default or 'all')
+        self.overrides: dict[str, str] = dict()
+        for override in overrides or []:
+            folder, separator, mode = override.rpartition('=')
+            if not separator or not folder:
+                raise ValueError(f'Expected merge mode override formatted as "folder=mode", got "{override}"')
+            self.overrides[folder.strip()] = self.validate(mode.strip())
+
+    def validate(self, mode: str) -> str:
+        """
+        Validates the name of a mode
+        :param mode: name of mode
+        :return: validated mode
+        """
+        if mode not in self.ARGS:
+            raise ValueError(f'Unknown merge mode "{mode}", expected one of {", ".join(self.ARGS.keys())}')
+        return mode
+
+    def get_mode(self, folder: str) -> str:
+        """
+        :param folder: observed folder
+        :return: mode of given folder
+        """
+        return self.overrides.get(folder, self.default)
+
+    def get_args(self, folder: str) -> list[str]:
+        """
+        :param folder: observed folder
+        :return: git log arguments of given folder
+        """
+        return self.ARGS[self.get_mode(folder)]
@@ -0,0 +1,193 @@
+import os
+import shutil
+import subprocess
+import time
+from collections import deque
+from threading import BoundedSemaphore, Event as ThreadEvent, Lock
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, CPU budget is not enforced there
+    resource = None
+
+
+class ResourceGovernor:
+    """
+    Keeps background git work from competing with the actual work on a workstation or build host.
+    Shared by the runners of all observed repositories of a process, it caps the number of concurrent
+    git processes and the CPU seconds they consume per minute, lowers their CPU and IO priority
+    and defers non-urgent work (fetch, commit-graph maintenance) while the system is busy
+    """
+    WINDOW: float = 60.0
+    """
+    Sliding window in seconds the CPU budget applies to
+    """
+    DEFER_MAX: float = 900.0
+    """
+    Seconds non-urgent work is deferred at most, so a permanently busy host still gets fetched
+    """
+    IONICE: list[str] = ['-c', '2', '-n', '7']
+    """
+    Lowest best-effort IO priority, idle class could starve git completely on a busy disk
+    """
+
+    __shared: 'ResourceGovernor | None' = None
+    __shared_lock: Lock = Lock()
+
+    def __init__(self, max_concurrent: int = 2, cpu_budget: float = 0, max_load: float = 0, nice: int = 10):
+        """
+        Instantiates a new governor
+        :param max_concurrent: [Optional] maximum number of git processes running at once
+        :param cpu_budget: [Optional] CPU seconds git may consume per minute, 0 means unlimited
+        :param max_load: [Optional] load average per CPU above which non-urgent work is deferred, 0 means never
+        :param nice: [Optional] niceness increment of git processes, 0 keeps normal priority
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.cpu_budget = cpu_budget if resource else 0
+        self.max_load = max_load if hasattr(os, 'getloadavg') else 0
+        self.nice = nice
+        self.ionice = shutil.which('ionice') if nice > 0 and os.name != 'nt' else None
+        self.nice_executable = shutil.which('nice') if os.name != 'nt' else None
+        self.throttled = 0.0
+        """
+        Seconds calls waited for CPU budget
+        """
+        self.deferrals = 0
+        self.__slots = BoundedSemaphore(self.max_concurrent)
+        self.__lock = Lock()
+        self.__usage: deque[tuple[float, float]] = deque()
+        self.__children_cpu = self.get_children_cpu()
+        self.__last_run: dict[str, float] = dict()
+
+    @staticmethod
+    def shared(max_concurrent: int = 2, cpu_budget: float = 0, max_load: float = 0,
+               nice: int = 10) -> 'ResourceGovernor':
+        """
+        Returns the governor of this process, created by the first caller
+        :param max_concurrent: [Optional] see constructor
+        :param cpu_budget: [Optional] see constructor
+        :param max_load: [Optional] see constructor
+        :param nice: [Optional] see constructor
+        :return: ResourceGovernor
+        """
+        with ResourceGovernor.__shared_lock:
+            if ResourceGovernor.__shared is None:
+                ResourceGovernor.__shared = ResourceGovernor(max_concurrent, cpu_budget, max_load, nice)
+            return ResourceGovernor.__shared
+
+    @staticmethod
+    def get_children_cpu() -> float:
+        """
+        :return: CPU seconds consumed by all terminated child processes of this process
+        """
+        if not resource:
+            return 0.0
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return usage.ru_utime + usage.ru_stime
+
+    def get_load(self) -> float:
+        """
+        :return: one minute load average per CPU, 0 if unknown
+        """
+        if not hasattr(os, 'getloadavg'):
+            return 0.0
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+
+    def get_budget_delay(self) -> float:
+        """
+        Determines how long the next call needs to wait, until the CPU used within the window
+        drops below budget again
+        :return: seconds to wait, 0 if budget is left
+        """
+        if self.cpu_budget <= 0:
+            return 0.0
+        now = time.monotonic()
+        with self.__lock:
+            while self.__usage and self.__usage[0][0] <= now - self.WINDOW:
+                self.__usage.popleft()
+            used = sum(cpu for _, cpu in self.__usage)
+            for finished, cpu in self.__usage:
+                if used < self.cpu_budget:
+                    break
+                # Budget frees up when this call leaves the window
+                used -= cpu
+                if used < self.cpu_budget:
+                    return finished + self.WINDOW - now
+        return 0.0
+
+    def acquire(self, stop: ThreadEvent, urgent: bool = False) -> bool:
+        """
+        Waits for CPU budget, unless the call is urgent, and a free slot
+        :param stop: event aborting the wait
+        :param urgent: [Optional] flag of calls a user waits for, which are not throttled
+        :return: FALSE if aborted and no slot was taken
+        """
+        while not urgent and not stop.is_set():
+            delay = self.get_budget_delay()
+            if delay <= 0:
+                break
+            start = time.monotonic()
+            stop.wait(delay)
+            self.throttled += time.monotonic() - start
+        while not stop.is_set():
+            # Timed acquire, so a stop is noticed while all slots are taken
+            if self.__slots.acquire(timeout=0.5):
+                return True
+        return False
+
+    def release(self):
+        """
+        Frees the slot of a finished call and charges the CPU it consumed to the budget
+        :return: None
+        """
+        self.__slots.release()
+        children_cpu = self.get_children_cpu()
+        with self.__lock:
+            # Children of concurrent calls are charged to whichever call finishes first, fine for a budget
+            consumed = children_cpu - self.__children_cpu
+            self.__children_cpu = children_cpu
+            if consumed > 0:
+                self.__usage.append((time.monotonic(), consumed))
+
+    def defer(self, work: str) -> bool:
+        """
+        Decides if non-urgent work is skipped this time, because the system is busy.
+        Work is not deferred longer than DEFER_MAX since it last ran
+        :param work: name of work, e.g. fetch
+        :return: TRUE if work should be skipped
+        """
+        now = time.monotonic()
+        with self.__lock:
+            # Work never run before counts from its first attempt
+            overdue = now - self.__last_run.setdefault(work, now) > self.DEFER_MAX
+            if self.max_load > 0 and not overdue and self.get_load() > self.max_load:
+                self.deferrals += 1
+                return True
+            self.__last_run[work] = now
+        return False
+
+    def get_popen_args(self, cmd: list[str], low_priority: bool) -> tuple[list[str], dict]:
+        """
+        Applies the process priority of a git call
+        :param cmd: argument list starting with git executable
+        :param low_priority: flag to lower priority even further, e.g. for maintenance
+        :return: argument list and keyword arguments of Popen
+        """
+        if self.nice <= 0 and not low_priority:
+            return cmd, {}
+        if os.name == 'nt':
+            # Windows knows no niceness, below normal is the closest class
+            return cmd, {'creationflags': subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+        increment = max(self.nice, 10) if low_priority else self.nice
+        if self.ionice:
+            cmd = [self.ionice, *self.IONICE, *cmd]
+        # Prefix instead of preexec_fn, which is unsafe in threads and prevents Popen from using posix_spawn
+        if self.nice_executable:
+            cmd = [self.nice_executable, '-n', str(increment), *cmd]
+        return cmd, {}
+
+    def __str__(self) -> str:
+        budget = f'{self.cpu_budget:g} CPU s/min' if self.cpu_budget > 0 else 'unlimited'
+        return (f'{self.max_concurrent} concurrent, CPU budget {budget}, '
+                f'throttled {self.throttled:.1f} s, {self.deferrals} deferrals')
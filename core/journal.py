@@ -0,0 +1,213 @@
+import json
+import math
+import os
+import time
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Iterator
+
+from core.logger import Logger
+from core.metrics import PollMetrics
+
+
+class PollJournal:
+    """
+    Append-only journal of observer iterations, one JSON record per line.
+    Records are buffered and appended in batches, so a journal costs one write every few iterations.
+    Unlike the log, its records can be evaluated for performance trending, see summarize
+    """
+    BATCH: int = 20
+    """
+    Number of buffered records written at once
+    """
+    FLUSH_INTERVAL: float = 300.0
+    """
+    Seconds records are buffered at most
+    """
+    PERCENTILES: tuple[int, ...] = (50, 95, 99)
+
+    def __init__(self, file: str, batch: int = BATCH, flush_interval: float = FLUSH_INTERVAL):
+        """
+        Instantiates a new journal appending to given file
+        :param file: JSON lines file, created if missing
+        :param batch: [Optional] number of buffered records written at once
+        :param flush_interval: [Optional] seconds records are buffered at most
+        """
+        self.logger = Logger(__name__).log_init
+        self.file = file
+        self.batch = max(1, batch)
+        self.flush_interval = flush_interval
+        self.__buffer: list[str] = []
+        self.__last_flush = time.monotonic()
+        self.__lock = Lock()
+
+    @staticmethod
+    def create_record(repository: str, poll: PollMetrics) -> dict:
+        """
+        :param repository: Git root of observed repository
+        :param poll: metrics of a finished iteration
+        :return: record of iteration
+        """
+        return {
+            'time': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'repository': str(repository),
+            'fingerprint': poll.fingerprint,
+            'duration_s': round(poll.duration, 6),
+            'phases': {phase: round(seconds, 6) for phase, seconds in poll.phases.items()},
+            'commands': {command: {'calls': metrics.calls, 'duration_s': round(metrics.total, 6),
+                                   'failures': metrics.failures, 'timeouts': metrics.timeouts}
+                         for command, metrics in poll.commands.items()},
+            'commits': {'seen': poll.commits_seen, 'new': poll.commits_new, 'ignored': poll.commits_ignored},
+            'git_processes': poll.git_processes,
+            'bytes_read': poll.bytes_read,
+            'errors': poll.get_errors()
+        }
+
+    def append(self, record: dict):
+        """
+        Buffers a record and writes the buffer, once the batch is full or records were buffered for too long
+        :param record: JSON serializable record
+        :return: None
+        """
+        with self.__lock:
+            self.__buffer.append(json.dumps(record, separators=(',', ':')))
+            due = len(self.__buffer) >= self.batch or time.monotonic() - self.__last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        """
+        Appends all buffered records to the file.
+        A file that can not be written is reported, but does not stop the observation, its records are dropped
+        :return: None
+        """
+        with self.__lock:
+            lines, self.__buffer = self.__buffer, []
+            self.__last_flush = time.monotonic()
+            if not lines:
+                return
+            try:
+                folder = os.path.dirname(self.file)
+                if folder:
+                    os.makedirs(folder, exist_ok=True)
+                with open(self.file, mode='a', encoding='utf-8') as journal:
+                    journal.write('\n'.join(lines) + '\n')
+            except OSError as error:
+                self.logger.warning(f'Writing {len(lines)} record(s) to journal "{self.file}" failed: {error}')
+
+    def close(self):
+        self.flush()
+
+    @staticmethod
+    def read(file: str, since: datetime = None, until: datetime = None,
+             repository: str = None) -> Iterator[dict]:
+        """
+        Reads the records of a journal. Lines of an interrupted write are skipped
+        :param file: JSON lines file
+        :param since: [Optional] oldest record time
+        :param until: [Optional] newest record time
+        :param repository: [Optional] Git root of observed repository
+        :return: generator of matching records
+        """
+        since = PollJournal.to_utc(since)
+        until = PollJournal.to_utc(until)
+        with open(file, mode='r', encoding='utf-8') as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                    recorded = datetime.fromisoformat(record['time'])
+                except (ValueError, KeyError):
+                    continue
+                if since and recorded < since or until and recorded > until:
+                    continue
+                if repository and record.get('repository') != repository:
+                    continue
+                yield record
+
+    @staticmethod
+    def to_utc(value: datetime | None) -> datetime | None:
+        """
+        :param value: time stamp, naive ones are local time
+        :return: time stamp in UTC
+        """
+        return value.astimezone(timezone.utc) if value else None
+
+    @staticmethod
+    def get_percentile(values: list[float], percentile: int) -> float:
+        """
+        :param values: sorted values
+        :param percentile: percentile between 1 and 100
+        :return: nearest-rank percentile, 0 if there are no values
+        """
+        if not values:
+            return 0.0
+        return values[max(0, math.ceil(percentile / 100 * len(values)) - 1)]
+
+    @staticmethod
+    def get_percentiles(values: list[float]) -> dict[str, float]:
+        """
+        :param values: unsorted values
+        :return: configured percentiles and maximum by name, e.g. p95
+        """
+        values = sorted(values)
+        result = {f'p{percentile}': PollJournal.get_percentile(values, percentile)
+                  for percentile in PollJournal.PERCENTILES}
+        result['max'] = values[-1] if values else 0.0
+        return result
+
+    @staticmethod
+    def summarize(records: Iterator[dict]) -> dict:
+        """
+        Summarizes the latency of iterations and their phases
+        :param records: records of journal
+        :return: number of iterations and errors, time range and latency percentiles in seconds
+        """
+        durations: list[float] = []
+        phases: dict[str, list[float]] = dict()
+        errors = 0
+        first = last = None
+        for record in records:
+            durations.append(record['duration_s'])
+            for phase, seconds in record.get('phases', {}).items():
+                phases.setdefault(phase, []).append(seconds)
+            errors += len(record.get('errors', []))
+            first = first or record['time']
+            last = record['time']
+        return {
+            'polls': len(durations),
+            'errors': errors,
+            'first': first,
+            'last': last,
+            'duration_s': PollJournal.get_percentiles(durations),
+            'phases': {phase: PollJournal.get_percentiles(values) for phase, values in phases.items()}
+        }
+
+    @staticmethod
+    def format_summary(summary: dict) -> str:
+        """
+        :param summary: result of summarize
+        :return: printable table of latency percentiles
+        """
+        lines = [f'{summary["polls"]} iterations from {summary["first"]} to {summary["last"]}, '
+                 f'{summary["errors"]} errors',
+                 f'{"":<10}' + ''.join(f'{name:>10}' for name in [*summary['duration_s']])]
+        for name, values in [('iteration', summary['duration_s']), *summary['phases'].items()]:
+            lines.append(f'{name:<10}' + ''.join(f'{value:>10.3f}' for value in values.values()))
+        return '\n'.join(lines)
+
+    @staticmethod
+    def build_summary_parser() -> ArgumentParser:
+        """
+        Builds the argument parser of the journal summary command line
+        :return: prepared ArgumentParser
+        """
+        parser = ArgumentParser(prog='main.py journal',
+                                description='Summarizes the latency of iterations recorded in a journal')
+        parser.add_argument('-jn', '--journal', required=True, help='JSON lines file of journal')
+        parser.add_argument('-fp', '--filepath', default=None, help='Git root the iterations observed')
+        parser.add_argument('-s', '--since', default=None, type=datetime.fromisoformat,
+                            help='Oldest iteration time (ISO 8601), local time unless an offset is given')
+        parser.add_argument('-u', '--until', default=None, type=datetime.fromisoformat,
+                            help='Newest iteration time (ISO 8601), local time unless an offset is given')
+        return parser
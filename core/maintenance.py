@@ -0,0 +1,167 @@
+import os
+import struct
+
+from core.runner import GitRunner
+
+
+class GraphStatus:
+    """
+    Acceleration structures found in the commit-graph of a repository
+    """
+    layers: int
+    """
+    Number of commit-graph files, 0 if there is no commit-graph
+    """
+    generation: bool
+    """
+    TRUE if all layers contain corrected commit dates (generation data),
+    which allow date limited traversal to stop early
+    """
+    bloom: bool
+    """
+    TRUE if all layers contain changed-path Bloom filters,
+    which allow path limited traversal to skip tree diffs
+    """
+
+    def __init__(self, layers: int = 0, generation: bool = False, bloom: bool = False):
+        self.layers = layers
+        self.generation = generation
+        self.bloom = bloom
+
+    @property
+    def present(self) -> bool:
+        return self.layers > 0
+
+    @property
+    def complete(self) -> bool:
+        """
+        TRUE if the commit-graph accelerates date and path limited logs
+        """
+        return self.present and self.generation and self.bloom
+
+    def __str__(self) -> str:
+        if not self.present:
+            return 'no commit-graph'
+        return (f'commit-graph with {self.layers} layer(s), '
+                f'generation data: {"yes" if self.generation else "no"}, '
+                f'changed-path Bloom filters: {"yes" if self.bloom else "no"}')
+
+
+class RepositoryMaintenance:
+    """
+    Detects and refreshes the commit-graph of the observed repository.
+    Date and path limited git log calls are far cheaper with generation data
+    and changed-path Bloom filters, so the observer keeps them up-to-date after fetches
+    """
+    SIGNATURE: bytes = b'CGPH'
+    HEADER: struct.Struct = struct.Struct('>4sBBBB')
+    """
+    Signature, version, hash version, number of chunks, number of base graphs
+    """
+    CHUNK: struct.Struct = struct.Struct('>4sQ')
+    """
+    Chunk table entry: chunk id and offset
+    """
+    GENERATION_CHUNKS: set[bytes] = {b'GDA2', b'GDAT'}
+    BLOOM_CHUNKS: set[bytes] = {b'BIDX', b'BDAT'}
+
+    def __init__(self, filepath: str, runner: GitRunner):
+        """
+        Instantiates a new maintenance helper
+        :param filepath: Git root of observed repository
+        :param runner: runner of git calls
+        """
+        self.filepath = filepath
+        self.runner = runner
+        self.info_dir = os.path.join(filepath, '.git', 'objects', 'info')
+
+    def get_graph_files(self) -> list[str]:
+        """
+        Determines all commit-graph files, either one single file or all layers of a split chain
+        :return: paths of commit-graph files
+        """
+        chain = os.path.join(self.info_dir, 'commit-graphs', 'commit-graph-chain')
+        if os.path.isfile(chain):
+            with open(chain, mode='r', encoding='ascii') as chain_file:
+                hashes = [line.strip() for line in chain_file if line.strip()]
+            return [os.path.join(self.info_dir, 'commit-graphs', f'graph-{graph_hash}.graph') for graph_hash in hashes]
+        single = os.path.join(self.info_dir, 'commit-graph')
+        if os.path.isfile(single):
+            return [single]
+        return []
+
+    @staticmethod
+    def read_chunk_ids(graph_file: str) -> set[bytes]:
+        """
+        Reads the chunk table of one commit-graph file
+        :param graph_file: path of commit-graph file
+        :return: ids of contained chunks, empty if file is invalid
+        """
+        with open(graph_file, mode='rb') as graph:
+            header = graph.read(RepositoryMaintenance.HEADER.size)
+            if len(header) < RepositoryMaintenance.HEADER.size:
+                return set()
+            signature, version, _, chunk_count, _ = RepositoryMaintenance.HEADER.unpack(header)
+            if signature != RepositoryMaintenance.SIGNATURE or version != 1:
+                return set()
+            table = graph.read(RepositoryMaintenance.CHUNK.size * chunk_count)
+        return {chunk_id for chunk_id, _ in RepositoryMaintenance.CHUNK.iter_unpack(table)}
+
+    def get_status(self) -> GraphStatus:
+        """
+        Inspects the commit-graph of observed repository
+        :return: GraphStatus
+        """
+        try:
+            chunks = [self.read_chunk_ids(graph_file) for graph_file in self.get_graph_files()]
+        except OSError:
+            return GraphStatus()
+        if len(chunks) == 0 or not all(chunks):
+            return GraphStatus()
+        generation = all(layer & self.GENERATION_CHUNKS for layer in chunks)
+        bloom = all(self.BLOOM_CHUNKS <= layer for layer in chunks)
+        return GraphStatus(len(chunks), generation, bloom)
+
+    def get_write_cmd(self) -> list[str]:
+        """
+        Builds the command writing new commits into a split commit-graph,
+        which only adds a small layer instead of rewriting the whole graph
+        :return: argument list to be used when calling external git executable
+        """
+        return [
+            'git',
+            f'--git-dir={self.filepath}/.git/',
+            'commit-graph',
+            'write',
+            '--reachable',
+            '--changed-paths',
+            '--split'
+        ]
+
+    def write_graph(self) -> bool:
+        """
+        Writes the commit-graph at low priority
+        :return: TRUE on success
+        """
+        return self.runner.run(self.get_write_cmd(), capture=False, low_priority=True).ok
+
+    def measure(self, cmd: list[str]) -> float:
+        """
+        Measures the wall time of one git call
+        :param cmd: argument list of git call
+        :return: duration in seconds
+        """
+        return self.runner.run(cmd, capture=False).duration
+
+    def measure_speedup(self, log_cmd: list[str]) -> float:
+        """
+        Compares a git log call with and without using the commit-graph
+        :param log_cmd: argument list of git log call, starting with the git executable
+        :return: factor the commit-graph speeds up given call
+        """
+        without_graph = [log_cmd[0], '-c', 'core.commitGraph=false', *log_cmd[1:]]
+        # Warm up caches first, otherwise the call measured first pays for reading objects from disk
+        self.measure(log_cmd)
+        duration_without = self.measure(without_graph)
+        duration_with = self.measure(log_cmd)
+        return duration_without / max(duration_with, 1e-6)
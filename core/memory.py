@@ -0,0 +1,115 @@
+import logging
+import tracemalloc
+from typing import Any, Callable
+
+from core.event import Event
+
+
+class MemoryEvent(Event):
+    """
+    Event like object to request the eviction of the oldest observations,
+    contributing the share of them to evict
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.eventhandler: list[Callable[[float], None]] = []
+
+    def __call__(self, eventargs: Any = None):
+        super().__call__(eventargs)
+
+
+class MemoryAccountant:
+    """
+    Accounts the memory of a long running observation by tracemalloc.
+    Periodic snapshots are compared against the previous one and the sites that grew most are logged.
+    When a budget is configured and the traced memory exceeds it, a share of the oldest observations
+    is requested to be evicted, enough to get below LOW_WATER of the budget
+    """
+    LOW_WATER: float = 0.8
+    """
+    Share of the budget memory is reduced to by an eviction, so it is not triggered again by the next iteration
+    """
+    MIN_SHARE: float = 0.1
+    """
+    Minimum share of observations evicted at once
+    """
+
+    def __init__(self, logger: logging.Logger, budget_mb: float = 0, interval: int = 10, top: int = 10):
+        """
+        Instantiates a new accountant, which needs to be started
+        :param logger: logger receiving the growth reports
+        :param budget_mb: [Optional] budget of traced memory in MiB, 0 means unlimited
+        :param interval: [Optional] number of iterations between two snapshots, 0 disables snapshots
+        :param top: [Optional] number of growth sites reported
+        """
+        self.logger = logger
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.interval = interval
+        self.top = top
+        self.polls = 0
+        self.evictions = 0
+        self.snapshot: tracemalloc.Snapshot | None = None
+
+    def start(self):
+        """
+        Starts tracing allocations, unless already traced, e.g. by PYTHONTRACEMALLOC
+        :return: None
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @staticmethod
+    def get_usage() -> int:
+        """
+        :return: bytes currently allocated by Python since tracing started
+        """
+        return tracemalloc.get_traced_memory()[0]
+
+    def take_snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            tracemalloc.Filter(False, '<unknown>')
+        ])
+
+    def report_growth(self):
+        """
+        Takes a snapshot and logs the sites that allocated most since the previous one
+        :return: None
+        """
+        snapshot = self.take_snapshot()
+        if self.snapshot is not None:
+            growth = [stat for stat in snapshot.compare_to(self.snapshot, 'lineno') if stat.size_diff > 0]
+            self.logger.info(f'Memory: {self.get_usage() / 1024:.0f} KiB traced, '
+                             f'top growth since {self.interval} iteration(s):')
+            for stat in growth[:self.top]:
+                frame = stat.traceback[0]
+                self.logger.info(f'Memory: {stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+d} blocks) '
+                                 f'{frame.filename}:{frame.lineno}')
+        self.snapshot = snapshot
+
+    def account(self) -> float:
+        """
+        Accounts a finished iteration, reporting growth every interval
+        :return: share of oldest observations to evict, 0 if within budget
+        """
+        self.polls += 1
+        if self.interval > 0 and self.polls % self.interval == 0:
+            self.report_growth()
+        if self.budget <= 0:
+            return 0.0
+        usage = self.get_usage()
+        if usage <= self.budget:
+            return 0.0
+        self.evictions += 1
+        share = min(1.0, max(self.MIN_SHARE, 1 - self.budget * self.LOW_WATER / usage))
+        self.logger.warning(f'Memory: {usage / 1024 / 1024:.1f} MiB traced exceeds budget of '
+                            f'{self.budget / 1024 / 1024:.1f} MiB, evicting {share:.0%} of oldest observations')
+        return share
+
+    def __str__(self) -> str:
+        snapshots = f'every {self.interval} iteration(s)' if self.interval > 0 else 'disabled'
+        budget = f'{self.budget / 1024 / 1024:g} MiB' if self.budget > 0 else 'unlimited'
+        return f'tracemalloc snapshots {snapshots}, budget {budget}'
@@ -0,0 +1,255 @@
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from core.event import Event
+from core.logger import Logger
+from core.runner import CommandMetrics
+
+
+class Histogram:
+    """
+    Cumulative distribution of observed durations, like a Prometheus histogram
+    """
+    BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+    """
+    Upper bounds in seconds
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def get_cumulative(self) -> Iterator[tuple[str, int]]:
+        """
+        :return: generator of upper bound and number of observations less or equal to it, ending with +Inf
+        """
+        total = 0
+        for bound, count in zip([*map(repr, self.buckets), '+Inf'], self.counts):
+            total += count
+            yield bound, total
+
+
+class PollMetrics:
+    """
+    Timings and counters of one observer iteration
+    """
+    PHASES: tuple[str, ...] = ('fetch', 'log', 'parse', 'filter', 'dispatch')
+    """
+    Phases of an iteration. Log is the time spent waiting for and reading git log output,
+    parsing the time spent converting its lines to commits
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.duration = 0.0
+        self.phases: dict[str, float] = dict.fromkeys(self.PHASES, 0.0)
+        self.folders: dict[str, float] = dict()
+        """
+        Git log duration by observed folder
+        """
+        self.commits_seen = 0
+        """
+        Commits returned by git log
+        """
+        self.commits_new = 0
+        """
+        Commits not known before
+        """
+        self.commits_ignored = 0
+        """
+        New commits rejected by filter
+        """
+        self.git_processes = 0
+        self.bytes_read = 0
+        self.commands: dict[str, CommandMetrics] = dict()
+        """
+        Statistics of the git calls of this iteration by command
+        """
+        self.errors: list[str] = []
+        """
+        Errors of this iteration besides failed git calls, e.g. a stall
+        """
+        self.fingerprint = ''
+        """
+        Hash of all refs after fetch, it changes whenever a ref got updated
+        """
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] += seconds
+
+    @contextmanager
+    def measure(self, phase: str):
+        """
+        Adds the duration of the enclosed block to given phase
+        :param phase: name of phase
+        :return: context manager
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def count_commands(self, before: dict[str, CommandMetrics], after: dict[str, CommandMetrics]):
+        """
+        Determines the git calls of this iteration
+        :param before: metrics of runner when iteration started
+        :param after: metrics of runner when iteration finished
+        :return: None
+        """
+        commands = {command: metrics.since(before.get(command)) for command, metrics in after.items()}
+        self.commands = {command: metrics for command, metrics in commands.items() if metrics.calls > 0}
+        self.git_processes = sum(metrics.calls for metrics in self.commands.values())
+
+    def get_errors(self) -> list[str]:
+        """
+        :return: errors of this iteration, including failed git calls
+        """
+        failed = [f'git {command}: {metrics.failures} failed, last: {metrics.last_error}'
+                  for command, metrics in self.commands.items() if metrics.failures > 0]
+        return self.errors + failed
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.start
+
+
+class MetricsEvent(Event):
+    """
+    Event like object to contribute the metrics of a finished iteration
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.eventhandler: list[Callable[[PollMetrics], None]] = []
+
+    def __call__(self, eventargs: Any = None):
+        super().__call__(eventargs)
+
+
+class ObserverMetrics:
+    """
+    Aggregates the metrics of all iterations of an observer into histograms and counters,
+    which are exported as Prometheus textfile, e.g. for the textfile collector of node exporter
+    """
+    PREFIX: str = 'git_observer'
+
+    def __init__(self, repository: str, textfile: str = ''):
+        """
+        Instantiates new metrics
+        :param repository: Git root of observed repository, exported as label
+        :param textfile: [Optional] file rewritten after each iteration, empty disables the export
+        """
+        self.logger = Logger(__name__).log_init
+        self.repository = repository
+        self.textfile = textfile
+        self.polls = 0
+        self.last_poll = 0.0
+        self.poll_duration = Histogram()
+        self.phase_duration = {phase: Histogram() for phase in PollMetrics.PHASES}
+        self.folder_duration: dict[str, Histogram] = dict()
+        self.counters: dict[str, int] = dict.fromkeys(['seen', 'new', 'ignored'], 0)
+        self.git_processes = 0
+        self.bytes_read = 0
+
+    def record(self, poll: PollMetrics):
+        """
+        Adds a finished iteration and rewrites the textfile
+        :param poll: metrics of iteration
+        :return: None
+        """
+        self.polls += 1
+        self.last_poll = time.time()
+        self.poll_duration.observe(poll.duration)
+        for phase, seconds in poll.phases.items():
+            self.phase_duration[phase].observe(seconds)
+        for folder, seconds in poll.folders.items():
+            self.folder_duration.setdefault(folder, Histogram()).observe(seconds)
+        self.counters['seen'] += poll.commits_seen
+        self.counters['new'] += poll.commits_new
+        self.counters['ignored'] += poll.commits_ignored
+        self.git_processes += poll.git_processes
+        self.bytes_read += poll.bytes_read
+        if self.textfile:
+            self.write_textfile()
+
+    @staticmethod
+    def escape(value: str) -> str:
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def format_labels(self, **labels: str) -> str:
+        pairs = [('repository', self.repository), *labels.items()]
+        return ','.join(f'{name}="{self.escape(value)}"' for name, value in pairs)
+
+    def format_histogram(self, name: str, help_text: str, histograms: dict[str, Histogram], label: str = '') -> list[str]:
+        """
+        Formats histograms of one metric
+        :param name: metric name without prefix
+        :param help_text: description of metric
+        :param histograms: histograms by label value
+        :param label: [Optional] name of label distinguishing the histograms
+        :return: lines of exposition format
+        """
+        metric = f'{self.PREFIX}_{name}'
+        lines = [f'# HELP {metric} {help_text}', f'# TYPE {metric} histogram']
+        for value, histogram in histograms.items():
+            labels = {label: value} if label else {}
+            for bound, count in histogram.get_cumulative():
+                lines.append(f'{metric}_bucket{{{self.format_labels(**labels, le=bound)}}} {count}')
+            lines.append(f'{metric}_sum{{{self.format_labels(**labels)}}} {histogram.sum:.6f}')
+            lines.append(f'{metric}_count{{{self.format_labels(**labels)}}} {histogram.count}')
+        return lines
+
+    def format_counter(self, name: str, help_text: str, values: dict[str, int], label: str = '',
+                       metric_type: str = 'counter') -> list[str]:
+        metric = f'{self.PREFIX}_{name}'
+        lines = [f'# HELP {metric} {help_text}', f'# TYPE {metric} {metric_type}']
+        for value, count in values.items():
+            labels = {label: value} if label else {}
+            lines.append(f'{metric}{{{self.format_labels(**labels)}}} {count}')
+        return lines
+
+    def format(self) -> str:
+        """
+        :return: all metrics in Prometheus text exposition format
+        """
+        lines = [
+            *self.format_histogram('poll_duration_seconds', 'Duration of one iteration', {'': self.poll_duration}),
+            *self.format_histogram('phase_duration_seconds', 'Duration of one phase of an iteration',
+                                   self.phase_duration, 'phase'),
+            *self.format_histogram('folder_log_duration_seconds', 'Duration of git log of one observed folder',
+                                   self.folder_duration, 'folder'),
+            *self.format_counter('polls_total', 'Finished iterations', {'': self.polls}),
+            *self.format_counter('commits_total', 'Commits returned by git log (seen), not known before (new) '
+                                 'and new ones rejected by filter (ignored)', self.counters, 'state'),
+            *self.format_counter('git_processes_total', 'Finished git processes', {'': self.git_processes}),
+            *self.format_counter('log_bytes_total', 'Bytes of git log output read', {'': self.bytes_read}),
+            *self.format_counter('last_poll_timestamp_seconds', 'Time the last iteration finished',
+                                 {'': round(self.last_poll, 3)}, metric_type='gauge')
+        ]
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self):
+        """
+        Rewrites the textfile atomically, so a collector never reads a partially written file.
+        A file that can not be written is reported, but does not stop the observation
+        :return: None
+        """
+        temp_file = f'{self.textfile}.{os.getpid()}.tmp'
+        try:
+            with open(temp_file, mode='w', encoding='utf-8') as textfile:
+                textfile.write(self.format())
+            os.replace(temp_file, self.textfile)
+        except OSError as error:
+            self.logger.warning(f'Writing metrics to "{self.textfile}" failed: {error}')
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
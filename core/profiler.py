@@ -0,0 +1,149 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+from collections import Counter
+from threading import Event as ThreadEvent, Thread, enumerate as enumerate_threads, get_ident
+from types import FrameType
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of all threads of the process by sys._current_frames, except its own.
+    Unlike cProfile it sees background threads as well and barely slows down the profiled code
+    """
+    INTERVAL: float = 0.005
+    """
+    Seconds between two samples
+    """
+
+    def __init__(self, interval: float = INTERVAL):
+        """
+        Instantiates a new profiler, which needs to be started
+        :param interval: [Optional] seconds between two samples
+        """
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        """
+        Number of samples by collapsed stack, root frame first
+        """
+        self.functions: Counter[str] = Counter()
+        """
+        Number of samples a function was running in itself, not in a callee
+        """
+        self.samples = 0
+        self.__stop = ThreadEvent()
+        self.__thread = Thread(target=self.__run, name='SamplingProfiler', daemon=True)
+
+    @staticmethod
+    def get_name(frame: FrameType) -> str:
+        code = frame.f_code
+        return f'{os.path.basename(code.co_filename)}:{code.co_name}'
+
+    def sample(self):
+        """
+        Adds the current stack of each thread
+        :return: None
+        """
+        own_ident = get_ident()
+        names = {thread.ident: thread.name for thread in enumerate_threads()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_ident:
+                continue
+            self.functions[self.get_name(frame)] += 1
+            stack = []
+            while frame is not None:
+                stack.append(self.get_name(frame))
+                frame = frame.f_back
+            stack.append(names.get(thread_id, str(thread_id)))
+            self.stacks[';'.join(reversed(stack))] += 1
+        self.samples += 1
+
+    def __run(self):
+        while not self.__stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        self.__thread.start()
+
+    def stop(self):
+        self.__stop.set()
+        self.__thread.join()
+
+    def write_collapsed(self, file: str):
+        """
+        Writes the samples in collapsed stack format, one stack and its count per line,
+        as read by flamegraph.pl, speedscope or inferno
+        :param file: output file
+        :return: None
+        """
+        with open(file, mode='w', encoding='utf-8') as collapsed:
+            for stack, count in sorted(self.stacks.items()):
+                collapsed.write(f'{stack} {count}\n')
+
+    def format_top(self, count: int) -> str:
+        """
+        :param count: number of functions
+        :return: table of functions most samples were running in
+        """
+        lines = [f'{"samples":>8} {"share":>7}  function']
+        for function, samples in self.functions.most_common(count):
+            lines.append(f'{samples:>8} {samples / max(1, self.samples):>7.1%}  {function}')
+        return '\n'.join(lines)
+
+
+class ObserverProfiler:
+    """
+    Profiles iterations of the observer by cProfile of the calling thread and a SamplingProfiler
+    of all threads. Writes <output>.pstats for pstats or snakeviz and <output>.collapsed for flamegraphs
+    """
+
+    def __init__(self, output: str, deterministic: bool = True):
+        """
+        Instantiates a new profiler
+        :param output: path of output files without extension
+        :param deterministic: [Optional] flag to run cProfile besides sampling, FALSE profiles with less overhead
+        """
+        self.output = output
+        self.sampler = SamplingProfiler()
+        self.profile = cProfile.Profile() if deterministic else None
+
+    def __enter__(self) -> 'ObserverProfiler':
+        self.sampler.start()
+        if self.profile:
+            self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.profile:
+            self.profile.disable()
+        self.sampler.stop()
+        return False
+
+    def save(self) -> list[str]:
+        """
+        Writes the output files, creating their folder if needed
+        :return: written files
+        """
+        folder = os.path.dirname(self.output)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        files = [f'{self.output}.collapsed']
+        self.sampler.write_collapsed(files[0])
+        if self.profile:
+            files.append(f'{self.output}.pstats')
+            self.profile.dump_stats(files[1])
+        return files
+
+    def format_top(self, count: int = 20) -> str:
+        """
+        :param count: [Optional] number of functions
+        :return: hot functions by own time of cProfile, or by samples if it did not run
+        """
+        if not self.profile:
+            return self.sampler.format_top(count)
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.strip_dirs().sort_stats(pstats.SortKey.TIME).print_stats(count)
+        return stream.getvalue().strip()
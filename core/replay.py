@@ -0,0 +1,433 @@
+import hashlib
+import io
+import json
+import mmap
+import os
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import IO, Iterator
+from urllib.parse import quote
+
+from core.governor import ResourceGovernor
+from core.runner import CancelToken, FinishedProcess, GitRunner, RunResult
+
+
+class FixtureSet:
+    """
+    Directory of recorded git outputs. Each call is stored as file named by its command
+    and argument, e.g. log/core.out or show/<sha1>.out, along with its duration in timings.json.
+    Calls without own fixture fall back to the file of their command, e.g. log.out.
+    Log calls not limited to a folder, like the listing of excluded commits, are named by a digest of their
+    arguments instead, e.g. log@<digest>.out, so their output never serves as log of a folder
+    """
+    TIMINGS: str = 'timings.json'
+
+    def __init__(self, directory: str = '', log_file: str = None):
+        """
+        Instantiates a new fixture set
+        :param directory: [Optional] fixture directory
+        :param log_file: [Optional] file served for every git log call, e.g. the unittest dummy
+        """
+        self.directory = directory
+        self.log_file = log_file
+        self.timings: dict[str, float] = dict()
+        self.__lock = Lock()
+        timings_file = os.path.join(directory, self.TIMINGS)
+        if directory and os.path.isfile(timings_file):
+            with open(timings_file, mode='r', encoding='utf-8') as timings:
+                self.timings = json.load(timings)
+
+    @staticmethod
+    def get_folder(cmd: list[str]) -> str | None:
+        """
+        Determines the observed folder of a git log call, which is its last argument below the work tree
+        :param cmd: argument list starting with git executable
+        :return: relative folder, None if call is not limited to a folder
+        """
+        work_tree = next((arg.split('=', 1)[1] for arg in cmd if arg.startswith('--work-tree=')), None)
+        if not work_tree or not cmd[-1].startswith(f'{work_tree}/'):
+            return None
+        return cmd[-1][len(work_tree) + 1:]
+
+    @staticmethod
+    def get_key(cmd: list[str]) -> str:
+        """
+        Names the fixture of a git call
+        :param cmd: argument list starting with git executable
+        :return: command and argument, e.g. log/core
+        """
+        command = GitRunner.get_command(cmd)
+        if command == 'log':
+            folder = FixtureSet.get_folder(cmd)
+            if folder:
+                return f'log/{folder}'
+            # Repository paths are left out, so fixtures can be replayed from another location
+            args = [arg for arg in cmd[1:] if not arg.startswith(('--git-dir=', '--work-tree='))]
+            return f'log@{hashlib.sha1(chr(0).join(args).encode("utf-8")).hexdigest()[:12]}'
+        if command == 'show':
+            return f'show/{cmd[-1]}'
+        return command
+
+    @staticmethod
+    def get_keys(cmd: list[str]) -> list[str]:
+        """
+        Names the fixtures able to serve a git call, its own first and then the one of its command.
+        Log calls not limited to a folder are served by their own only
+        :param cmd: argument list starting with git executable
+        :return: fixture keys in order of preference
+        """
+        key = FixtureSet.get_key(cmd)
+        if key.startswith('log@'):
+            return [key]
+        return [key, GitRunner.get_command(cmd)]
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{quote(key, safe="/@")}.out')
+
+    def find(self, cmd: list[str]) -> str | None:
+        """
+        :param cmd: argument list starting with git executable
+        :return: path of fixture serving given call, None if there is none
+        """
+        if self.log_file and GitRunner.get_command(cmd) == 'log':
+            return self.log_file
+        if not self.directory:
+            return None
+        for key in self.get_keys(cmd):
+            path = self.get_path(key)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def open(self, cmd: list[str]) -> IO:
+        """
+        Memory maps the fixture of a call, so large fixtures are paged in while being read
+        :param cmd: argument list starting with git executable
+        :return: byte stream, empty if there is no fixture
+        """
+        path = self.find(cmd)
+        if not path or os.path.getsize(path) == 0:
+            return io.BytesIO()
+        with open(path, mode='rb') as fixture:
+            return mmap.mmap(fixture.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, cmd: list[str]) -> bytes:
+        with self.open(cmd) as stream:
+            return stream.read()
+
+    def get_duration(self, cmd: list[str]) -> float:
+        """
+        :param cmd: argument list starting with git executable
+        :return: recorded duration of call in seconds, 0 if unknown
+        """
+        return next((self.timings[key] for key in self.get_keys(cmd) if key in self.timings), 0.0)
+
+    def write(self, cmd: list[str], output: bytes, duration: float):
+        """
+        Records the output and duration of a call
+        :param cmd: argument list starting with git executable
+        :param output: stdout of call
+        :param duration: wall time in seconds
+        :return: None
+        """
+        key = self.get_key(cmd)
+        path = self.get_path(key)
+        with self.__lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, mode='wb') as fixture:
+                fixture.write(output)
+            self.timings[key] = round(duration, 6)
+            with open(os.path.join(self.directory, self.TIMINGS), mode='w', encoding='utf-8') as timings:
+                json.dump(self.timings, timings, indent=1, sort_keys=True)
+
+
+class LineStream:
+    """
+    Byte stream reading lines from a generator, so synthetic logs are never held in memory completely
+    """
+
+    def __init__(self, lines: Iterator[bytes]):
+        self.lines = lines
+
+    def readline(self) -> bytes:
+        return next(self.lines, b'')
+
+    def read(self) -> bytes:
+        return b''.join(self.lines)
+
+    def close(self):
+        self.lines = iter(())
+
+    def __enter__(self) -> 'LineStream':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class SyntheticRepository:
+    """
+    Generates git outputs of an arbitrarily large repository on the fly.
+    Commits are spread evenly across folders and dates, any observed folder is mapped to one of them.
+    Output only depends on the parameters, so runs are reproducible
+    """
+    FETCH_DURATION: float = 0.5
+    SHOW_DURATION: float = 0.01
+    LOG_DURATION_PER_COMMIT: float = 2e-6
+    """
+    Simulated seconds git log spends per emitted commit
+    """
+
+    def __init__(self, commits: int = 1000000, folders: int = 1000, authors: int = 50, span_h: int = 168,
+                 seed: int = 0, end: datetime = None):
+        """
+        Instantiates a new synthetic repository
+        :param commits: [Optional] total number of commits
+        :param folders: [Optional] number of folders commits are spread across
+        :param authors: [Optional] number of distinct committers
+        :param span_h: [Optional] hours between oldest and newest commit
+        :param seed: [Optional] seed making commit ids differ between repositories
+        :param end: [Optional] date of newest commit, DEFAULT: current hour
+        """
+        self.commits = max(1, commits)
+        self.folders = max(1, folders)
+        self.authors = max(1, authors)
+        self.seed = seed
+        self.end = end or datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        self.spacing = timedelta(hours=span_h) / self.commits
+
+    def get_folder_index(self, folder: str) -> int:
+        """
+        Maps an observed folder to a synthetic one. Folders named folder<N> map to index N,
+        so a load test can observe distinct folders, others are hashed
+        :param folder: observed folder
+        :return: folder index
+        """
+        name = folder.rsplit('/', 1)[-1]
+        if name.startswith('folder') and name[len('folder'):].isdigit():
+            return int(name[len('folder'):]) % self.folders
+        return zlib.crc32(folder.encode('utf-8')) % self.folders
+
+    def get_count(self, index: int) -> int:
+        """
+        :param index: folder index
+        :return: number of commits in folder
+        """
+        return self.commits // self.folders + int(index < self.commits % self.folders)
+
+    def get_sha1(self, number: int) -> str:
+        """
+        Derives a commit id, whose first 8 digits encode the commit number, so git show can be answered
+        :param number: global commit number, 0 is the newest commit
+        :return: 40 digit hexadecimal id
+        """
+        digest = hashlib.sha1(f'{self.seed}:{number}'.encode('ascii')).hexdigest()
+        return f'{number:08x}{digest[8:]}'
+
+    def get_author(self, number: int) -> str:
+        return f'author.{zlib.crc32(number.to_bytes(8, "little")) % self.authors:03d}'
+
+    def format_commit(self, number: int, folder: str) -> bytes:
+        """
+        Formats one commit like the git log format of the observer
+        :param number: global commit number
+        :param folder: observed folder
+        :return: line of git log output
+        """
+        date = (self.end - self.spacing * number).isoformat(timespec='seconds')
+        author = self.get_author(number)
+        refs = 'origin/main' if number < self.folders else ''
+        return f'"{author}|{date}|Change {number} in {folder}|{self.get_sha1(number)}|{refs}"\n'.encode('utf-8')
+
+    def iter_log(self, folder: str, reverse: bool) -> Iterator[bytes]:
+        """
+        :param folder: observed folder
+        :param reverse: flag to emit oldest commit first
+        :return: generator of git log lines, newest first by default
+        """
+        index = self.get_folder_index(folder)
+        positions = range(self.get_count(index))
+        for position in reversed(positions) if reverse else positions:
+            yield self.format_commit(index + position * self.folders, folder)
+
+    def format_show(self, sha1: str) -> bytes:
+        """
+        :param sha1: commit id generated by this repository
+        :return: git show --pretty=fuller output, empty if id is unknown
+        """
+        try:
+            number = int(sha1[:8], 16)
+        except ValueError:
+            return b''
+        if number >= self.commits or self.get_sha1(number) != sha1:
+            return b''
+        date = (self.end - self.spacing * number).isoformat(timespec='seconds')
+        author = self.get_author(number)
+        return (f'commit {sha1}\nAuthor:     {author} <{author}@example.com>\nAuthorDate: {date}\n'
+                f'Commit:     {author} <{author}@example.com>\nCommitDate: {date}\n\n'
+                f'    Change {number}\n').encode('utf-8')
+
+    def open(self, cmd: list[str]) -> IO:
+        command = GitRunner.get_command(cmd)
+        if command == 'log':
+            folder = FixtureSet.get_folder(cmd)
+            if folder is not None:
+                return LineStream(self.iter_log(folder, '--reverse' in cmd))
+        if command == 'show':
+            return io.BytesIO(self.format_show(cmd[-1]))
+        return io.BytesIO()
+
+    def read(self, cmd: list[str]) -> bytes:
+        with self.open(cmd) as stream:
+            return stream.read()
+
+    def get_duration(self, cmd: list[str]) -> float:
+        command = GitRunner.get_command(cmd)
+        if command == 'fetch':
+            return self.FETCH_DURATION
+        if command == 'show':
+            return self.SHOW_DURATION
+        folder = FixtureSet.get_folder(cmd) if command == 'log' else None
+        if folder is None:
+            return 0.0
+        return self.get_count(self.get_folder_index(folder)) * self.LOG_DURATION_PER_COMMIT
+
+    @staticmethod
+    def parse(spec: str) -> 'SyntheticRepository':
+        """
+        Creates a synthetic repository from a comma separated parameter list
+        :param spec: e.g. "commits=2000000,folders=5000,seed=1"
+        :return: SyntheticRepository
+        """
+        params = dict()
+        for param in filter(None, (part.strip() for part in spec.split(','))):
+            name, separator, value = param.partition('=')
+            if not separator:
+                raise ValueError(f'Expected synthetic parameter formatted as "name=value", got "{param}"')
+            params[name.strip()] = int(value)
+        return SyntheticRepository(**params)
+
+
+class ReplayProcess:
+    """
+    Streaming replayed call, context manager like GitProcess
+    """
+
+    def __init__(self, runner: 'ReplayRunner', cmd: list[str]):
+        self.runner = runner
+        self.cmd = cmd
+        self.stream: IO | None = None
+        self.start = 0.0
+        self.result: RunResult | None = None
+
+    def __enter__(self) -> IO:
+        if not self.runner.acquire():
+            self.result = RunResult.stopped()
+            return io.BytesIO()
+        self.start = time.perf_counter()
+        try:
+            self.runner.simulate(self.cmd)
+            self.stream = self.runner.source.open(self.cmd)
+        except Exception:
+            self.runner.release()
+            raise
+        return self.stream
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self.stream:
+            return False
+        self.stream.close()
+        self.runner.release()
+        self.result = RunResult(0, duration=time.perf_counter() - self.start)
+        self.runner.record(self.cmd, self.result)
+        return False
+
+
+class ReplayRunner(GitRunner):
+    """
+    Runner serving recorded or synthetic outputs instead of calling git,
+    which allows load testing parsing, filtering and viewer without a real repository.
+    Concurrency limit and metrics apply like to real calls
+    """
+    replay = True
+
+    def __init__(self, source: FixtureSet | SyntheticRepository, governor: ResourceGovernor = None,
+                 latency: float = 0.0):
+        """
+        Instantiates a new replay runner
+        :param source: fixtures or synthetic repository outputs are served from
+        :param governor: [Optional] governor shared with other runners
+        :param latency: [Optional] factor applied to durations of calls, 0 answers immediately
+        """
+        super().__init__(governor)
+        self.source = source
+        self.latency = latency
+
+    @staticmethod
+    def create_source(spec: str) -> FixtureSet | SyntheticRepository:
+        """
+        Creates the source of a replay runner
+        :param spec: fixture directory, or "synthetic:" followed by parameters of SyntheticRepository
+        :return: FixtureSet or SyntheticRepository
+        """
+        if spec.startswith('synthetic:'):
+            return SyntheticRepository.parse(spec[len('synthetic:'):])
+        if not os.path.isdir(spec):
+            raise ValueError(f'Replay fixture directory "{spec}" does not exist')
+        return FixtureSet(spec)
+
+    def simulate(self, cmd: list[str]):
+        """
+        Waits the duration of a call, scaled by latency factor
+        :param cmd: argument list starting with git executable
+        :return: None
+        """
+        if self.latency > 0:
+            time.sleep(self.source.get_duration(cmd) * self.latency)
+
+    def run(self, cmd: list[str], capture: bool = True, low_priority: bool = False, urgent: bool = False,
+            token: CancelToken = None) -> RunResult:
+        if not self.acquire(urgent):
+            return RunResult.stopped()
+        start = time.perf_counter()
+        try:
+            self.simulate(cmd)
+            stdout = self.source.read(cmd) if capture else b''
+        finally:
+            self.release()
+        result = RunResult(0, stdout, duration=time.perf_counter() - start)
+        self.record(cmd, result)
+        return result
+
+    def stream(self, cmd: list[str]) -> ReplayProcess:
+        return ReplayProcess(self, cmd)
+
+
+class RecordingRunner(GitRunner):
+    """
+    Runner recording the outputs and durations of real git calls as fixtures for replay.
+    Streamed calls are read completely before they are handed to the caller
+    """
+
+    def __init__(self, fixtures: FixtureSet, governor: ResourceGovernor = None, timeout: float = 0):
+        """
+        Instantiates a new recording runner
+        :param fixtures: fixture set receiving the outputs
+        :param governor: [Optional] governor shared with other runners
+        :param timeout: [Optional] timeout in seconds of every call, 0 uses default timeout of command
+        """
+        super().__init__(governor, timeout)
+        self.fixtures = fixtures
+
+    def run(self, cmd: list[str], capture: bool = True, low_priority: bool = False, urgent: bool = False,
+            token: CancelToken = None) -> RunResult:
+        result = super().run(cmd, capture, low_priority, urgent, token)
+        if result.ok:
+            self.fixtures.write(cmd, result.stdout, result.duration)
+        return result
+
+    def stream(self, cmd: list[str]) -> FinishedProcess:
+        return FinishedProcess(self.run(cmd))
@@ -0,0 +1,441 @@
+import copy
+import io
+import os
+import subprocess
+import tempfile
+import time
+from threading import Event as ThreadEvent, Lock, Timer, get_ident
+from typing import IO
+
+from core.governor import ResourceGovernor
+from core.logger import Logger
+
+
+class RunResult:
+    """
+    Outcome of one finished git call
+    """
+    returncode: int
+    stdout: bytes
+    stderr: str
+    duration: float
+    """
+    Wall time in seconds from starting git to its end, waiting for a free slot is not included
+    """
+    timed_out: bool
+
+    def __init__(self, returncode: int, stdout: bytes = b'', stderr: str = '',
+                 duration: float = 0.0, timed_out: bool = False):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.duration = duration
+        self.timed_out = timed_out
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+    @staticmethod
+    def stopped() -> 'RunResult':
+        """
+        :return: result of a call refused by a stopped runner
+        """
+        return RunResult(-1, stderr='Git runner is stopped')
+
+
+class CommandMetrics:
+    """
+    Timing statistics of one git command (e.g. log, fetch)
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last_error = ''
+
+    def add(self, duration: float, failed: bool, timed_out: bool, error: str = ''):
+        """
+        Records one call
+        :param duration: wall time in seconds
+        :param failed: flag if call did not succeed
+        :param timed_out: flag if call got killed by timeout
+        :param error: [Optional] error message of a failed call
+        :return: None
+        """
+        self.calls += 1
+        self.failures += int(failed)
+        self.timeouts += int(timed_out)
+        self.total += duration
+        self.max = max(self.max, duration)
+        if failed:
+            self.last_error = error
+
+    def since(self, previous: 'CommandMetrics | None') -> 'CommandMetrics':
+        """
+        Determines the statistics of calls recorded after a previous state, e.g. within one iteration.
+        Their maximum duration is unknown and kept at 0
+        :param previous: copy of this metrics taken before, None if there were no calls
+        :return: CommandMetrics of recent calls
+        """
+        recent = CommandMetrics()
+        if previous is None:
+            previous = recent
+        recent.calls = self.calls - previous.calls
+        recent.failures = self.failures - previous.failures
+        recent.timeouts = self.timeouts - previous.timeouts
+        recent.total = self.total - previous.total
+        recent.last_error = self.last_error if recent.failures > 0 else ''
+        return recent
+
+    def __str__(self) -> str:
+        average = self.total / self.calls if self.calls else 0.0
+        return (f'{self.calls} calls, avg {average * 1000:.0f} ms, max {self.max * 1000:.0f} ms, '
+                f'{self.failures} failed, {self.timeouts} timed out')
+
+
+class CancelToken:
+    """
+    Allows a caller to kill the git process of one specific call, e.g. when its result is not needed anymore
+    """
+
+    def __init__(self):
+        self.cancelled = False
+        self.process: subprocess.Popen | None = None
+        self.__lock = Lock()
+
+    def attach(self, process: subprocess.Popen) -> bool:
+        """
+        Binds the process of a started call
+        :param process: started git process
+        :return: FALSE if the token was cancelled before
+        """
+        with self.__lock:
+            self.process = process
+            return not self.cancelled
+
+    def cancel(self):
+        """
+        Kills the bound process, or prevents it from starting
+        :return: None
+        """
+        with self.__lock:
+            self.cancelled = True
+            if self.process and self.process.poll() is None:
+                self.process.kill()
+
+
+class GitProcess:
+    """
+    Streaming git call. Used as context manager yielding the stdout stream,
+    which guarantees the process to be reaped, its slot to be released and its duration to be recorded.
+    Its result is available after the context was left, a failed or killed call may have streamed truncated output
+    """
+
+    def __init__(self, runner: 'GitRunner', cmd: list[str], timeout: float):
+        self.runner = runner
+        self.cmd = cmd
+        self.timeout = timeout
+        self.process: subprocess.Popen | None = None
+        self.stderr: IO | None = None
+        self.timer: Timer | None = None
+        self.timed_out = False
+        self.start = 0.0
+        self.result: RunResult | None = None
+
+    def __enter__(self) -> IO:
+        if not self.runner.acquire():
+            # Stopped runner, nothing to read
+            self.result = RunResult.stopped()
+            return io.BytesIO()
+        self.start = time.perf_counter()
+        try:
+            # Temporary file instead of pipe, a full stderr pipe would block git while stdout is read
+            self.stderr = tempfile.TemporaryFile()
+            self.process = self.runner.spawn(self.cmd, stdout=subprocess.PIPE, stderr=self.stderr)
+        except Exception:
+            self.cleanup()
+            raise
+        if not self.process:
+            # Runner got stopped while waiting for the slot
+            self.cleanup()
+            self.result = RunResult.stopped()
+            return io.BytesIO()
+        self.timer = Timer(self.timeout, self.kill_on_timeout)
+        self.timer.daemon = True
+        self.timer.start()
+        return self.process.stdout
+
+    def kill_on_timeout(self):
+        """
+        Kills the process when its deadline passed
+        :return: None
+        """
+        self.timed_out = True
+        self.process.kill()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self.process:
+            return False
+        self.process.stdout.close()
+        try:
+            # Caller may stop reading early, don't let git block on a closed pipe
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.timer.cancel()
+        self.stderr.seek(0)
+        stderr = self.stderr.read().decode('utf-8', errors='replace')
+        self.result = RunResult(self.process.returncode, stderr=stderr,
+                                duration=time.perf_counter() - self.start, timed_out=self.timed_out)
+        self.cleanup()
+        self.runner.record(self.cmd, self.result)
+        return False
+
+    def cleanup(self):
+        """
+        Releases stderr file, process registration and slot
+        :return: None
+        """
+        if self.stderr:
+            self.stderr.close()
+        if self.process:
+            self.runner.unregister(self.process)
+        self.runner.release()
+
+
+class FinishedProcess:
+    """
+    Streaming interface of a call which already ran to its end, context manager like GitProcess
+    """
+
+    def __init__(self, result: RunResult):
+        self.result = result
+        self.stream = io.BytesIO(result.stdout)
+
+    def __enter__(self) -> IO:
+        return self.stream
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stream.close()
+        return False
+
+
+class GitRunner:
+    """
+    Single gateway of all git calls of an observer.
+    Applies per call timeouts, leaves concurrency, CPU budget and priority to a ResourceGovernor,
+    runs git without optional locks, so developers working in the same repository are not blocked,
+    and keeps timing metrics per git command.
+    All in-flight processes can be killed at once, e.g. when the observation stops
+    """
+    TIMEOUTS: dict[str, float] = {
+        'fetch': 300.0,
+        'log': 120.0,
+        'show': 30.0,
+        'commit-graph': 1800.0
+    }
+    """
+    Default timeout in seconds by git command
+    """
+    TIMEOUT_DEFAULT: float = 60.0
+    replay: bool = False
+    """
+    TRUE if outputs are replayed instead of calling git, so git arguments like filters are not evaluated
+    """
+
+    def __init__(self, governor: ResourceGovernor = None, timeout: float = 0):
+        """
+        Instantiates a new runner
+        :param governor: [Optional] governor shared with other runners, DEFAULT: own governor with default limits
+        :param timeout: [Optional] timeout in seconds of every call, 0 uses default timeout of command
+        """
+        self.logger = Logger(__name__).log_init
+        self.governor = governor or ResourceGovernor()
+        self.timeout = timeout
+        self.metrics: dict[str, CommandMetrics] = dict()
+        self.env = dict(os.environ)
+        self.env['GIT_OPTIONAL_LOCKS'] = '0'
+        # Observer runs unattended, a credential prompt would block forever
+        self.env['GIT_TERMINAL_PROMPT'] = '0'
+        self.__stop = ThreadEvent()
+        self.__lock = Lock()
+        # In-flight processes by identifier of the thread which started them
+        self.__processes: dict[subprocess.Popen, int] = dict()
+
+    @property
+    def stopped(self) -> bool:
+        return self.__stop.is_set()
+
+    @staticmethod
+    def get_command(cmd: list[str]) -> str:
+        """
+        Determines the git command of an argument list, skipping global options
+        :param cmd: argument list starting with git executable
+        :return: git command, e.g. log
+        """
+        skip_next = False
+        for arg in cmd[1:]:
+            if skip_next:
+                skip_next = False
+            elif arg == '-c':
+                skip_next = True
+            elif not arg.startswith('-'):
+                return arg
+        return 'git'
+
+    def get_timeout(self, cmd: list[str]) -> float:
+        """
+        :param cmd: argument list starting with git executable
+        :return: timeout of given call in seconds
+        """
+        if self.timeout > 0:
+            return self.timeout
+        return self.TIMEOUTS.get(self.get_command(cmd), self.TIMEOUT_DEFAULT)
+
+    def acquire(self, urgent: bool = False) -> bool:
+        """
+        Waits for the governor to admit a call
+        :param urgent: [Optional] flag of calls a user waits for, which skip the CPU budget
+        :return: FALSE if runner is stopped and no slot was taken
+        """
+        return self.governor.acquire(self.__stop, urgent)
+
+    def release(self):
+        self.governor.release()
+
+    def spawn(self, cmd: list[str], low_priority: bool = False, urgent: bool = False,
+              **kwargs) -> subprocess.Popen | None:
+        """
+        Starts and registers a git process at the priority given by governor
+        :param cmd: argument list starting with git executable
+        :param low_priority: flag to run the process with lowest priority
+        :param urgent: flag to run the process with normal priority, as a user waits for it
+        :param kwargs: further arguments of Popen
+        :return: started process, None if the runner got stopped after its slot was acquired
+        """
+        if not urgent:
+            cmd, priority_args = self.governor.get_popen_args(cmd, low_priority)
+            kwargs.update(priority_args)
+        with self.__lock:
+            if self.stopped:
+                return None
+            process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, env=self.env, **kwargs)
+            self.__processes[process] = get_ident()
+        return process
+
+    def unregister(self, process: subprocess.Popen):
+        with self.__lock:
+            self.__processes.pop(process, None)
+
+    def run(self, cmd: list[str], capture: bool = True, low_priority: bool = False, urgent: bool = False,
+            token: CancelToken = None) -> RunResult:
+        """
+        Runs a git call to its end. Killed by timeout, stop of runner or given token
+        :param cmd: argument list starting with git executable
+        :param capture: [Optional] flag if stdout is returned, otherwise it is discarded
+        :param low_priority: [Optional] flag to run the process with lowest priority
+        :param urgent: [Optional] flag of calls a user waits for, neither throttled nor deprioritized
+        :param token: [Optional] token allowing the caller to cancel this call
+        :return: RunResult
+        """
+        if not self.acquire(urgent):
+            return RunResult.stopped()
+        # Waits of the governor are accounted by it, the duration is the one of git
+        start = time.perf_counter()
+        process = None
+        try:
+            process = self.spawn(cmd, low_priority, urgent, stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+                                 stderr=subprocess.PIPE)
+            if not process:
+                # Runner got stopped while waiting for the slot
+                return RunResult.stopped()
+            if token and not token.attach(process):
+                process.kill()
+            timed_out = False
+            try:
+                stdout, stderr = process.communicate(timeout=self.get_timeout(cmd))
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                process.kill()
+                stdout, stderr = process.communicate()
+            result = RunResult(process.returncode, stdout or b'', stderr.decode('utf-8', errors='replace'),
+                               time.perf_counter() - start, timed_out)
+        finally:
+            if process:
+                self.unregister(process)
+            self.release()
+        self.record(cmd, result)
+        return result
+
+    def stream(self, cmd: list[str]) -> GitProcess:
+        """
+        Prepares a git call whose output is read while git still runs.
+        Needs to be used as context manager
+        :param cmd: argument list starting with git executable
+        :return: GitProcess
+        """
+        return GitProcess(self, cmd, self.get_timeout(cmd))
+
+    def record(self, cmd: list[str], result: RunResult):
+        """
+        Adds a finished call to the metrics and logs its failure
+        :param cmd: argument list starting with git executable
+        :param result: outcome of call
+        :return: None
+        """
+        command = self.get_command(cmd)
+        with self.__lock:
+            metrics = self.metrics.setdefault(command, CommandMetrics())
+            error = 'timed out' if result.timed_out else result.stderr.strip()
+            metrics.add(result.duration, not result.ok, result.timed_out, error)
+        if result.timed_out:
+            self.logger.warning(f'Git {command} killed after {result.duration:.1f} s timeout')
+        elif result.returncode != 0 and not self.stopped:
+            self.logger.warning(f'Git {command} failed ({result.returncode}): {result.stderr.strip()}')
+
+    def get_metrics(self) -> dict[str, CommandMetrics]:
+        """
+        :return: copy of current metrics by git command
+        """
+        with self.__lock:
+            return {command: copy.copy(metrics) for command, metrics in self.metrics.items()}
+
+    def kill_all(self):
+        """
+        Stops the runner: kills all in-flight processes and refuses new calls
+        :return: None
+        """
+        with self.__lock:
+            self.__stop.set()
+        self.kill_running()
+
+    def kill_running(self, thread: int = None) -> int:
+        """
+        Kills in-flight processes, e.g. when they are stuck. The runner keeps accepting new calls
+        :param thread: [Optional] identifier of the thread whose processes are killed, DEFAULT: all threads
+        :return: number of killed processes
+        """
+        with self.__lock:
+            processes = [process for process, owner in self.__processes.items() if thread is None or owner == thread]
+        killed = 0
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+                killed += 1
+        return killed
+
+    def log_metrics(self):
+        """
+        Logs the timing metrics of all git commands
+        :return: None
+        """
+        with self.__lock:
+            lines = [f'Git {command}: {metrics}' for command, metrics in sorted(self.metrics.items())]
+        lines.append(f'Git governor: {self.governor}')
+        for line in lines:
+            self.logger.info(line)
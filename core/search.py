@@ -0,0 +1,167 @@
+from typing import Iterable
+
+from core.transport import Commit
+
+
+class CommitIndex:
+    """
+    Inverted trigram index over author, message, branch and SHA1 of commits.
+    Entries are added and removed incrementally, so a search only verifies
+    candidates sharing all trigrams of the query instead of scanning every entry
+    """
+    GRAM_SIZE = 3
+
+    texts: dict[str, str]
+    """
+    Searchable (case folded) text by entry key
+    """
+
+    postings: dict[str, set[str]]
+    """
+    Entry keys by trigram
+    """
+
+    def __init__(self):
+        self.texts = dict()
+        self.postings = dict()
+        self.__last_query: list[str] = []
+        self.__last_result: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @staticmethod
+    def get_text(commits: Iterable[Commit | None]) -> str:
+        """
+        Builds the searchable text of given commits
+        :param commits: commits of one entry, None is skipped
+        :return: case folded text
+        """
+        parts = []
+        for commit in commits:
+            if not commit:
+                continue
+            parts.extend([commit.author or '', commit.message or '', commit.branch or '', commit.sha1 or ''])
+        return '\n'.join(parts).casefold()
+
+    @staticmethod
+    def get_grams(text: str) -> set[str]:
+        """
+        Splits given text into its distinct trigrams
+        :param text: text to split
+        :return: set of trigrams
+        """
+        size = CommitIndex.GRAM_SIZE
+        return {text[idx:idx + size] for idx in range(len(text) - size + 1)}
+
+    @staticmethod
+    def get_tokens(query: str) -> list[str]:
+        """
+        Splits a search query into case folded tokens
+        :param query: text entered by user
+        :return: tokens, which all need to match
+        """
+        return query.casefold().split()
+
+    def add(self, key: str, commits: Iterable[Commit | None]):
+        """
+        Adds an entry to the index
+        :param key: unique key of entry
+        :param commits: commits of entry
+        :return: None
+        """
+        text = self.get_text(commits)
+        self.texts[key] = text
+        for gram in self.get_grams(text):
+            self.postings.setdefault(gram, set()).add(key)
+        if self.__last_query and self.__matches_tokens(text, self.__last_query):
+            self.__last_result.add(key)
+
+    def remove(self, key: str):
+        """
+        Removes an entry from the index
+        :param key: unique key of entry
+        :return: None
+        """
+        text = self.texts.pop(key, None)
+        if text is None:
+            return
+        for gram in self.get_grams(text):
+            keys = self.postings.get(gram)
+            keys.discard(key)
+            if not keys:
+                del self.postings[gram]
+        self.__last_result.discard(key)
+
+    def matches(self, key: str, query: str) -> bool:
+        """
+        Checks if a single entry matches given query
+        :param key: unique key of entry
+        :param query: text entered by user
+        :return: TRUE when all tokens of query are found in entry
+        """
+        text = self.texts.get(key)
+        return text is not None and self.__matches_tokens(text, self.get_tokens(query))
+
+    def search(self, query: str) -> set[str]:
+        """
+        Searches all entries containing every token of given query.
+        When the query refines the previous one, only the previous result is verified
+        :param query: text entered by user
+        :return: keys of matching entries
+        """
+        tokens = self.get_tokens(query)
+        if len(tokens) == 0:
+            self.__last_query = []
+            self.__last_result = set()
+            return set(self.texts.keys())
+
+        candidates = self.__get_candidates(tokens)
+        result = {key for key in candidates if self.__matches_tokens(self.texts[key], tokens)}
+        self.__last_query = tokens
+        self.__last_result = result
+        return set(result)
+
+    def __get_candidates(self, tokens: list[str]) -> Iterable[str]:
+        """
+        Determines the smallest known superset of matching entries
+        by intersecting trigram postings of all tokens
+        :param tokens: case folded query tokens
+        :return: candidate keys, which still need verification
+        """
+        sets: list[set[str]] = []
+        if self.__is_refinement(tokens):
+            sets.append(self.__last_result)
+        for token in tokens:
+            for gram in self.get_grams(token):
+                keys = self.postings.get(gram)
+                if not keys:
+                    return set()
+                sets.append(keys)
+
+        if len(sets) == 0:
+            # Only tokens shorter than a trigram, every entry is a candidate
+            return self.texts.keys()
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:])
+
+    def __is_refinement(self, tokens: list[str]) -> bool:
+        """
+        Checks if given tokens can only match a subset of the previous result,
+        which is the case when each previous token is contained in its successor
+        :param tokens: case folded query tokens
+        :return: TRUE when previous result is a valid candidate set
+        """
+        if not self.__last_query or len(tokens) < len(self.__last_query):
+            return False
+        for previous, current in zip(self.__last_query, tokens):
+            if previous not in current:
+                return False
+        return True
+
+    @staticmethod
+    def __matches_tokens(text: str, tokens: list[str]) -> bool:
+        for token in tokens:
+            if token not in text:
+                return False
+        return True
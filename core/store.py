@@ -0,0 +1,157 @@
+import sqlite3
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from threading import Lock
+
+from core.transport import Commit
+
+
+class StoredCommit:
+    """
+    Representation of one persisted commit and
+    the observed folder it was seen in
+    """
+    folder: str
+    commit: Commit
+
+    def __init__(self, folder: str, commit: Commit):
+        self.folder = folder
+        self.commit = commit
+
+
+class ObservationStore:
+    """
+    SQLite based store of observed commits per repository and folder.
+    Allows a warm start without reporting known commits again.
+    Commits older than the configured retention get pruned, so the store stays bounded
+    """
+    VERSION: int = 2
+    """
+    Schema version, older stores are rebuilt since they hold abbreviated commit identifiers
+    """
+
+    SCHEMA: list[str] = [
+        """
+        CREATE TABLE IF NOT EXISTS commits (
+            repo TEXT NOT NULL,
+            oid BLOB NOT NULL,
+            folder TEXT NOT NULL,
+            author TEXT NOT NULL,
+            date TEXT NOT NULL,
+            date_ts REAL NOT NULL,
+            message TEXT NOT NULL,
+            branch TEXT NOT NULL,
+            PRIMARY KEY (repo, oid, folder)
+        ) WITHOUT ROWID
+        """,
+        'CREATE INDEX IF NOT EXISTS idx_commits_date ON commits (repo, date_ts)',
+        'CREATE INDEX IF NOT EXISTS idx_commits_folder ON commits (repo, folder, date_ts)',
+        'CREATE INDEX IF NOT EXISTS idx_commits_author ON commits (repo, author, date_ts)',
+        # Committer date cursors of former stores missed commits pushed late, known commits are enough
+        'DROP TABLE IF EXISTS cursors'
+    ]
+
+    def __init__(self, db_file: str, retention: timedelta | None = None):
+        """
+        Opens (and if needed creates) the store
+        :param db_file: path of SQLite database file
+        :param retention: [Optional] maximum age of kept commits by commit date. None means unbounded
+        """
+        self.db_file = db_file
+        self.retention = retention
+        self.__lock = Lock()
+        # Store is created by caller thread but used by observer thread
+        self.__connection = sqlite3.connect(db_file, check_same_thread=False)
+        with self.__lock, self.__connection:
+            version = self.__connection.execute('PRAGMA user_version').fetchone()[0]
+            if version < self.VERSION:
+                self.__connection.execute('DROP TABLE IF EXISTS commits')
+            for statement in self.SCHEMA:
+                self.__connection.execute(statement)
+            self.__connection.execute(f'PRAGMA user_version = {self.VERSION}')
+
+    def close(self):
+        """
+        Closes the underlying database connection
+        :return: None
+        """
+        with self.__lock:
+            self.__connection.close()
+
+    def load_hashes(self, repo: str, since: datetime = None) -> set[bytes]:
+        """
+        Loads the commit identifiers seen in given repository
+        :param repo: repository root
+        :param since: [Optional] oldest commit date, older commits are not observed anymore
+        :return: set of raw object identifiers
+        """
+        sql = 'SELECT DISTINCT oid FROM commits WHERE repo = ? AND date_ts >= ?'
+        with self.__lock:
+            cursor = self.__connection.execute(sql, (repo, since.timestamp() if since else float('-inf')))
+            return {row[0] for row in cursor}
+
+    def save(self, repo: str, folder: str, commits: list[Commit]):
+        """
+        Persists newly seen commits of one folder in one transaction,
+        which also prunes commits of given repository exceeding the retention
+        :param repo: repository root
+        :param folder: observed folder
+        :param commits: newly seen commits
+        :return: None
+        """
+        rows = [(repo, cmt.oid, folder, cmt.author, cmt.date.isoformat(), cmt.date.timestamp(),
+                 cmt.message, cmt.branch or '') for cmt in commits]
+        with self.__lock, self.__connection:
+            self.__connection.executemany('INSERT OR IGNORE INTO commits VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            if self.retention is not None:
+                oldest_allowed = datetime.now().astimezone() - self.retention
+                self.__connection.execute('DELETE FROM commits WHERE repo = ? AND date_ts < ?',
+                                          (repo, oldest_allowed.timestamp()))
+
+    def query(self, repo: str = None, folder: str = None, author: str = None,
+              since: datetime = None, until: datetime = None, limit: int = 0) -> list[StoredCommit]:
+        """
+        Queries persisted commits, newest first. Every given criteria needs to match
+        :param repo: [Optional] repository root
+        :param folder: [Optional] observed folder
+        :param author: [Optional] committer name
+        :param since: [Optional] oldest commit date
+        :param until: [Optional] newest commit date
+        :param limit: [Optional] maximum number of results, 0 means unlimited
+        :return: matching commits
+        """
+        criteria = [('repo = ?', repo), ('folder = ?', folder), ('author = ?', author),
+                    ('date_ts >= ?', since.timestamp() if since else None),
+                    ('date_ts <= ?', until.timestamp() if until else None)]
+        where = [clause for clause, value in criteria if value is not None]
+        params = [value for _, value in criteria if value is not None]
+
+        sql = 'SELECT folder, author, date, message, oid, branch FROM commits'
+        if len(where) > 0:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY date_ts DESC'
+        if limit > 0:
+            sql += f' LIMIT {int(limit)}'
+
+        with self.__lock:
+            cursor = self.__connection.execute(sql, params)
+            return [StoredCommit(row[0], Commit(row[1], datetime.fromisoformat(row[2]), row[3], row[4], row[5]))
+                    for row in cursor]
+
+    @staticmethod
+    def build_query_parser() -> ArgumentParser:
+        """
+        Builds the argument parser of the store query command line
+        :return: prepared ArgumentParser
+        """
+        parser = ArgumentParser(prog='main.py query', description='Queries the persistent observation store')
+        parser.add_argument('-st', '--store', required=True, help='SQLite file of observation store')
+        parser.add_argument('-fp', '--filepath', default=None, help='Git root the commits were observed in')
+        parser.add_argument('-lf', '--logfolder', default=None, help='Observed folder')
+        parser.add_argument('-a', '--author', default=None, help='Committer name')
+        parser.add_argument('-s', '--since', default=None, type=datetime.fromisoformat,
+                            help='Oldest commit date (ISO 8601)')
+        parser.add_argument('-u', '--until', default=None, type=datetime.fromisoformat,
+                            help='Newest commit date (ISO 8601)')
+        parser.add_argument('-n', '--limit', default=0, type=int, help='Maximum number of results')
+        return parser
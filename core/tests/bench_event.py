@@ -0,0 +1,32 @@
+from typing import Callable
+
+from core.event import Event, StatusEvent
+from core.tests.benchmark import benchmark
+
+
+@benchmark(operations=10000)
+def event_dispatch() -> Callable[[], None]:
+    """
+    Event with several subscribers, like OnLoaded of viewer and shell
+    """
+    event = Event()
+    received = []
+    for _ in range(4):
+        event += received.append
+
+    def run():
+        received.clear()
+        for number in range(10000):
+            event(number + 1)
+    return run
+
+
+@benchmark(operations=10000)
+def status_event_dispatch() -> Callable[[], None]:
+    event = StatusEvent()
+    event += lambda status_args: None
+
+    def run():
+        for _ in range(10000):
+            event('Git log (core)...')
+    return run
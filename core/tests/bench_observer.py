@@ -0,0 +1,38 @@
+from typing import Callable
+
+from core.tests.benchmark import benchmark
+from core.tests.factory import CommitFactory, GitObserverFactory
+from core.transport import ObservationUtil
+
+
+def create_observer_and_commits():
+    observer = GitObserverFactory.create_default()
+    commits = [ObservationUtil.parse_commit_formatted(line, observer.origin)
+               for line in CommitFactory.create_lines(1000)]
+    return observer, commits
+
+
+@benchmark(operations=1000)
+def filter_commit_result_new() -> Callable[[], None]:
+    """
+    Cold poll, every commit is new
+    """
+    observer, commits = create_observer_and_commits()
+
+    def run():
+        observer.known_hashes.clear()
+        observer.filter_commit_result(commits, [])
+    return run
+
+
+@benchmark(operations=1000)
+def filter_commit_result_known() -> Callable[[], None]:
+    """
+    Warm poll, every commit is known already
+    """
+    observer, commits = create_observer_and_commits()
+    observer.filter_commit_result(commits)
+
+    def run():
+        observer.filter_commit_result(commits, [])
+    return run
@@ -0,0 +1,16 @@
+from typing import Callable
+
+from core.tests.benchmark import benchmark
+from core.tests.factory import CommitFactory
+from core.transport import ObservationUtil
+
+
+@benchmark(operations=1000)
+def parse_commit_formatted() -> Callable[[], None]:
+    lines = CommitFactory.create_lines(1000)
+    origin = 'https://github.com/worstprgr/git-observer/commit/'
+
+    def run():
+        for line in lines:
+            ObservationUtil.parse_commit_formatted(line, origin)
+    return run
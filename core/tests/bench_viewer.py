@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Callable
+
+from core.tests.benchmark import benchmark
+from core.tests.factory import CommitFactory, ViewerFactory
+from core.transport import Observation, ObservationUtil
+
+
+@benchmark(operations=100)
+def update_view() -> Callable[[], None]:
+    """
+    Rendering of 100 new rows in 10 folders into a full store
+    """
+    folders = [f'folder{index}' for index in range(10)]
+    viewer = ViewerFactory.create_viewer(folders)
+    now = datetime.now().astimezone()
+    commits = [ObservationUtil.parse_commit_formatted(line) for line in CommitFactory.create_lines(1000)]
+    for commit in commits:
+        commit.date = now
+    observations = [Observation(folder, commits[index::10]) for index, folder in enumerate(folders)]
+
+    def run():
+        viewer.update_view(observations)
+    return run
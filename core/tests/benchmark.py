@@ -0,0 +1,189 @@
+import argparse
+import glob
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from typing import Callable
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_baseline.json')
+
+
+class MicroBenchmark:
+    """
+    One hot path measured by the benchmark suite. Its setup prepares the data
+    and returns the callable being timed, which executes a fixed number of operations
+    """
+
+    def __init__(self, name: str, setup: Callable[[], Callable[[], None]], operations: int, repeat: int):
+        self.name = name
+        self.setup = setup
+        self.operations = operations
+        self.repeat = repeat
+
+    def measure(self) -> float:
+        """
+        Times the prepared callable, after calling it until 0.2 seconds passed as warm-up.
+        Each timed sample calls it as often, so short callables are not dominated by timer noise
+        :return: best time of one operation in microseconds
+        """
+        timer = timeit.Timer(self.setup())
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=self.repeat, number=number)) / number
+        return best / self.operations * 1e6
+
+
+REGISTRY: list[MicroBenchmark] = []
+
+
+def benchmark(operations: int, repeat: int = 5):
+    """
+    Registers a setup function of bench_*.py modules as micro-benchmark
+    :param operations: number of operations the returned callable executes
+    :param repeat: [Optional] number of timed calls, the best one counts
+    :return: decorator
+    """
+    def register(setup: Callable[[], Callable[[], None]]):
+        REGISTRY.append(MicroBenchmark(setup.__name__, setup, operations, repeat))
+        return setup
+    return register
+
+
+@benchmark(operations=100000)
+def calibration() -> Callable[[], None]:
+    """
+    Pure interpreter workload. Results are compared relative to it,
+    so a baseline recorded on another machine is still meaningful
+    """
+    def run():
+        values = dict()
+        for number in range(100000):
+            values[number % 97] = str(number)
+    return run
+
+
+class BenchmarkSuite:
+    """
+    Discovers the micro-benchmarks in core/tests/bench_*.py, measures them
+    and compares their timings relative to calibration against the stored baseline
+    """
+    ROUNDS: int = 5
+    """
+    Default number of rounds
+    """
+    MIN_ROUNDS: int = 3
+    """
+    Rounds needed at least for a meaningful median
+    """
+
+    def __init__(self, baseline_file: str = BASELINE_FILE, threshold: float = 0.25):
+        """
+        Instantiates a new suite
+        :param baseline_file: [Optional] JSON file of baseline timings
+        :param threshold: [Optional] tolerated slowdown, 0.25 fails benchmarks more than 25 % slower than baseline
+        """
+        self.baseline_file = baseline_file
+        self.threshold = threshold
+
+    @staticmethod
+    def discover() -> list[MicroBenchmark]:
+        for path in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_*.py'))):
+            importlib.import_module(f'core.tests.{os.path.basename(path)[:-3]}')
+        return REGISTRY
+
+    def run(self, names: list[str] = None, rounds: int = ROUNDS) -> dict:
+        """
+        Measures all (or the given) micro-benchmarks relative to calibration.
+        Each round calibrates again and the median of rounds counts, so a single round disturbed
+        by noisy neighbours or frequency scaling neither fails nor passes the gate
+        :param names: [Optional] names of benchmarks to run
+        :param rounds: [Optional] number of rounds, at least MIN_ROUNDS
+        :return: results by benchmark name
+        """
+        calibration, *benchmarks = self.discover()
+        benchmarks = [bench for bench in benchmarks if not names or bench.name in names]
+        calibrations: list[float] = []
+        samples: dict[str, list[tuple[float, float]]] = {bench.name: [] for bench in benchmarks}
+        for _ in range(max(self.MIN_ROUNDS, rounds)):
+            round_calibration_us = calibration.measure()
+            calibrations.append(round_calibration_us)
+            for bench in benchmarks:
+                us_per_op = bench.measure()
+                samples[bench.name].append((us_per_op, us_per_op / round_calibration_us))
+        results = {name: {'us_per_op': round(statistics.median(us for us, _ in rounds_of), 4),
+                          'relative': round(statistics.median(relative for _, relative in rounds_of), 4)}
+                   for name, rounds_of in samples.items()}
+        return {'calibration_us': round(statistics.median(calibrations), 5), 'benchmarks': results}
+
+    def load_baseline(self) -> dict:
+        if not os.path.isfile(self.baseline_file):
+            return {'benchmarks': dict()}
+        with open(self.baseline_file, mode='r', encoding='utf-8') as baseline:
+            return json.load(baseline)
+
+    def save_baseline(self, results: dict):
+        """
+        Stores results as new baseline, keeping baselines of benchmarks not run
+        :param results: results of run
+        :return: None
+        """
+        baseline = self.load_baseline()
+        baseline['python'] = platform.python_version()
+        baseline['calibration_us'] = results['calibration_us']
+        baseline['benchmarks'].update(results['benchmarks'])
+        with open(self.baseline_file, mode='w', encoding='utf-8') as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+
+    def compare(self, results: dict) -> list[str]:
+        """
+        Prints results against baseline
+        :param results: results of run
+        :return: names of regressed benchmarks
+        """
+        baseline = self.load_baseline()['benchmarks']
+        regressions = []
+        print(f'{"Benchmark":<32} {"us/op":>10} {"relative":>10} {"baseline":>10} {"change":>8}')
+        for name, result in results['benchmarks'].items():
+            expected = baseline.get(name, {}).get('relative')
+            change = result['relative'] / expected - 1 if expected else 0.0
+            if change > self.threshold:
+                regressions.append(name)
+            marker = '  REGRESSED' if change > self.threshold else ''
+            print(f'{name:<32} {result["us_per_op"]:>10.3f} {result["relative"]:>10.3f} '
+                  f'{expected if expected else "-":>10} {change:>+8.1%}{marker}')
+        return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Micro-benchmarks of the hot path, compared against a stored baseline')
+    parser.add_argument('names', nargs='*', help='Names of benchmarks to run, DEFAULT: all')
+    parser.add_argument('-t', '--threshold', type=float, default=0.25,
+                        help='Tolerated slowdown relative to baseline, DEFAULT: 0.25')
+    parser.add_argument('-r', '--rounds', type=int, default=BenchmarkSuite.ROUNDS,
+                        help=f'Number of rounds, their median counts, at least {BenchmarkSuite.MIN_ROUNDS}, '
+                             f'DEFAULT: {BenchmarkSuite.ROUNDS}')
+    parser.add_argument('-u', '--update', action='store_true', help='Store the results as new baseline')
+    parser.add_argument('-b', '--baseline', default=BASELINE_FILE, help='JSON file of baseline timings')
+    args = parser.parse_args()
+
+    suite = BenchmarkSuite(args.baseline, args.threshold)
+    results = suite.run(args.names, args.rounds)
+    regressions = suite.compare(results)
+    if args.update:
+        suite.save_baseline(results)
+        print(f'Baseline written to {args.baseline}')
+        return 0
+    if regressions:
+        print(f'{len(regressions)} benchmark(s) regressed more than {args.threshold:.0%}: {", ".join(regressions)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    # Benchmark modules register at core.tests.benchmark, which is another module instance than __main__
+    from core.tests.benchmark import main as suite_main
+    sys.exit(suite_main())
@@ -1,8 +1,14 @@
 import pathlib
-from datetime import datetime
+import subprocess
+from datetime import datetime, timedelta
+from queue import SimpleQueue
 
 from observer import GitObserver
+from viewer import GitObserverViewer
 from core.config.management import ConfigManager
+from core.search import CommitIndex
+from core.tkinter.columns import ColumnLayout
+from core.tkinter.grid import GridStore
 import core.paths
 import core.unittestutils
 
@@ -25,6 +31,103 @@ class GitObserverFactory:
         return observer
 
 
+class RepositoryFactory:
+    IDENTITY: list[str] = ['-c', 'user.name=Otto Mustermann', '-c', 'user.email=otto@example.com']
+    """
+    Committer configuration independent of the user running the tests
+    """
+
+    @staticmethod
+    def git(directory: str, *args: str) -> str:
+        """
+        Calls git within given repository
+        :param directory: repository root
+        :param args: git command and its arguments
+        :return: stdout of git
+        """
+        cmd = ['git', *RepositoryFactory.IDENTITY, '-C', directory, *args]
+        return subprocess.run(cmd, capture_output=True, check=True, text=True).stdout
+
+    @staticmethod
+    def create_repository(directory: str, messages: list[str]) -> list[str]:
+        """
+        Initializes a repository on branch main with one empty commit per message
+        :param directory: existing directory
+        :param messages: commit messages, oldest first
+        :return: SHA1 identifiers of the commits, oldest first
+        """
+        RepositoryFactory.git(directory, 'init', '--quiet', '--initial-branch=main')
+        for message in messages:
+            RepositoryFactory.git(directory, 'commit', '--quiet', '--allow-empty', f'--message={message}')
+        return RepositoryFactory.git(directory, 'log', '--reverse', '--format=%H').split()
+
+
+class CommitFactory:
+
+    @staticmethod
+    def create_lines(count: int) -> list[str]:
+        """
+        Creates commit lines like git log emits them with the observer's format, without enclosing quotes
+        :param count: number of lines
+        :return: lines, newest first
+        """
+        return [f'author.{number % 13:02d}|2024-01-{1 + number % 28:02d}T{number % 24:02d}:15:08+01:00|'
+                f'Change {number} of feature|{number:040x}|{"origin/main" if number % 5 == 0 else ""}'
+                for number in range(count)]
+
+
+class FakeTreeview:
+    """
+    Stand-in of ttk.Treeview keeping rows in a list, so rendering is tested and measured without Tk
+    """
+
+    def __init__(self):
+        self.rows: list[str] = []
+        self.values: dict[str, list[str]] = dict()
+
+    def insert(self, parent: str, index: int | str, iid: str, values: list[str]):
+        self.rows.insert(len(self.rows) if index == 'end' else index, iid)
+        self.values[iid] = values
+
+    def delete(self, *items: str):
+        deleted = set(items)
+        self.rows = [row for row in self.rows if row not in deleted]
+        for item in items:
+            del self.values[item]
+
+    def get_children(self) -> tuple[str, ...]:
+        return tuple(self.rows)
+
+    def see(self, item: str):
+        pass
+
+
+class ViewerFactory:
+    @staticmethod
+    def create_viewer(folders: list[str]) -> GitObserverViewer:
+        """
+        Creates a viewer without Tk window, holding only the state update_view works on
+        :param folders: observed folders
+        :return: viewer rendering into a FakeTreeview
+        """
+        viewer = GitObserverViewer.__new__(GitObserverViewer)
+        viewer.grid_store = GridStore(5000, timedelta(hours=168))
+        viewer.view_window = 200
+        viewer.view_offset = 0
+        viewer.view_count = 0
+        viewer.view_source = viewer.grid_store
+        viewer.search_index = CommitIndex()
+        viewer.search_query = ''
+        viewer.is_iconified = False
+        viewer.pending_observations = []
+        viewer.observer_events = SimpleQueue()
+        viewer.observer_poll_id = None
+        viewer.timeline = None
+        viewer.column_layout = ColumnLayout(folders, 8)
+        viewer.tv_commits = FakeTreeview()
+        return viewer
+
+
 class LoggerFactory:
     @staticmethod
     def create_log_file_path() -> pathlib.Path:
@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+
+from core.checkpoint import SeenCheckpoint
+
+
+class SeenCheckpointTest(unittest.TestCase):
+    """
+    UnitTest class to test the binary checkpoint of reported commits
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.temp_dir.name, 'checkpoint.bin')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def create_oid(number: int, width: int = 20) -> bytes:
+        """
+        Creates a raw object identifier
+        :param number: value of identifier
+        :param width: identifier length, DEFAULT: SHA1
+        :return: raw object identifier
+        """
+        return number.to_bytes(width, 'big')
+
+    def test_missing_file(self):
+        """
+        Test if a missing checkpoint file is treated as empty
+        :return: None
+        """
+        # When opening a checkpoint that does not exist
+        checkpoint = SeenCheckpoint(self.file)
+
+        # It is expected that nothing is known
+        self.assertEqual(0, len(checkpoint))
+        self.assertNotIn(self.create_oid(1), checkpoint)
+
+    def test_save_and_reload(self):
+        """
+        Test if saved commits are found by a later run
+        and records are kept sorted
+        :return: None
+        """
+        # Given is a checkpoint of a first run
+        first = SeenCheckpoint(self.file)
+        first.add(self.create_oid(5))
+        first.add(self.create_oid(1))
+        first.save()
+        first.close()
+
+        # When a second run adds further commits
+        second = SeenCheckpoint(self.file)
+        second.add(self.create_oid(3))
+        second.add(self.create_oid(1))
+        second.save()
+        second.close()
+
+        # It is expected that a third run knows all of them exactly once
+        third = SeenCheckpoint(self.file)
+        self.assertEqual(3, len(third))
+        for number in [1, 3, 5]:
+            self.assertIn(self.create_oid(number), third)
+        self.assertNotIn(self.create_oid(2), third)
+        self.assertNotIn(self.create_oid(1, 19), third, 'Expected no match of identifier of other width')
+        third.close()
+
+        # And that records are sorted for binary search
+        with open(self.file, mode='rb') as checkpoint_file:
+            checkpoint_file.seek(SeenCheckpoint.HEADER.size)
+            records = [checkpoint_file.read(20) for _ in range(3)]
+        self.assertEqual([self.create_oid(1), self.create_oid(3), self.create_oid(5)], records)
+
+    def test_width_of_repository(self):
+        """
+        Test if a new checkpoint takes the record width from its identifiers
+        and rejects identifiers of other width afterwards
+        :return: None
+        """
+        # Given is a checkpoint saved with SHA256 identifiers
+        checkpoint = SeenCheckpoint(self.file)
+        checkpoint.add(self.create_oid(1, 32))
+        checkpoint.save()
+
+        # When adding a SHA1 identifier, it is expected to fail
+        self.assertEqual(32, checkpoint.width)
+        with self.assertRaises(ValueError):
+            checkpoint.add(self.create_oid(2))
+        checkpoint.close()
+
+    def test_pending_known(self):
+        """
+        Test if added commits are known before saving
+        :return: None
+        """
+        # Given is an empty checkpoint
+        checkpoint = SeenCheckpoint(self.file)
+
+        # When adding a commit without saving
+        checkpoint.add(self.create_oid(2))
+
+        # It is expected that the commit is known, but not persisted
+        self.assertIn(self.create_oid(2), checkpoint)
+        self.assertFalse(os.path.isfile(self.file))
+
+    def test_invalid_file(self):
+        """
+        Test if a file which is no checkpoint is rejected
+        :return: None
+        """
+        # Given is a file of foreign content
+        with open(self.file, mode='w', encoding='utf8') as foreign:
+            foreign.write('no checkpoint')
+
+        # When opening it, it is expected to fail
+        with self.assertRaises(RuntimeError):
+            SeenCheckpoint(self.file)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from datetime import datetime, timedelta
+
+from core.tkinter.columns import ColumnLayout
+from core.transport import Commit
+
+
+class ColumnLayoutTest(unittest.TestCase):
+    """
+    UnitTest class to test grouping and horizontal virtualization of viewer columns
+    """
+    FOLDERS: list[str] = ['services/a', 'services/b', 'lib', './services/c', 'tools/x', 'tools/y']
+
+    def test_groups_by_prefix(self):
+        """
+        Test if folders are grouped by their top level path segment
+        in order of first occurrence
+        :return: None
+        """
+        # When creating a layout of nested folders
+        layout = ColumnLayout(self.FOLDERS, visible=10, grouped=True)
+
+        # It is expected to receive one group per prefix including their folder indices
+        self.assertEqual(['services', 'lib', 'tools'], [group.name for group in layout.groups])
+        self.assertEqual([0, 1, 3], layout.groups[0].folders)
+
+    def test_collapsed_columns(self):
+        """
+        Test if collapsed groups result in one column each,
+        while single folders keep their own column
+        :return: None
+        """
+        # Given is a grouped layout
+        layout = ColumnLayout(self.FOLDERS, visible=10, grouped=True)
+
+        # When expanding the group "tools"
+        layout.toggle(layout.groups[2])
+
+        # It is expected that "services" is one column and "tools" is split into its folders
+        self.assertEqual([[0, 1, 3], [2], [4], [5]], [spec.folders for spec in layout.specs])
+
+    def test_visible_window(self):
+        """
+        Test if only a window of columns is visible and
+        scrolling keeps the window inside valid range
+        :return: None
+        """
+        # Given is an ungrouped layout showing two columns at once
+        layout = ColumnLayout(self.FOLDERS, visible=2)
+
+        # When scrolling beyond the last column
+        moved = layout.scroll(10)
+
+        # It is expected that the window stops at the last two columns
+        self.assertTrue(moved)
+        self.assertEqual([[4], [5]], [spec.folders for spec in layout.get_visible()])
+        self.assertEqual((4 / 6, 1.0), layout.get_fractions())
+        self.assertFalse(layout.scroll(1), 'Expected no movement at end of columns')
+
+    def test_collapsed_cell(self):
+        """
+        Test if a collapsed group cell shows the newest commit
+        and counts the hidden ones
+        :return: None
+        """
+        # Given is a grouped layout and a row with commits in two folders of group "services"
+        layout = ColumnLayout(self.FOLDERS, visible=10, grouped=True)
+        now = datetime.now()
+        older = Commit('otto.mustermann', now - timedelta(hours=1), 'Ottos feature', '01' * 20)
+        newer = Commit('susi.mustermann', now, 'Susis feature', '02' * 20)
+        commits = [older, None, None, newer, None, None]
+
+        # When determining the cell of group "services"
+        commit, folder_idx, hidden = ColumnLayout.get_cell(commits, layout.specs[0])
+
+        # It is expected to receive the newer commit of folder "./services/c"
+        self.assertIs(newer, commit)
+        self.assertEqual(3, folder_idx)
+        self.assertEqual(1, hidden)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,251 @@
+import subprocess
+import tempfile
+import unittest
+from datetime import datetime
+
+from core.filter import CommitFilter, FilterPlan, MergeMode, RefScope
+from core.tests.factory import RepositoryFactory
+from core.transport import Commit
+
+
+class CommitFilterTest(unittest.TestCase):
+    """
+    UnitTest class to test splitting the commit filter into git arguments and Python predicate
+    """
+
+    @staticmethod
+    def create_commit(author: str, message: str) -> Commit:
+        """
+        Creates a commit of given author and message
+        :param author: committer name
+        :param message: summary text
+        :return: Commit
+        """
+        return Commit(author, datetime.now(), message, '01' * 20)
+
+    def test_python_predicate(self):
+        """
+        Test if all criteria are evaluated in Python without pushdown
+        :return: None
+        """
+        # Given is a filter using every message and author criteria
+        commit_filter = CommitFilter(['otto.mustermann'], ['feature', 'bugfix'], ['WIP'])
+
+        # When planning without pushdown
+        plan = commit_filter.plan(pushdown=False)
+
+        # It is expected that git receives nothing and Python applies all criteria
+        self.assertEqual([], plan.git_args)
+        self.assertTrue(plan.accepts(self.create_commit('susi.mustermann', 'Susis feature')))
+        self.assertTrue(plan.accepts(self.create_commit('susi.mustermann', 'Susis bugfix')))
+        self.assertFalse(plan.accepts(self.create_commit('otto.mustermann', 'Ottos feature')))
+        self.assertFalse(plan.accepts(self.create_commit('susi.mustermann', 'Susis refactoring')))
+        self.assertFalse(plan.accepts(self.create_commit('susi.mustermann', 'WIP feature')))
+
+    def test_pushdown_include(self):
+        """
+        Test if include patterns are passed to git, exclusion is listed by a separate git call
+        and authors stay in Python
+        :return: None
+        """
+        # Given is a filter including and excluding messages
+        commit_filter = CommitFilter(['otto.mustermann'], ['feature'], ['WIP'])
+
+        # When planning without perl compatible regexes
+        plan = commit_filter.plan()
+
+        # It is expected that git includes, lists excluded commits and Python only checks authors
+        self.assertEqual(['--grep=feature', '--extended-regexp'], plan.git_args)
+        self.assertEqual(['--grep=WIP', '--extended-regexp'], plan.exclude_args)
+        self.assertIsNone(plan.include)
+        self.assertIsNone(plan.exclude)
+        self.assertEqual(frozenset(['otto.mustermann']), plan.authors)
+
+        # And that commits of the exclusion call are rejected
+        commit = self.create_commit('susi.mustermann', 'Susis feature')
+        self.assertTrue(plan.accepts(commit))
+        plan.excluded = {commit.oid}
+        self.assertFalse(plan.accepts(commit))
+
+    @staticmethod
+    def read_accepted(directory: str, plan: FilterPlan) -> list[str]:
+        """
+        Reads the messages of a repository accepted by given plan, like the observer does
+        :param directory: repository root
+        :param plan: planned filter
+        :return: accepted messages, newest first
+        """
+        if plan.exclude_args:
+            plan.excluded = {bytes.fromhex(sha1) for sha1 in
+                             RepositoryFactory.git(directory, 'log', '--format=%H', *plan.exclude_args).split()}
+        log = RepositoryFactory.git(directory, 'log', '--format=%cn|%H|%s', *plan.git_args)
+        commits = [Commit(author, datetime.now(), message, sha1) for author, sha1, message in
+                   (line.split('|', 2) for line in log.splitlines())]
+        return [commit.message for commit in commits if plan.accepts(commit)]
+
+    def test_git_python_agree(self):
+        """
+        Test if git and Python evaluate message patterns the same way,
+        using a syntax extended regular expressions do not support
+        :return: None
+        """
+        # Given is a repository and a filter including and excluding messages
+        commit_filter = CommitFilter(include_messages=[r'feature #\d+', 'bugfix'], exclude_messages=[r'^WIP\b'])
+        messages = ['Add feature #1', 'WIP feature #2', 'Add feature #x', 'Fix bugfix', 'WIPE bugfix', 'Refactoring']
+        with tempfile.TemporaryDirectory() as directory:
+            RepositoryFactory.create_repository(directory, messages)
+            try:
+                RepositoryFactory.git(directory, 'log', '--perl-regexp', '--grep=^')
+            except subprocess.CalledProcessError:
+                self.skipTest('git does not support perl compatible regular expressions')
+
+            # When evaluating the filter by git and by Python
+            by_git = self.read_accepted(directory, commit_filter.plan(perl_regexp=True))
+            by_python = self.read_accepted(directory, commit_filter.plan(pushdown=False))
+
+        # It is expected that both accept the same commits
+        self.assertEqual(['WIPE bugfix', 'Fix bugfix', 'Add feature #1'], by_git)
+        self.assertEqual(by_git, by_python)
+
+    def test_pushdown_exclude(self):
+        """
+        Test if exclude patterns are passed to git inverted, when nothing is included
+        :return: None
+        """
+        # Given is a filter excluding messages
+        commit_filter = CommitFilter(exclude_messages=['WIP', 'fixup!'])
+
+        # When planning
+        plan = commit_filter.plan()
+
+        # It is expected that git inverts the message patterns
+        self.assertEqual(['--grep=WIP', '--grep=fixup!', '--invert-grep', '--extended-regexp'], plan.git_args)
+        self.assertTrue(plan.accepts(self.create_commit('susi.mustermann', 'WIP feature')))
+
+    def test_pushdown_authors(self):
+        """
+        Test if ignored authors are passed to git as negative lookahead
+        when perl compatible regexes are supported
+        :return: None
+        """
+        # Given is a filter ignoring two committers
+        commit_filter = CommitFilter(['susi.mustermann', 'otto.mustermann'])
+
+        # When planning with perl compatible regexes
+        plan = commit_filter.plan(perl_regexp=True)
+
+        # It is expected that git excludes both committers
+        self.assertEqual([r'--committer=^(?!(?:otto\.mustermann|susi\.mustermann) <)', '--perl-regexp'],
+                         plan.git_args)
+        self.assertEqual(frozenset(), plan.authors)
+
+
+class RefScopeTest(unittest.TestCase):
+    """
+    UnitTest class to test traversal and decoration arguments of the ref scope
+    """
+
+    def test_default_all(self):
+        """
+        Test if all refs are observed without configured scope
+        :return: None
+        """
+        # Given is an empty scope
+        scope = RefScope()
+
+        # It is expected to traverse all refs and not to limit decoration
+        self.assertEqual(['--all'], scope.get_traversal_args())
+        self.assertEqual([], scope.get_decoration_args())
+
+    def test_include_exclude(self):
+        """
+        Test if exclusions precede every included pattern
+        and branch names are expanded to local and remote branches
+        :return: None
+        """
+        # Given is a scope of remote branches of origin, except archived ones
+        scope = RefScope(['refs/remotes/origin/*', 'release/*'], ['refs/remotes/origin/archive/*'])
+
+        # When building traversal and decoration arguments
+        traversal = scope.get_traversal_args()
+        decoration = scope.get_decoration_args()
+
+        # It is expected that each glob is preceded by the exclusion
+        self.assertEqual(['--exclude=refs/remotes/origin/archive/*', '--glob=refs/remotes/origin/*',
+                          '--exclude=refs/remotes/origin/archive/*', '--glob=refs/heads/release/*',
+                          '--exclude=refs/remotes/origin/archive/*', '--glob=refs/remotes/*/release/*'],
+                         traversal)
+        self.assertEqual(['--decorate-refs=refs/remotes/origin/*', '--decorate-refs=refs/heads/release/*',
+                          '--decorate-refs=refs/remotes/*/release/*',
+                          '--decorate-refs-exclude=refs/remotes/origin/archive/*'], decoration)
+
+    def test_literal_branch(self):
+        """
+        Test if a branch name without wildcard observes exactly that branch of a repository
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Given is a repository with commits on main, on a branch prefixed by main, and on a release branch
+            RepositoryFactory.create_repository(directory, ['Initial commit'])
+            for branch, message in (('main-next', 'Next feature'), ('release', 'Release fix')):
+                RepositoryFactory.git(directory, 'switch', '--quiet', '--create', branch, 'main')
+                RepositoryFactory.git(directory, 'commit', '--quiet', '--allow-empty', f'--message={message}')
+
+            # When observing branch main and a missing branch, as well as everything but the release branch
+            scope = RefScope(['main', 'missing'])
+            observed = RepositoryFactory.git(directory, 'log', '--format=%s', *scope.get_traversal_args())
+            skipping = RefScope(['main*', 'release'], ['release'])
+            skipped = RepositoryFactory.git(directory, 'log', '--format=%s', *skipping.get_traversal_args())
+
+        # It is expected that local branches are passed as revision and only commits of main are observed
+        self.assertEqual(['--ignore-missing', '--glob=refs/remotes/*/main', '--glob=refs/remotes/*/missing',
+                          'refs/heads/main', 'refs/heads/missing'], scope.get_traversal_args())
+        self.assertEqual(['Initial commit'], observed.splitlines())
+        self.assertEqual({'Next feature', 'Initial commit'}, set(skipped.splitlines()))
+
+    def test_exclude_only(self):
+        """
+        Test if exclusions without inclusion apply to all refs
+        :return: None
+        """
+        # Given is a scope excluding archived branches
+        scope = RefScope(exclude=['archive/*'])
+
+        # It is expected to traverse all refs except archived branches
+        self.assertEqual(['--exclude=refs/heads/archive/*', '--exclude=refs/remotes/*/archive/*', '--all'],
+                         scope.get_traversal_args())
+
+
+class MergeModeTest(unittest.TestCase):
+    """
+    UnitTest class to test global and per folder handling of merge commits
+    """
+
+    def test_folder_override(self):
+        """
+        Test if folders without override use the global mode
+        :return: None
+        """
+        # Given is a global mode and overrides of two folders
+        merge_mode = MergeMode('no-merges', ['core=first-parent', 'doc = merges-only'])
+
+        # When building arguments per folder
+        # It is expected that overrides take precedence
+        self.assertEqual(['--no-merges'], merge_mode.get_args('static'))
+        self.assertEqual(['--first-parent'], merge_mode.get_args('core'))
+        self.assertEqual(['--merges'], merge_mode.get_args('doc'))
+        self.assertEqual([], MergeMode().get_args('core'))
+
+    def test_invalid_mode(self):
+        """
+        Test if unknown modes and malformed overrides are rejected
+        :return: None
+        """
+        with self.assertRaises(ValueError):
+            MergeMode('octopus')
+        with self.assertRaises(ValueError):
+            MergeMode(overrides=['first-parent'])
+
+
+if __name__ == '__main__':
+    unittest.main()
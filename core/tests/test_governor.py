@@ -0,0 +1,76 @@
+import unittest
+from threading import Event as ThreadEvent
+from unittest.mock import patch
+
+from core.governor import ResourceGovernor
+
+
+class ResourceGovernorTest(unittest.TestCase):
+    """
+    UnitTest class to test CPU budget, deferral and priority of git processes
+    """
+
+    @patch.object(ResourceGovernor, 'get_children_cpu', side_effect=[0.0, 5.0, 5.0])
+    def test_cpu_budget(self, _):
+        """
+        Test if calls wait for CPU budget, unless they are urgent
+        :return: None
+        """
+        # Given is a governor, whose budget got exhausted by a call consuming 5 CPU seconds
+        governor = ResourceGovernor(cpu_budget=2)
+        stop = ThreadEvent()
+        self.assertTrue(governor.acquire(stop))
+        governor.release()
+
+        # When asking for the delay of the next call
+        delay = governor.get_budget_delay()
+
+        # It is expected that budget frees up when the call leaves the window
+        self.assertGreater(delay, governor.WINDOW - 5)
+        self.assertLessEqual(delay, governor.WINDOW)
+
+        # And that urgent calls are admitted, while others wait until stopped
+        self.assertTrue(governor.acquire(stop, urgent=True))
+        governor.release()
+        stop.set()
+        self.assertFalse(governor.acquire(stop))
+
+    @patch.object(ResourceGovernor, 'get_load', return_value=4.0)
+    def test_defer(self, _):
+        """
+        Test if non-urgent work is deferred on a busy system, but not longer than allowed
+        :return: None
+        """
+        # Given is a governor deferring work above a load of 2 per CPU
+        governor = ResourceGovernor(max_load=2)
+        if governor.max_load == 0:
+            self.skipTest('Load average not available')
+
+        # When the system is busy, it is expected to defer
+        self.assertTrue(governor.defer('fetch'))
+        self.assertEqual(1, governor.deferrals)
+
+        # When the work is overdue, it is expected to run anyway
+        governor.DEFER_MAX = -1
+        self.assertFalse(governor.defer('fetch'))
+
+    def test_priority(self):
+        """
+        Test if processes are only deprioritized when configured
+        :return: None
+        """
+        cmd = ['git', 'log']
+        self.assertEqual((cmd, {}), ResourceGovernor(nice=0).get_popen_args(cmd, False))
+        governor = ResourceGovernor(nice=0)
+        low_cmd, kwargs = governor.get_popen_args(cmd, True)
+        self.assertEqual(cmd, low_cmd[-2:])
+        if governor.nice_executable:
+            # Deprioritized by prefix, so Popen needs no preexec_fn
+            self.assertEqual([governor.nice_executable, '-n', '10'], low_cmd[:3])
+            self.assertEqual({}, kwargs)
+        else:
+            self.assertTrue('creationflags' in kwargs or low_cmd == cmd)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+from datetime import datetime, timedelta
+
+from core.tkinter.grid import GridRow, GridStore
+
+
+class GridStoreTest(unittest.TestCase):
+    """
+    UnitTest class to test the bounded row store of viewer grid
+    """
+
+    def test_prepend_order(self):
+        """
+        Test if prepended rows are returned newest first
+        :return: None
+        """
+        # Given is an unbounded store
+        store = GridStore()
+
+        # When prepending three rows
+        for label in ['first', 'second', 'third']:
+            store.prepend(GridRow([], label))
+
+        # It is expected that the last prepended row is on top
+        self.assertEqual(['third', 'second', 'first'], [row.label for row in store])
+
+    def test_evict_by_size(self):
+        """
+        Test if rows exceeding the configured row count
+        are evicted from the end of the store
+        :return: None
+        """
+        # Given is a store keeping at most two rows
+        store = GridStore(max_rows=2)
+        for label in ['first', 'second', 'third']:
+            store.prepend(GridRow([], label))
+
+        # When evicting
+        evicted = store.evict()
+
+        # It is expected that only the oldest row got removed
+        self.assertEqual(['first'], [row.label for row in evicted])
+        self.assertEqual(['third', 'second'], [row.label for row in store])
+
+    def test_shed(self):
+        """
+        Test if a share of the oldest rows is evicted, e.g. when memory budget is exceeded
+        :return: None
+        """
+        # Given is an unbounded store of four rows
+        store = GridStore()
+        for label in ['first', 'second', 'third', 'fourth']:
+            store.prepend(GridRow([], label))
+
+        # When shedding half of them
+        evicted = store.shed(0.5)
+
+        # It is expected that the two oldest rows got removed and can not be looked up anymore
+        self.assertEqual(['first', 'second'], [row.label for row in evicted])
+        self.assertEqual(['fourth', 'third'], [row.label for row in store])
+        self.assertIsNone(store.get(evicted[0].key))
+
+    def test_evict_by_age(self):
+        """
+        Test if rows older than the configured age
+        are evicted from the end of the store
+        :return: None
+        """
+        # Given is a store keeping rows of the last hour
+        now = datetime.now()
+        store = GridStore(max_age=timedelta(hours=1))
+        store.prepend(GridRow([], 'old', now - timedelta(hours=2)))
+        store.prepend(GridRow([], 'new', now))
+
+        # When evicting
+        evicted = store.evict(now)
+
+        # It is expected that only the outdated row got removed
+        self.assertEqual(['old'], [row.label for row in evicted])
+        self.assertEqual(['new'], [row.label for row in store])
+
+    def test_lookup_by_key(self):
+        """
+        Test if rows are found by their stable key
+        and evicted rows are not found anymore
+        :return: None
+        """
+        # Given is a store keeping at most two rows
+        store = GridStore(max_rows=2)
+        rows = [GridRow([], str(idx)) for idx in range(3)]
+        for row in rows:
+            store.prepend(row)
+
+        # When evicting the oldest row
+        store.evict()
+
+        # It is expected that remaining rows are found by key and the evicted one is not
+        self.assertIs(rows[2], store.get(rows[2].key))
+        self.assertIs(rows[1], store.get(rows[1].key))
+        self.assertIsNone(store.get(rows[0].key))
+        self.assertEqual(3, len({row.key for row in rows}), 'Expected unique keys per row')
+
+    def test_window(self):
+        """
+        Test if a window returns the requested slice
+        and is cut at the end of store
+        :return: None
+        """
+        # Given is a store with five rows
+        store = GridStore()
+        for idx in range(5):
+            store.prepend(GridRow([], str(idx)))
+
+        # When requesting windows inside and across the end of store
+        inner = store.window(1, 2)
+        outer = store.window(3, 10)
+
+        # It is expected to receive the matching rows only
+        self.assertEqual(['3', '2'], [row.label for row in inner])
+        self.assertEqual(['1', '0'], [row.label for row in outer])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+
+from core.config.management import ConfigManager
+from core.journal import PollJournal
+from core.metrics import PollMetrics
+from core.runner import CommandMetrics
+from observer import GitObserverThread
+
+
+class PollJournalTest(unittest.TestCase):
+    """
+    UnitTest class to test the batched journal of iterations and its latency summary
+    """
+
+    def test_batches(self):
+        """
+        Test if records are buffered until a batch is full
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Given is a journal writing batches of two records
+            file = os.path.join(directory, 'journal.jsonl')
+            journal = PollJournal(file, batch=2)
+
+            # When appending one record, it is expected to be buffered
+            journal.append({'time': '2024-01-01T00:00:00+00:00', 'duration_s': 1.0})
+            self.assertFalse(os.path.exists(file))
+
+            # When appending a second one, it is expected that both are written
+            journal.append({'time': '2024-01-01T00:01:00+00:00', 'duration_s': 2.0})
+            self.assertEqual(2, len(list(PollJournal.read(file))))
+
+            # And that closing writes the rest
+            journal.append({'time': '2024-01-01T00:02:00+00:00', 'duration_s': 3.0})
+            journal.close()
+            self.assertEqual(3, len(list(PollJournal.read(file))))
+
+    def test_unwritable(self):
+        """
+        Test if a journal that can not be written does not fail the iteration
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Given is a journal, whose folder is a file
+            blocker = os.path.join(directory, 'blocker')
+            open(blocker, mode='w').close()
+            journal = PollJournal(os.path.join(blocker, 'journal.jsonl'), batch=1)
+
+            # When appending a record, it is expected that the failure is logged only
+            with self.assertLogs('core.journal', level='WARNING'):
+                journal.append({'time': '2024-01-01T00:00:00+00:00', 'duration_s': 1.0})
+
+    def test_stop_observation(self):
+        """
+        Test if stopping the observer thread writes the record of its last iteration
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Given is a running observer thread, which journals its iterations
+            config = ConfigManager.get_defaults()
+            config.journal = os.path.join(directory, 'journal.jsonl')
+            observer = GitObserverThread(config, is_test_instance=True)
+            polls = []
+            observer.OnMetrics += polls.append
+            observer.start()
+            deadline = time.monotonic() + 10
+            while not polls and time.monotonic() < deadline:
+                time.sleep(0.05)
+
+            # When stopping it
+            observer.stop_observation()
+
+            # It is expected that the thread ended and its iteration was written
+            self.assertFalse(observer.is_alive())
+            self.assertEqual(1, len(list(PollJournal.read(config.journal))))
+
+    def test_create_record(self):
+        """
+        Test if a record contains the git calls and errors of an iteration
+        :return: None
+        """
+        # Given is an iteration, whose only git log call failed
+        before = {'fetch': CommandMetrics()}
+        failed = CommandMetrics()
+        failed.add(0.5, True, False, 'fatal: bad revision')
+        poll = PollMetrics()
+        poll.count_commands(before, {'fetch': CommandMetrics(), 'log': failed})
+        poll.fingerprint = 'abc'
+        poll.finish()
+
+        # When creating its record
+        record = json.loads(json.dumps(PollJournal.create_record('/srv/repo', poll)))
+
+        # It is expected that only commands called within the iteration are listed
+        self.assertEqual({'log': {'calls': 1, 'duration_s': 0.5, 'failures': 1, 'timeouts': 0}}, record['commands'])
+        self.assertEqual(1, record['git_processes'])
+        self.assertEqual(['git log: 1 failed, last: fatal: bad revision'], record['errors'])
+        self.assertEqual('abc', record['fingerprint'])
+
+    def test_summarize(self):
+        """
+        Test if percentiles are summarized for iterations within the given time range
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Given is a journal of 100 iterations lasting 1 to 100 seconds, and a truncated line
+            file = os.path.join(directory, 'journal.jsonl')
+            journal = PollJournal(file)
+            for second in range(1, 101):
+                journal.append({'time': f'2024-01-01T00:{second // 60:02d}:{second % 60:02d}+00:00',
+                                'duration_s': float(second), 'phases': {'log': second / 2}, 'errors': []})
+            journal.close()
+            with open(file, mode='a', encoding='utf-8') as truncated:
+                truncated.write('{"time": "2024-01-01T00:')
+
+            # When summarizing all of them, and those of the first 50 seconds
+            summary = PollJournal.summarize(PollJournal.read(file))
+            until = datetime(2024, 1, 1, 0, 0, 50, tzinfo=timezone.utc)
+            partial = PollJournal.summarize(PollJournal.read(file, until=until))
+
+        # It is expected to receive nearest-rank percentiles
+        self.assertEqual(100, summary['polls'])
+        self.assertEqual({'p50': 50.0, 'p95': 95.0, 'p99': 99.0, 'max': 100.0}, summary['duration_s'])
+        self.assertEqual(47.5, summary['phases']['log']['p95'])
+        self.assertEqual(50, partial['polls'])
+        self.assertEqual(25.0, partial['duration_s']['p50'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+from core.maintenance import RepositoryMaintenance
+from core.runner import GitRunner
+
+
+class RepositoryMaintenanceTest(unittest.TestCase):
+    """
+    UnitTest class to test the detection of commit-graph acceleration structures
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.maintenance = RepositoryMaintenance(self.temp_dir.name, GitRunner())
+        os.makedirs(os.path.join(self.maintenance.info_dir, 'commit-graphs'))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_graph(self, path: str, chunk_ids: list[bytes]):
+        """
+        Writes header and chunk table of a commit-graph file
+        :param path: path of file
+        :param chunk_ids: ids of contained chunks
+        :return: None
+        """
+        with open(path, mode='wb') as graph:
+            graph.write(RepositoryMaintenance.HEADER.pack(b'CGPH', 1, 1, len(chunk_ids), 0))
+            for chunk_id in chunk_ids + [b'\0\0\0\0']:
+                graph.write(RepositoryMaintenance.CHUNK.pack(chunk_id, 0))
+
+    def test_no_graph(self):
+        """
+        Test if a repository without commit-graph is detected as such
+        :return: None
+        """
+        # When inspecting a repository without commit-graph
+        status = self.maintenance.get_status()
+
+        # It is expected that nothing is present
+        self.assertFalse(status.present)
+        self.assertFalse(status.complete)
+
+    def test_single_graph(self):
+        """
+        Test if a single commit-graph file without generation data and Bloom filters is detected
+        :return: None
+        """
+        # Given is a commit-graph written by an old git version
+        self.write_graph(os.path.join(self.maintenance.info_dir, 'commit-graph'), [b'OIDF', b'OIDL', b'CDAT'])
+
+        # When inspecting the repository
+        status = self.maintenance.get_status()
+
+        # It is expected that the graph is present, but does not accelerate
+        self.assertEqual(1, status.layers)
+        self.assertFalse(status.generation)
+        self.assertFalse(status.bloom)
+
+    def test_split_chain(self):
+        """
+        Test if all layers of a split commit-graph need to contain a structure
+        :return: None
+        """
+        # Given is a chain of two layers, where only the first one contains Bloom filters
+        graphs_dir = os.path.join(self.maintenance.info_dir, 'commit-graphs')
+        self.write_graph(os.path.join(graphs_dir, 'graph-1.graph'), [b'OIDF', b'CDAT', b'GDA2', b'BIDX', b'BDAT'])
+        self.write_graph(os.path.join(graphs_dir, 'graph-2.graph'), [b'OIDF', b'CDAT', b'GDA2'])
+        with open(os.path.join(graphs_dir, 'commit-graph-chain'), mode='w', encoding='ascii') as chain:
+            chain.write('1\n2\n')
+
+        # When inspecting the repository
+        status = self.maintenance.get_status()
+
+        # It is expected that generation data is present, but Bloom filters are not complete
+        self.assertEqual(2, status.layers)
+        self.assertTrue(status.generation)
+        self.assertFalse(status.bloom)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import time
+import tracemalloc
+import unittest
+from unittest.mock import MagicMock, patch
+
+from core.memory import MemoryAccountant
+from core.tests.factory import GitObserverFactory
+
+
+class MemoryAccountantTest(unittest.TestCase):
+    """
+    UnitTest class to test growth reports and memory budget of long running observations
+    """
+
+    def tearDown(self):
+        tracemalloc.stop()
+
+    def test_report_growth(self):
+        """
+        Test if the site memory grew at between two snapshots is logged
+        :return: None
+        """
+        # Given is an accountant taking a snapshot every iteration
+        logger = MagicMock()
+        accountant = MemoryAccountant(logger, interval=1, top=3)
+        accountant.start()
+        accountant.account()
+
+        # When an iteration allocates memory
+        retained = [str(number) * 10 for number in range(10000)]
+        accountant.account()
+
+        # It is expected that this test file is reported as growth site
+        messages = [call.args[0] for call in logger.info.call_args_list]
+        self.assertTrue(any('test_memory.py' in message for message in messages), messages)
+        self.assertEqual(10000, len(retained))
+
+    @patch.object(MemoryAccountant, 'get_usage', return_value=200 * 1024 * 1024)
+    def test_budget(self, _):
+        """
+        Test if exceeding the budget requests eviction of a share getting below low water
+        :return: None
+        """
+        # Given is an accountant with a budget of 100 MiB, while 200 MiB are traced
+        accountant = MemoryAccountant(MagicMock(), budget_mb=100, interval=0)
+
+        # When accounting an iteration
+        share = accountant.account()
+
+        # It is expected that 60 % are evicted, reaching 80 % of budget
+        self.assertAlmostEqual(0.6, share)
+        self.assertEqual(1, accountant.evictions)
+
+        # And that nothing is evicted within budget
+        accountant.budget = 300 * 1024 * 1024
+        self.assertEqual(0.0, accountant.account())
+
+    def test_evict_known(self):
+        """
+        Test if observer only forgets commits seen before the observed time span
+        :return: None
+        """
+        # Given is an observer knowing a commit seen two weeks ago and one seen now
+        observer = GitObserverFactory.create_default()
+        now = time.time()
+        observer.known_hashes = {b'old': now - 14 * 24 * 3600, b'new': now}
+
+        # When evicting
+        evicted = observer.evict_known()
+
+        # It is expected that only the old commit got forgotten
+        self.assertEqual(1, evicted)
+        self.assertEqual([b'new'], list(observer.known_hashes))
+
+    def test_shed_known(self):
+        """
+        Test if an observer exceeding its budget without subscribers of OnMemoryExceeded frees known commits
+        :return: None
+        """
+        # Given is an observer within an iteration, knowing many commits seen within the observed time span
+        observer = GitObserverFactory.create_default()
+        observer.load_observations()
+        observer.memory = MemoryAccountant(MagicMock(), interval=0)
+        observer.memory.start()
+        now = time.time()
+        observer.known_hashes = {number.to_bytes(20, 'big'): now for number in range(100000)}
+        usage = MemoryAccountant.get_usage()
+
+        # When its budget is half of the traced memory at the end of the iteration
+        observer.memory.budget = usage // 2
+        observer.complete_poll()
+
+        # It is expected that the oldest known commits are forgotten, which frees memory below budget
+        self.assertAlmostEqual(40000, len(observer.known_hashes), delta=1000)
+        self.assertIn((99999).to_bytes(20, 'big'), observer.known_hashes)
+        self.assertLess(MemoryAccountant.get_usage(), observer.memory.budget)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+
+import core.paths
+from core.metrics import Histogram, ObserverMetrics, PollMetrics
+from core.tests.factory import GitObserverFactory
+
+c_paths = core.paths.Paths()
+
+
+class MetricsTest(unittest.TestCase):
+    """
+    UnitTest class to test per-poll metrics and their Prometheus textfile export
+    """
+
+    def test_histogram_cumulative(self):
+        """
+        Test if buckets count all observations less or equal to their bound
+        :return: None
+        """
+        # Given is a histogram with two buckets
+        histogram = Histogram((0.1, 1.0))
+
+        # When observing durations below, on and above the bounds
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        # It is expected that counts are cumulative and end with all observations
+        self.assertEqual([('0.1', 2), ('1.0', 3), ('+Inf', 4)], list(histogram.get_cumulative()))
+        self.assertEqual(4, histogram.count)
+        self.assertAlmostEqual(2.65, histogram.sum)
+
+    def test_textfile(self):
+        """
+        Test if recorded polls are written as Prometheus textfile, replacing the previous one
+        :return: None
+        """
+        # Given is a poll, which read one folder and rejected one of two new commits
+        poll = PollMetrics()
+        poll.add('log', 0.2)
+        poll.folders['core'] = 0.2
+        poll.commits_seen, poll.commits_new, poll.commits_ignored = 5, 2, 1
+        poll.git_processes = 3
+        poll.finish()
+
+        with tempfile.TemporaryDirectory() as directory:
+            textfile = os.path.join(directory, 'observer.prom')
+            metrics = ObserverMetrics('/srv/"repo"', textfile)
+
+            # When recording it twice
+            metrics.record(poll)
+            metrics.record(poll)
+            with open(textfile, 'r', encoding='utf-8') as file:
+                content = file.read()
+
+            # It is expected that no temporary file is left behind
+            self.assertEqual(['observer.prom'], os.listdir(directory))
+
+        # And that counters are summed up, labels escaped and histograms complete
+        self.assertIn('git_observer_polls_total{repository="/srv/\\"repo\\""} 2\n', content)
+        self.assertIn('git_observer_commits_total{repository="/srv/\\"repo\\"",state="ignored"} 2\n', content)
+        self.assertIn('git_observer_git_processes_total{repository="/srv/\\"repo\\""} 6\n', content)
+        self.assertIn('git_observer_phase_duration_seconds_bucket{repository="/srv/\\"repo\\"",'
+                      'phase="log",le="0.25"} 2\n', content)
+        self.assertIn('git_observer_folder_log_duration_seconds_count{repository="/srv/\\"repo\\"",'
+                      'folder="core"} 2\n', content)
+        self.assertIn('# TYPE git_observer_last_poll_timestamp_seconds gauge\n', content)
+
+    def test_textfile_unwritable(self):
+        """
+        Test if a textfile that can not be written does not fail the iteration
+        :return: None
+        """
+        # Given is an export to a folder that does not exist
+        with tempfile.TemporaryDirectory() as directory:
+            metrics = ObserverMetrics('/srv/repo', os.path.join(directory, 'missing', 'observer.prom'))
+
+            # When recording a poll
+            with self.assertLogs('core.metrics', level='WARNING'):
+                metrics.record(PollMetrics())
+
+            # It is expected that it was counted anyway and nothing was written
+            self.assertEqual(1, metrics.polls)
+            self.assertEqual([], os.listdir(directory))
+
+    def test_observer_metrics(self):
+        """
+        Test if an observer iteration contributes its metrics to subscribers of OnMetrics
+        :return: None
+        """
+        # Given is a default GitObserver provided by GitObserverFactory, subscribed to OnMetrics
+        observer = GitObserverFactory.create_default()
+        polls: list[PollMetrics] = []
+        observer.OnMetrics += polls.append
+
+        # Reading the file line count of dummy file represents expected commits seen
+        with open(c_paths.GITLOG_DUMMY, 'rb') as dummy_file:
+            content = dummy_file.read()
+
+        # When running and completing an iteration
+        observer.load_observations()
+        observer.complete_poll()
+
+        # It is expected that subscribers received its metrics
+        self.assertEqual(1, len(polls))
+        poll = polls[0]
+        self.assertEqual(len(content.splitlines()), poll.commits_seen)
+        self.assertEqual(len(content), poll.bytes_read)
+        self.assertEqual(list(observer.logfolders), list(poll.folders))
+        self.assertGreaterEqual(poll.duration, poll.phases['log'] + poll.phases['parse'])
+        self.assertEqual(1, observer.metrics.polls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,9 +4,12 @@ Please note that there is no UnitTest validating the contents of parsed DUMMY fi
 of parsing functionality is done in a more reliable manner by using one commit line hard-coded in this file
 """
 import unittest
+from unittest.mock import patch
 
 from observer import GitObserver
 import core.paths
+from core.runner import FinishedProcess, RunResult
+from core.timeline import Timeline
 from core.tests.factory import GitObserverFactory
 from core.config.management import ConfigManager
 
@@ -81,7 +84,7 @@ class GitObserverTest(unittest.TestCase):
         """
         # Given is a default GitObserver provided by GitObserverFactory
         observer = GitObserverFactory.create_default()
-        observer.gitlog_dummy_file = c_paths.GITLOG_DUMMY_REDUNDANT
+        observer.runner.source.log_file = str(c_paths.GITLOG_DUMMY_REDUNDANT)
 
         # Reading the file line count of dummy file represents expected result count
         with open(c_paths.GITLOG_DUMMY_REDUNDANT, 'r') as dummy_file:
@@ -117,6 +120,59 @@ class GitObserverTest(unittest.TestCase):
             for cmt in obs.commits:
                 self.assertNotEqual(ignore_name, cmt.author, f'Configured to ignore {ignore_name} in log result')
 
+    def test_dummy_file_exclude_messages(self):
+        """
+        Tests if the configuration of excluded messages is applied
+        while reading dummy commits using default GitObserver
+        :return: None
+        """
+        # Given is the default configuration provided by ConfigFactory
+        config = ConfigManager.get_defaults()
+        # Modified to exclude all bugfixes
+        config.exclude_messages = ['[Bb]ugfix']
+        # Based on this a target test instance of GitObserver
+        observer = GitObserver(config, is_test_instance=True)
+
+        # When executing run function
+        observations = observer.load_observations()
+        # It is expected that only the bugfix of karl.mustermann is missing
+        self.assertEqual(4, len(observations[0].commits))
+        for cmt in observations[0].commits:
+            self.assertNotIn('Bugfix', cmt.message, 'Configured to exclude bugfixes in log result')
+
+    def test_timeline_tags_all_folders(self):
+        """
+        Tests if a commit touching several observed folders is reported for each of them in timeline mode,
+        so the timeline tags it with all its folders, while the column view still shows it once
+        :return: None
+        """
+        # Given are two observed folders, whose git log both return the commits of the dummy file
+        config = ConfigManager.get_defaults()
+        config.logfolders = ['a', 'b']
+        config.timeline = True
+        observer = GitObserver(config, is_test_instance=True)
+        timeline = Timeline(oldest_first=False)
+
+        # When observing and merging the observations into the timeline
+        observations = observer.load_observations()
+        entries = timeline.extend(observations)
+
+        # It is expected that every commit is tagged with both folders and counted as new once
+        self.assertEqual(5, len(entries))
+        self.assertEqual([['a', 'b']] * 5, [entry.folders for entry in entries])
+        self.assertEqual(5, observer.poll.commits_new)
+        self.assertEqual(0, observer.poll.commits_ignored)
+
+        # When observing again, or observing without timeline
+        config.timeline = False
+        column_observer = GitObserver(config, is_test_instance=True)
+        again = observer.load_observations()
+        columns = column_observer.load_observations()
+
+        # It is expected that known commits are not reported again, and a column view shows them once
+        self.assertEqual([[], []], [observation.commits for observation in again])
+        self.assertEqual([5, 0], [len(observation.commits) for observation in columns])
+
 
 class GitObserverLogCommandTest(unittest.TestCase):
     """
@@ -214,6 +270,104 @@ class GitObserverLogCommandTest(unittest.TestCase):
         self.assertIn(expected_ascending, git_log_command,
                       'Expected log log command with parameter ascending order')
 
+    def test_git_log_command_streaming(self):
+        """
+        Test if log command of GitObserver in streaming mode
+        lets git emit its natural order
+        :return: None
+        """
+        # Given is the default configuration provided by ConfigFactory
+        config = ConfigManager.get_defaults()
+        # Manipulated to stream
+        config.streaming = True
+        # Given is also target test instance of GitObserver
+        observer = GitObserver(config, is_test_instance=True)
+
+        # When building git log command by test instance
+        git_log_command = observer.get_git_log_cmd('Test')
+        # It is expected that the command contains no parameter forcing git to order
+        self.assertNotIn('--date-order', git_log_command, 'Expected no ordering in streaming mode')
+        self.assertNotIn('--reverse', git_log_command, 'Expected no ordering in streaming mode')
+
+    def test_streaming_order(self):
+        """
+        Test if commits read in streaming mode are ordered like
+        git would do by --reverse and --date-order
+        :return: None
+        """
+        # Given is the default configuration provided by ConfigFactory
+        config = ConfigManager.get_defaults()
+        # Manipulated to stream
+        config.streaming = True
+
+        for descending in [False, True]:
+            # Given is also target test instance of GitObserver
+            config.descending = descending
+            observer = GitObserver(config, is_test_instance=True)
+
+            # When reading the dummy commits
+            dates = [commit.date for commit in observer.read_git_commits('Test')]
+
+            # It is expected to receive them oldest first, or newest first when descending
+            self.assertEqual(sorted(dates, reverse=descending), dates)
+
+    def test_killed_log(self):
+        """
+        Test if the output of a killed git log is discarded, so its commits are read again next time
+        :return: None
+        """
+        # Given is a test instance of GitObserver, whose git log streams the dummy file before it gets killed
+        observer = GitObserverFactory.create_default()
+        # Within an iteration, which has not seen any commit yet
+        observer.load_observations()
+        observer.known_hashes.clear()
+        with open(c_paths.GITLOG_DUMMY, 'rb') as dummy_file:
+            killed = FinishedProcess(RunResult(-9, dummy_file.read(), timed_out=True))
+
+        # When handling the folder with the killed call, and again with a complete one
+        with patch.object(observer, 'get_git_log_bytes', return_value=killed):
+            truncated = observer.handle_observed_path('Test')
+        self.assertEqual({}, observer.known_hashes)
+        complete = observer.handle_observed_path('Test')
+
+        # It is expected that the commits are reported by the complete call only
+        self.assertEqual([], truncated)
+        self.assertGreater(len(complete), 0)
+
+    def test_failed_exclusion(self):
+        """
+        Test if an iteration is skipped, when listing the commits excluded by message failed
+        :return: None
+        """
+        # Given is a test instance of GitObserver, whose call listing excluded commits gets killed
+        observer = GitObserverFactory.create_default()
+        observer.filter_plan.exclude_args = ['--grep=WIP']
+        killed = RunResult(-9, timed_out=True)
+
+        # When running an iteration
+        with patch.object(observer.runner, 'run', return_value=killed):
+            observations = observer.load_observations()
+
+        # It is expected that no commit was read, so all of them are read by the next iteration
+        self.assertEqual([], observations)
+        self.assertEqual({}, observer.known_hashes)
+
+    def test_failed_show(self):
+        """
+        Test if a failed git show returns its error instead of empty details
+        :return: None
+        """
+        # Given is a test instance of GitObserver, whose git show fails
+        observer = GitObserverFactory.create_default()
+        failed = RunResult(128, stderr="fatal: bad object 3a2f6a6a8e1\n")
+
+        # When requesting the details of a commit
+        with patch.object(observer.runner, 'run', return_value=failed):
+            details = observer.get_git_show('3a2f6a6a8e1')
+
+        # It is expected to receive the error of git
+        self.assertEqual('Git show failed: fatal: bad object 3a2f6a6a8e1', details)
+
 
 class GitObserverShowCommandTest(unittest.TestCase):
 
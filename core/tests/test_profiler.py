@@ -0,0 +1,73 @@
+import os
+import tempfile
+import time
+import unittest
+from threading import Event as ThreadEvent, Thread
+
+from core.profiler import ObserverProfiler, SamplingProfiler
+from core.tests.factory import GitObserverFactory
+
+
+def spin(stop: ThreadEvent):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class ProfilerTest(unittest.TestCase):
+    """
+    UnitTest class to test the sampling profiler and the profile files of observer iterations
+    """
+
+    def test_sampling(self):
+        """
+        Test if stacks of other threads are sampled, rooted at their thread name
+        :return: None
+        """
+        # Given is a thread busy in function spin
+        stop = ThreadEvent()
+        thread = Thread(target=spin, args=(stop,), name='Spinner', daemon=True)
+        thread.start()
+
+        # When sampling it for a while
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        time.sleep(0.2)
+        profiler.stop()
+        stop.set()
+        thread.join()
+
+        # It is expected that its stack was collected in collapsed format
+        self.assertGreater(profiler.samples, 0)
+        spinner_stacks = [stack for stack in profiler.stacks if stack.startswith('Spinner;')]
+        self.assertTrue(spinner_stacks, 'Expected samples of spinning thread')
+        self.assertTrue(any('test_profiler.py:spin' in stack for stack in spinner_stacks))
+        # And that the profiler did not sample itself
+        self.assertFalse(any(stack.startswith('SamplingProfiler;') for stack in profiler.stacks))
+
+    def test_observer_profile(self):
+        """
+        Test if profiling observer iterations writes pstats and collapsed stacks
+        :return: None
+        """
+        # Given is a default GitObserver provided by GitObserverFactory
+        observer = GitObserverFactory.create_default()
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'profiles', 'run')
+
+            # When profiling two iterations
+            with ObserverProfiler(output) as profiler:
+                for _ in range(2):
+                    observer.load_observations()
+            files = profiler.save()
+
+            # It is expected that both files are written, creating their folder
+            self.assertEqual([f'{output}.collapsed', f'{output}.pstats'], files)
+            self.assertTrue(os.path.isfile(files[0]))
+            self.assertGreater(os.path.getsize(files[1]), 0)
+            # And that hot functions are reported by cProfile
+            self.assertIn('load_observations', profiler.format_top())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import os
+import pathlib
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from core.config.management import ConfigManager
+from core.replay import FixtureSet, ReplayRunner, SyntheticRepository
+from core.tests.factory import RepositoryFactory
+from core.transport import ObservationUtil
+from observer import GitObserver
+
+
+class ReplayTest(unittest.TestCase):
+    """
+    UnitTest class to test serving recorded and synthetic git outputs
+    """
+    ORIGIN: str = 'https://github.com/worstprgr/git-observer/commit/'
+
+    @staticmethod
+    def get_log_cmd(folder: str, *args: str) -> list[str]:
+        """
+        Builds a git log call like the observer does
+        :param folder: observed folder
+        :param args: further arguments
+        :return: argument list
+        """
+        return ['git', '--git-dir=/repo/.git/', '--work-tree=/repo', 'log', *args, f'/repo/{folder}']
+
+    def test_fixture_roundtrip(self):
+        """
+        Test if recorded outputs are replayed per call and fall back to the file of their command
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Given is a fixture set with a recorded log of folder core
+            FixtureSet(directory).write(self.get_log_cmd('core/config'), b'"core log"\n', 0.25)
+            FixtureSet(directory).write(['git', 'fetch', '--all'], b'', 1.5)
+
+            # When replaying from a new instance
+            fixtures = FixtureSet(directory)
+
+            # It is expected to serve output and duration of the recorded call
+            self.assertEqual(b'"core log"\n', fixtures.read(self.get_log_cmd('core/config', '--reverse')))
+            self.assertEqual(0.25, fixtures.get_duration(self.get_log_cmd('core/config')))
+            self.assertEqual(1.5, fixtures.get_duration(['git', 'fetch']))
+            self.assertEqual(b'', fixtures.read(self.get_log_cmd('doc')))
+
+    def test_observer_roundtrip(self):
+        """
+        Test if an observation excluding messages is replayed like it was recorded,
+        while the log calls not limited to a folder never serve the log of a folder
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as repository, tempfile.TemporaryDirectory() as fixtures:
+            # Given is an observation of a repository excluding work in progress, recorded as fixtures
+            RepositoryFactory.git(repository, 'init', '--quiet', '--initial-branch=main')
+            pathlib.Path(repository, 'core').mkdir()
+            for number, message in enumerate(['Feature one', 'WIP two', 'Feature three']):
+                pathlib.Path(repository, 'core', f'{number}.txt').write_text(message)
+                RepositoryFactory.git(repository, 'add', '.')
+                RepositoryFactory.git(repository, 'commit', '--quiet', f'--message={message}')
+            config = ConfigManager.get_defaults()
+            config.filepath = repository
+            config.logfolders = ['core']
+            config.exclude_messages = ['WIP']
+            config.record = fixtures
+            recorded = GitObserver(config).load_observations()
+
+            # When replaying it, along with a folder which was not recorded
+            config.record = ''
+            config.replay = fixtures
+            config.logfolders = ['core', 'other']
+            replayed = GitObserver(config).load_observations()
+
+            # It is expected to observe the same commits, and nothing in the unknown folder
+            self.assertEqual(['Feature one', 'Feature three'], sorted(cmt.message for cmt in recorded[0].commits))
+            self.assertEqual(['Feature one', 'Feature three'], sorted(cmt.message for cmt in replayed[0].commits))
+            self.assertEqual([], replayed[1].commits)
+            self.assertFalse(os.path.isfile(os.path.join(fixtures, 'log.out')))
+
+    def test_synthetic_log(self):
+        """
+        Test if a synthetic repository spreads commits across folders and respects the order
+        :return: None
+        """
+        # Given is a synthetic repository of 10 commits in 3 folders
+        repository = SyntheticRepository(commits=10, folders=3, end=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+        # When reading the log of folder 0 in both orders
+        newest_first = repository.read(self.get_log_cmd('folder0')).splitlines()
+        oldest_first = repository.read(self.get_log_cmd('folder0', '--reverse')).splitlines()
+
+        # It is expected to receive every third commit, parseable by the observer
+        self.assertEqual(4, len(newest_first))
+        self.assertEqual(newest_first, list(reversed(oldest_first)))
+        commits = [ObservationUtil.parse_commit_formatted(line.decode('utf-8')[1:-1], self.ORIGIN)
+                   for line in newest_first]
+        self.assertEqual(['Change 0 in folder0', 'Change 3 in folder0', 'Change 6 in folder0', 'Change 9 in folder0'],
+                         [commit.message for commit in commits])
+        self.assertTrue(commits[0].date > commits[1].date)
+        # Its simulated duration grows with the number of commits
+        self.assertEqual(4 * repository.LOG_DURATION_PER_COMMIT, repository.get_duration(self.get_log_cmd('folder0')))
+
+        # And that git show answers for generated ids only
+        show = repository.read(['git', 'show', '--pretty=fuller', '-s', commits[1].sha1]).decode('utf-8')
+        self.assertTrue(show.startswith(f'commit {commits[1].sha1}'))
+        self.assertEqual(b'', repository.read(['git', 'show', '0' * 40]))
+
+    def test_runner_stream(self):
+        """
+        Test if replayed calls are streamed and recorded in the metrics like real calls
+        :return: None
+        """
+        # Given is a runner replaying a synthetic repository
+        runner = ReplayRunner(SyntheticRepository.parse('commits=1000,folders=10'))
+
+        # When streaming a log
+        with runner.stream(self.get_log_cmd('folder1')) as stream:
+            lines = iter(stream.readline, b'')
+            count = sum(1 for _ in lines)
+
+        # It is expected to read all commits of folder and to record one call
+        self.assertEqual(100, count)
+        self.assertEqual(1, runner.metrics['log'].calls)
+        with self.assertRaises(ValueError):
+            SyntheticRepository.parse('commits')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import sys
+import time
+import unittest
+from threading import Event as ThreadEvent, Thread, Timer
+
+from core.governor import ResourceGovernor
+from core.runner import CancelToken, GitRunner
+
+
+class GitRunnerTest(unittest.TestCase):
+    """
+    UnitTest class to test timeouts, cancellation and metrics of the git runner.
+    Python itself stands in for git, so tests do not depend on a repository
+    """
+    SLEEP: list[str] = [sys.executable, '-c', 'import time; time.sleep(10)']
+    ECHO: list[str] = [sys.executable, '-c', 'print("line 1"); print("line 2")']
+    STALL: list[str] = [sys.executable, '-u', '-c', 'import time; print("line 1"); time.sleep(10)']
+
+    def test_get_command(self):
+        """
+        Test if the git command is found behind global options
+        :return: None
+        """
+        self.assertEqual('log', GitRunner.get_command(['git', '-c', 'core.commitGraph=false', '--git-dir=x', 'log']))
+        self.assertEqual('fetch', GitRunner.get_command(['git', 'fetch', '--all']))
+
+    def test_run_output(self):
+        """
+        Test if output of a call is captured and its duration recorded
+        :return: None
+        """
+        # Given is a runner
+        runner = GitRunner()
+
+        # When running a call to its end
+        result = runner.run(self.ECHO)
+
+        # It is expected to receive its output and one recorded call
+        self.assertTrue(result.ok)
+        self.assertEqual(b'line 1\nline 2\n', result.stdout.replace(b'\r\n', b'\n'))
+        self.assertEqual(1, runner.metrics['git'].calls)
+
+    def test_run_timeout(self):
+        """
+        Test if a call exceeding its timeout gets killed
+        :return: None
+        """
+        # Given is a runner with short timeout
+        runner = GitRunner(timeout=0.2)
+
+        # When running a call that does not finish in time
+        start = time.perf_counter()
+        result = runner.run(self.SLEEP)
+
+        # It is expected that the call was killed and counted as timed out
+        self.assertTrue(result.timed_out)
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertEqual(1, runner.metrics['git'].timeouts)
+
+    def test_stream(self):
+        """
+        Test if a streamed call can be read line by line and gets reaped
+        :return: None
+        """
+        # Given is a runner
+        runner = GitRunner()
+
+        # When reading a streamed call
+        with runner.stream(self.ECHO) as stream:
+            lines = [line.strip() for line in stream]
+
+        # It is expected to receive all lines and one recorded call
+        self.assertEqual([b'line 1', b'line 2'], lines)
+        self.assertEqual(1, runner.metrics['git'].calls)
+
+    def test_stream_timeout(self):
+        """
+        Test if a streamed call killed by timeout is reported as such after reading its output
+        :return: None
+        """
+        # Given is a runner with short timeout
+        runner = GitRunner(timeout=0.3)
+
+        # When reading a streamed call, which stalls after its first line
+        process = runner.stream(self.STALL)
+        with process as stream:
+            lines = [line.strip() for line in stream]
+
+        # It is expected to receive the truncated output and a result telling it
+        self.assertEqual([b'line 1'], lines)
+        self.assertTrue(process.result.timed_out)
+        self.assertFalse(process.result.ok)
+
+    def test_cancel(self):
+        """
+        Test if a token kills its call and kill_all stops the runner
+        :return: None
+        """
+        # Given is a runner and a long-running call bound to a token
+        runner = GitRunner()
+        token = CancelToken()
+        results = []
+        worker = Thread(target=lambda: results.append(runner.run(self.SLEEP, token=token)))
+        worker.start()
+        time.sleep(0.5)
+
+        # When cancelling the token
+        token.cancel()
+        worker.join(5)
+
+        # It is expected that the call ended unsuccessfully
+        self.assertFalse(worker.is_alive())
+        self.assertFalse(results[0].ok)
+
+        # And that a stopped runner refuses new calls
+        runner.kill_all()
+        self.assertFalse(runner.run(self.ECHO).ok)
+
+    def test_duration_without_wait(self):
+        """
+        Test if the duration of a call does not include waiting for a free slot
+        :return: None
+        """
+        # Given is a runner whose single slot is taken by another call for half a second
+        governor = ResourceGovernor(max_concurrent=1)
+        runner = GitRunner(governor)
+        governor.acquire(ThreadEvent())
+        timer = Timer(0.5, governor.release)
+        timer.start()
+
+        # When running a call
+        start = time.perf_counter()
+        result = runner.run(self.ECHO)
+        elapsed = time.perf_counter() - start
+
+        # It is expected that the call waited, but its duration is the one of the process
+        self.assertGreaterEqual(elapsed, 0.5)
+        self.assertLess(result.duration, elapsed - 0.4)
+
+    def test_stopped_after_acquire(self):
+        """
+        Test if a runner stopped between acquiring a slot and spawning git refuses the call and frees the slot
+        :return: None
+        """
+        # Given is a runner with a single slot, which gets stopped right after a call acquired it
+        governor = ResourceGovernor(max_concurrent=1)
+        runner = GitRunner(governor)
+        acquire = runner.acquire
+
+        def acquire_and_stop(urgent: bool = False) -> bool:
+            acquired = acquire(urgent)
+            runner.kill_all()
+            return acquired
+        runner.acquire = acquire_and_stop
+
+        # When running and streaming a call
+        result = runner.run(self.ECHO)
+        process = runner.stream(self.ECHO)
+        with process as stdout:
+            output = stdout.read()
+
+        # It is expected that both calls are refused without an error
+        self.assertEqual('Git runner is stopped', result.stderr)
+        self.assertEqual('Git runner is stopped', process.result.stderr)
+        self.assertEqual(b'', output)
+
+        # And that the slot is free again
+        stop = ThreadEvent()
+        timer = Timer(2, stop.set)
+        timer.start()
+        self.assertTrue(governor.acquire(stop))
+        timer.cancel()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from datetime import datetime
+
+from core.search import CommitIndex
+from core.transport import Commit
+
+
+class CommitIndexTest(unittest.TestCase):
+    """
+    UnitTest class to test the inverted trigram index of commits
+    """
+    OTTO_SHA1: str = '0000000000000000000000000000000000000001'
+    SUSI_SHA1: str = '0000000000000000000000000000000000000002'
+    KARL_SHA1: str = '0000000000000000000000000000000000000005'
+    ANNA_SHA1: str = '0000000000000000000000000000000000000006'
+
+    def create_index(self) -> CommitIndex:
+        """
+        Creates an index of three entries having different authors, messages and branches
+        :return: filled CommitIndex
+        """
+        index = CommitIndex()
+        index.add('R0', [Commit('otto.mustermann', datetime.now(), 'Ottos feature', self.OTTO_SHA1,
+                                'origin/dev/Issue-1234-ui-improvements')])
+        index.add('R1', [None, Commit('susi.mustermann', datetime.now(), 'Susis feature', self.SUSI_SHA1,
+                                      'origin/dev/Issue-1235-ui-improving-improvements')])
+        index.add('R2', [Commit('karl.mustermann', datetime.now(), 'Karls Bugfix', self.KARL_SHA1,
+                                'origin/bugs/Issue-1237-flickering-when-button-pushed')])
+        return index
+
+    def test_search_fields(self):
+        """
+        Test if author, message, branch and SHA1 are searchable case-insensitive
+        :return: None
+        """
+        # Given is a filled index
+        index = self.create_index()
+
+        # When searching for each field
+        by_author = index.search('SUSI')
+        by_message = index.search('bugfix')
+        by_branch = index.search('issue-1234')
+        by_sha1 = index.search(self.KARL_SHA1)
+
+        # It is expected that the matching entry is found
+        self.assertEqual({'R1'}, by_author)
+        self.assertEqual({'R2'}, by_message)
+        self.assertEqual({'R0'}, by_branch)
+        self.assertEqual({'R2'}, by_sha1)
+
+    def test_search_all_tokens(self):
+        """
+        Test if every token of query needs to match
+        :return: None
+        """
+        # Given is a filled index
+        index = self.create_index()
+
+        # When searching for two tokens, matching different entries each
+        result = index.search('feature otto')
+
+        # It is expected that only the entry containing both is found
+        self.assertEqual({'R0'}, result)
+
+    def test_search_short_token(self):
+        """
+        Test if tokens shorter than a trigram are matched as well
+        :return: None
+        """
+        # Given is a filled index
+        index = self.create_index()
+
+        # When searching for a two character token
+        result = index.search('ka')
+
+        # It is expected that the entry is found without trigram support
+        self.assertEqual({'R2'}, result)
+
+    def test_incremental_refinement(self):
+        """
+        Test if entries added after a search are considered
+        when the search is refined
+        :return: None
+        """
+        # Given is a filled index that was searched already
+        index = self.create_index()
+        index.search('feat')
+
+        # When adding another matching entry and refining the query
+        index.add('R3', [Commit('anna.mustermann', datetime.now(), 'Annas feature', self.ANNA_SHA1)])
+        result = index.search('feature')
+
+        # It is expected that the new entry is part of the refined result
+        self.assertEqual({'R0', 'R1', 'R3'}, result)
+
+    def test_remove(self):
+        """
+        Test if removed entries are not found anymore and
+        their postings are cleaned up
+        :return: None
+        """
+        # Given is a filled index
+        index = self.create_index()
+
+        # When removing all entries
+        for key in ['R0', 'R1', 'R2']:
+            index.remove(key)
+
+        # It is expected that nothing is found and no postings are left
+        self.assertEqual(set(), index.search('mustermann'))
+        self.assertEqual(0, len(index.postings))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from core.config.management import ConfigManager
+from core.store import ObservationStore
+from core.transport import Commit
+from observer import GitObserver
+
+
+class ObservationStoreTest(unittest.TestCase):
+    """
+    UnitTest class to test the persistent observation store
+    """
+    OTTO_SHA1: str = '0000000000000000000000000000000000000001'
+    SUSI_SHA1: str = '0000000000000000000000000000000000000002'
+    KARL_SHA1: str = '0000000000000000000000000000000000000005'
+    REPO: str = '/repo'
+    START: datetime = datetime.fromisoformat('2024-01-01T00:00:00+01:00')
+
+    def create_store(self) -> ObservationStore:
+        """
+        Creates an in-memory store holding three commits of two folders and authors
+        :return: filled ObservationStore
+        """
+        store = ObservationStore(':memory:')
+        otto = Commit('otto.mustermann', self.START, 'Ottos feature', self.OTTO_SHA1, 'origin/dev')
+        susi = Commit('susi.mustermann', self.START + timedelta(hours=1), 'Susis feature', self.SUSI_SHA1)
+        karl = Commit('karl.mustermann', self.START + timedelta(hours=2), 'Karls Bugfix', self.KARL_SHA1)
+        store.save(self.REPO, 'core', [otto, susi])
+        store.save(self.REPO, 'doc', [karl])
+        return store
+
+    def test_warm_start(self):
+        """
+        Test if known commits are loaded per repository
+        :return: None
+        """
+        # Given is a filled store
+        store = self.create_store()
+
+        # When loading hashes of stored and unknown repository
+        hashes = store.load_hashes(self.REPO)
+        unknown = store.load_hashes('/other')
+
+        # It is expected to receive all commits of stored repository only
+        self.assertEqual({self.OTTO_SHA1, self.SUSI_SHA1, self.KARL_SHA1}, {oid.hex() for oid in hashes})
+        self.assertEqual(set(), unknown)
+
+    def test_observer_warm_start(self):
+        """
+        Test if an observer restarted with a store knows stored commits,
+        but still observes the whole time span to report commits pushed late
+        :return: None
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Given is a store filled by a previous observation of the repository
+            config = ConfigManager.get_defaults()
+            config.filepath = str(config.filepath)
+            config.store = os.path.join(directory, 'observations.db')
+            store = ObservationStore(config.store)
+            now = datetime.now().astimezone()
+            store.save(config.filepath, 'core', [Commit('karl', now, 'Karls Bugfix', self.KARL_SHA1),
+                                                 Commit('otto', now - timedelta(weeks=2), 'Ottos feature', self.OTTO_SHA1)])
+            store.close()
+
+            # When restarting the observer
+            observer = GitObserver(config, is_test_instance=True)
+            cmd = observer.get_git_log_cmd('core')
+            observer.store.close()
+
+        # It is expected that stored commits of the observed time span are known and the time span is not narrowed
+        self.assertIn(bytes.fromhex(self.KARL_SHA1), observer.known_hashes)
+        self.assertNotIn(bytes.fromhex(self.OTTO_SHA1), observer.known_hashes)
+        self.assertIn(f'--since="{observer.since}"', cmd)
+
+    def test_retention(self):
+        """
+        Test if saving prunes commits older than the retention and
+        loading hashes is limited to the given time span
+        :return: None
+        """
+        # Given is a store keeping commits of ten days, holding one commit of twenty days ago
+        store = ObservationStore(':memory:', timedelta(days=10))
+        now = datetime.now().astimezone()
+        store.save(self.REPO, 'core', [Commit('otto.mustermann', now - timedelta(days=20), 'Old', self.OTTO_SHA1)])
+
+        # When saving a commit of five days ago and one of now
+        store.save(self.REPO, 'core', [Commit('susi.mustermann', now - timedelta(days=5), 'Recent', self.SUSI_SHA1),
+                                       Commit('karl.mustermann', now, 'New', self.KARL_SHA1)])
+
+        # It is expected that the old commit is pruned and only the newest is loaded for the last day
+        self.assertEqual([self.KARL_SHA1, self.SUSI_SHA1], [result.commit.sha1 for result in store.query(self.REPO)])
+        self.assertEqual({self.KARL_SHA1}, {oid.hex() for oid in store.load_hashes(self.REPO, now - timedelta(days=1))})
+
+    def test_query(self):
+        """
+        Test if queries by folder, author and time range
+        return matching commits newest first
+        :return: None
+        """
+        # Given is a filled store
+        store = self.create_store()
+
+        # When querying by each criteria
+        by_folder = store.query(self.REPO, folder='core')
+        by_author = store.query(author='karl.mustermann')
+        by_range = store.query(since=self.START + timedelta(minutes=30), until=self.START + timedelta(hours=1))
+        limited = store.query(limit=1)
+
+        # It is expected to receive matching commits only
+        self.assertEqual([self.SUSI_SHA1, self.OTTO_SHA1], [result.commit.sha1 for result in by_folder])
+        self.assertEqual(['doc'], [result.folder for result in by_author])
+        self.assertEqual([self.SUSI_SHA1], [result.commit.sha1 for result in by_range])
+        self.assertEqual([self.KARL_SHA1], [result.commit.sha1 for result in limited])
+        self.assertEqual('origin/dev', by_folder[1].commit.branch)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+from datetime import datetime, timedelta
+
+from core.timeline import Timeline
+from core.transport import Commit, Observation
+
+
+class TimelineTest(unittest.TestCase):
+    """
+    UnitTest class to test the k-way merge of per folder commits into one timeline
+    """
+    START: datetime = datetime.fromisoformat('2024-01-01T00:00:00+01:00')
+
+    def create_commit(self, minute: int, sha1: str = None) -> Commit:
+        """
+        Creates a commit at given minute after START
+        :param minute: minutes after START
+        :param sha1: [Optional] SHA1, DEFAULT: derived from minute
+        :return: Commit
+        """
+        sha1 = sha1 if sha1 else f'{minute:040x}'
+        return Commit('otto.mustermann', self.START + timedelta(minutes=minute), f'Commit {minute}', sha1)
+
+    def test_merge_order(self):
+        """
+        Test if commits of several folders are merged in time order
+        :return: None
+        """
+        # Given are two folders with interleaving commits, oldest first
+        timeline = Timeline(oldest_first=True)
+        observations = [
+            Observation('a', [self.create_commit(0), self.create_commit(2), self.create_commit(4)]),
+            Observation('b', [self.create_commit(1), self.create_commit(3)])
+        ]
+
+        # When merging them
+        delta = timeline.extend(observations)
+
+        # It is expected to receive all commits ordered by time, tagged with their folder
+        self.assertEqual([0, 1, 2, 3, 4], [entry.commit.date.minute for entry in delta])
+        self.assertEqual(['a', 'b', 'a', 'b', 'a'], [entry.folders[0] for entry in delta])
+
+    def test_merge_newest_first(self):
+        """
+        Test if commit lists sorted newest first are merged correctly
+        and returned oldest first
+        :return: None
+        """
+        # Given are two folders with commits sorted newest first
+        timeline = Timeline(oldest_first=False)
+        observations = [
+            Observation('a', [self.create_commit(3), self.create_commit(0)]),
+            Observation('b', [self.create_commit(2), self.create_commit(1)])
+        ]
+
+        # When merging them
+        delta = timeline.extend(observations)
+
+        # It is expected to receive all commits oldest first
+        self.assertEqual([0, 1, 2, 3], [entry.commit.date.minute for entry in delta])
+
+    def test_merge_tags_folders(self):
+        """
+        Test if a commit reported for several folders results in one entry
+        :return: None
+        """
+        # Given are two folders reporting the same commit
+        timeline = Timeline(oldest_first=True)
+        observations = [
+            Observation('a', [self.create_commit(0, 'ab' * 20)]),
+            Observation('b', [self.create_commit(0, 'ab' * 20)])
+        ]
+
+        # When merging them
+        delta = timeline.extend(observations)
+
+        # It is expected to receive one entry tagged with both folders
+        self.assertEqual(1, len(delta))
+        self.assertEqual(['a', 'b'], delta[0].folders)
+
+    def test_extend_incremental(self):
+        """
+        Test if a later delta containing an older commit
+        is merged into the right position of the timeline
+        :return: None
+        """
+        # Given is a timeline containing two commits
+        timeline = Timeline(oldest_first=True)
+        timeline.extend([Observation('a', [self.create_commit(0), self.create_commit(4)])])
+
+        # When extending it by a newer and an older commit
+        delta = timeline.extend([Observation('b', [self.create_commit(2), self.create_commit(6)])])
+
+        # It is expected that only new commits are returned and the whole timeline stays ordered
+        self.assertEqual([2, 6], [entry.commit.date.minute for entry in delta])
+        self.assertEqual([0, 2, 4, 6], [entry.commit.date.minute for entry in timeline])
+
+    def test_shed(self):
+        """
+        Test if shedding removes the oldest entries, so their commits are new again to the timeline
+        :return: None
+        """
+        # Given is a timeline containing four commits
+        timeline = Timeline(oldest_first=True)
+        timeline.extend([Observation('a', [self.create_commit(minute) for minute in range(4)])])
+
+        # When shedding a quarter of them
+        removed = timeline.shed(0.25)
+
+        # It is expected that the oldest entry is removed and merged again as new one
+        self.assertEqual(1, removed)
+        self.assertEqual([1, 2, 3], [entry.commit.date.minute for entry in timeline])
+        self.assertEqual(1, len(timeline.extend([Observation('a', [self.create_commit(0)])])))
+
+    def test_evict(self):
+        """
+        Test if entries exceeding the configured count or age are evicted, oldest first
+        :return: None
+        """
+        # Given is a timeline bounded to three entries
+        timeline = Timeline(oldest_first=True, max_entries=3)
+
+        # When extending it by five commits at once
+        timeline.extend([Observation('a', [self.create_commit(minute) for minute in range(5)])])
+
+        # It is expected that only the newest three are kept
+        self.assertEqual([2, 3, 4], [entry.commit.date.minute for entry in timeline])
+
+        # When additionally bounding the age and evicting two minutes after the newest commit
+        timeline.max_age = timedelta(minutes=2)
+        removed = timeline.evict(self.START + timedelta(minutes=6))
+
+        # It is expected that commits older than two minutes are gone as well
+        self.assertEqual(2, removed)
+        self.assertEqual([4], [entry.commit.date.minute for entry in timeline])
+
+
+if __name__ == '__main__':
+    unittest.main()
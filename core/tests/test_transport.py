@@ -12,7 +12,7 @@ class CommitParseFormattedTest(unittest.TestCase):
     COMMIT_AUTHOR: str = 'Pitcher Seven'
     COMMIT_DATE_STR: str = '2024-01-01T00:00:00+01:00'
     COMMIT_MSG: str = 'This is a so called "UnitTest"\nIt should ensure everything\r\nworks as \'\'expected'
-    COMMIT_SH1: str = '3a2f6a6a8e1'
+    COMMIT_SH1: str = '3a2f6a6a8e1c04b7d95e2f8a61c3b0d7e4f9a215'
     COMMIT_BRANCH: str = 'origin/unit-test-in-the-wild'
     DUMMY_COMMIT_LINE: str = (f'{COMMIT_AUTHOR}|{COMMIT_DATE_STR}|'
                               f'{COMMIT_MSG}|{COMMIT_SH1}|{COMMIT_BRANCH}')
@@ -81,6 +81,22 @@ class CommitParseFormattedTest(unittest.TestCase):
         self.assertEqual(commit_sha1, commit.sha1,
                          "Expected to receive same commit SHA1 like passed in commit defined")
 
+    def test_commit_parsing_oid(self):
+        """
+        Test if the full SHA1 is kept as raw bytes
+        and abbreviated for display only
+        :return: None
+        """
+        # Given is a SHA1 used in dummy commit message
+        commit_sha1 = self.COMMIT_SH1
+
+        # When parsing commit using static GitObserver parse function
+        commit = ObservationUtil.parse_commit_formatted(self.DUMMY_COMMIT_LINE)
+
+        # It is expected that the identifier is stored as 20 raw bytes and shown abbreviated
+        self.assertEqual(bytes.fromhex(commit_sha1), commit.oid)
+        self.assertEqual(commit_sha1[:Commit.ABBREV], commit.short_sha1)
+
     def test_commit_parsing_branch(self):
         """
         Test if optional commit branch name is transferred correctly to
@@ -155,7 +171,7 @@ class EmptyObservationTest(unittest.TestCase):
         filled_list: list[Observation] = [
             Observation("Test",
                         [
-                            Commit('Test', datetime.now(), 'Message', "ABC1234")
+                            Commit('Test', datetime.now(), 'Message', "ABC1234ABC1234ABC1234ABC1234ABC1234ABC12")
                         ])
         ]
 
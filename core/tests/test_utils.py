@@ -50,28 +50,36 @@ class TestTypeUtil(unittest.TestCase):
         """
         Tests if a string value got converted correctly, to a specific type.\n
         - String with commas -> converts into a stripped list
-        - Non-empty string -> converts into a positive boolean
+        - List -> is kept as it is
+        - 'true', '1' or 'yes' in any case -> converts into a positive boolean, any other string into a negative one
         - Digit as string -> converts into the corresponding integer
+        - Decimal as string -> converts into the corresponding float
         - Dummy Dict -> tests, if no conversion happened
         """
 
         # Given
         test_list = ' Hallo ,Hello, Hi, Yo', []
-        test_boolean = 'Test', True
+        test_parsed_list = ['Hallo', 'Hello'], []
+        test_booleans = ['True', 'yes', '1', ' TRUE ', 'False', 'no', '0', 'Test'], False
         test_int = '10', 1
+        test_float = '1.5', 0.0
         test_other_type = 2, {}
 
         # When
         convert_str_to_list = TypeUtil.parse_value(test_list[0], test_list[1])
-        convert_str_to_bool = TypeUtil.parse_value(test_boolean[0], test_boolean[1])
+        keep_list = TypeUtil.parse_value(test_parsed_list[0], test_parsed_list[1])
+        convert_str_to_bool = [TypeUtil.parse_value(value, test_booleans[1]) for value in test_booleans[0]]
         convert_str_to_int = TypeUtil.parse_value(test_int[0], test_int[1])
+        convert_str_to_float = TypeUtil.parse_value(test_float[0], test_float[1])
         # Unclear why this even works; expected is str, but we enter with int
         no_conversion = TypeUtil.parse_value(test_other_type[0], test_other_type[1])
 
         # Then
         self.assertEqual(['Hallo', 'Hello', 'Hi', 'Yo'], convert_str_to_list)
-        self.assertEqual(True, convert_str_to_bool)
+        self.assertEqual(['Hallo', 'Hello'], keep_list)
+        self.assertEqual([True, True, True, True, False, False, False, False], convert_str_to_bool)
         self.assertEqual(10, convert_str_to_int)
+        self.assertEqual(1.5, convert_str_to_float)
         self.assertEqual(2, no_conversion)
 
 
@@ -0,0 +1,85 @@
+import threading
+import unittest
+from datetime import datetime
+
+from core.tests.factory import CommitFactory, FakeTreeview, ViewerFactory
+from core.transport import Observation, ObservationEventArgs, ObservationUtil
+
+
+class CountingTreeview(FakeTreeview):
+    """
+    FakeTreeview counting all items ever inserted
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.inserted = 0
+
+    def insert(self, parent: str, index: int | str, iid: str, values: list[str]):
+        self.inserted += 1
+        super().insert(parent, index, iid, values)
+
+
+class GitObserverViewerTest(unittest.TestCase):
+    """
+    UnitTest class to test the virtualized rendering of the viewer without Tk window
+    """
+
+    def test_burst_materializes_window(self):
+        """
+        Test if a burst of rows larger than the window only creates items of the window
+        :return: None
+        """
+        # Given is a viewer with a window of 200 rows
+        viewer = ViewerFactory.create_viewer(['folder0'])
+        viewer.tv_commits = CountingTreeview()
+        commits = [ObservationUtil.parse_commit_formatted(line) for line in CommitFactory.create_lines(1000)]
+        now = datetime.now().astimezone()
+        for commit in commits:
+            commit.date = now
+
+        # When a cold poll renders 1000 rows at once
+        viewer.update_view([Observation('folder0', commits)])
+
+        # It is expected that only the window was ever inserted, newest first
+        self.assertEqual(1000, len(viewer.grid_store))
+        self.assertEqual(200, viewer.tv_commits.inserted)
+        self.assertEqual(200, viewer.view_count)
+        self.assertEqual([row.key for row in viewer.grid_store.window(0, 200)], list(viewer.tv_commits.get_children()))
+
+    def test_observer_events_rendered_on_ui_thread(self):
+        """
+        Test if observations loaded by the observer thread are only rendered by the UI thread's poll
+        :return: None
+        """
+        # Given is a viewer whose Tk scheduling is recorded
+        viewer = ViewerFactory.create_viewer(['folder0'])
+        scheduled = []
+        viewer.after = lambda delay_ms, callback, *args: scheduled.append((delay_ms, callback)) or 'after#1'
+        commits = [ObservationUtil.parse_commit_formatted(line) for line in CommitFactory.create_lines(3)]
+        now = datetime.now().astimezone()
+        for commit in commits:
+            commit.date = now
+
+        # When the observer thread loads observations and reports an exceeded memory budget
+        observer_thread = threading.Thread(target=lambda: (
+            viewer.observer_loaded(ObservationEventArgs([Observation('folder0', commits)])),
+            viewer.observer_memory_exceeded(0.0)))
+        observer_thread.start()
+        observer_thread.join()
+
+        # It is expected that neither Tk nor the rows are touched by the observer thread
+        self.assertEqual([], scheduled)
+        self.assertEqual((), viewer.tv_commits.get_children())
+
+        # When the UI thread polls
+        viewer.poll_observer()
+
+        # It is expected that the rows are rendered and the next poll is scheduled
+        self.assertEqual(3, len(viewer.tv_commits.get_children()))
+        self.assertEqual([(viewer.OBSERVER_POLL_MS, viewer.poll_observer)], scheduled)
+        self.assertEqual('after#1', viewer.observer_poll_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
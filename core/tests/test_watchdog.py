@@ -0,0 +1,92 @@
+import sys
+import time
+import unittest
+from threading import Thread
+
+from core.runner import GitRunner
+from core.watchdog import PollWatchdog
+
+
+class PollWatchdogTest(unittest.TestCase):
+    """
+    UnitTest class to test the watchdog killing git processes of stalled iterations.
+    Python itself stands in for a hanging git, so tests do not depend on a repository
+    """
+    HANG: list[str] = [sys.executable, '-c', 'import time; time.sleep(30)']
+
+    def test_stall(self):
+        """
+        Test if a call blocking an iteration beyond its deadline gets killed and reported
+        :return: None
+        """
+        # Given is a watchdog with a short deadline, armed for an iteration
+        runner = GitRunner()
+        statuses: list[str] = []
+        watchdog = PollWatchdog(runner, 0.3, statuses.append)
+        watchdog.arm()
+
+        # When the iteration runs a call hanging longer than the deadline
+        start = time.perf_counter()
+        with self.assertLogs('core.watchdog', level='ERROR') as logs:
+            result = runner.run(self.HANG)
+        watchdog.disarm()
+        watchdog.stop()
+
+        # It is expected that the call was killed, while the runner still accepts calls
+        self.assertFalse(result.ok)
+        self.assertLess(time.perf_counter() - start, 10)
+        self.assertFalse(runner.stopped)
+        # And that stacks were logged and the stall reported
+        self.assertEqual(1, watchdog.stalls)
+        self.assertIn('test_stall', logs.output[0])
+        self.assertEqual(['Iteration stalled for 0.3 s, killed 1 git process(es)'], statuses)
+
+    def test_other_threads(self):
+        """
+        Test if only the git processes of the stalled iteration get killed
+        :return: None
+        """
+        # Given is a call of another thread, e.g. commit-graph maintenance
+        runner = GitRunner()
+        results = []
+        maintenance = Thread(target=lambda: results.append(runner.run(self.HANG)), daemon=True)
+        maintenance.start()
+        time.sleep(0.2)
+
+        # When an iteration stalls in its own call
+        watchdog = PollWatchdog(runner, 0.3, lambda status: None)
+        watchdog.arm()
+        with self.assertLogs('core.watchdog', level='ERROR'):
+            stalled = runner.run(self.HANG)
+        watchdog.disarm()
+        watchdog.stop()
+
+        # It is expected that the call of the iteration was killed, but the other one still runs
+        self.assertFalse(stalled.ok)
+        self.assertTrue(maintenance.is_alive())
+        runner.kill_all()
+        maintenance.join(5)
+        self.assertFalse(results[0].ok)
+
+    def test_disarmed(self):
+        """
+        Test if iterations finishing in time are not reported
+        :return: None
+        """
+        # Given is a watchdog with a short deadline
+        statuses: list[str] = []
+        watchdog = PollWatchdog(GitRunner(), 0.2, statuses.append)
+
+        # When an iteration finishes before its deadline
+        watchdog.arm()
+        watchdog.disarm()
+        time.sleep(0.4)
+        watchdog.stop()
+
+        # It is expected that nothing was reported
+        self.assertEqual(0, watchdog.stalls)
+        self.assertEqual([], statuses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from threading import Event
+
+from core.worker import BackgroundTask
+
+
+class BackgroundTaskTest(unittest.TestCase):
+    """
+    UnitTest class to test BackgroundTask functionalities
+    """
+
+    def test_result(self):
+        """
+        Test if the return value of target is provided when done
+        :return: None
+        """
+        # Given is a task returning a constant
+        task = BackgroundTask(lambda: 'git show result')
+
+        # When running it to the end
+        task.start().wait(5)
+
+        # It is expected that the task is done and holds the result
+        self.assertTrue(task.done)
+        self.assertEqual('git show result', task.result)
+        self.assertIsNone(task.error)
+
+    def test_error(self):
+        """
+        Test if an exception of target is provided instead of raised
+        :return: None
+        """
+        # Given is a task failing with an exception
+        def fail():
+            raise RuntimeError('git not found')
+        task = BackgroundTask(fail)
+
+        # When running it to the end
+        task.start().wait(5)
+
+        # It is expected that the error is kept
+        self.assertIsInstance(task.error, RuntimeError)
+        self.assertIsNone(task.result)
+
+    def test_cancel(self):
+        """
+        Test if cancelling a running task calls the cancel handler
+        and discards the result
+        :return: None
+        """
+        # Given is a task blocking until released by its cancel handler
+        release = Event()
+        task = BackgroundTask(lambda: release.wait(5) and 'late result', on_cancel=release.set)
+        task.start()
+
+        # When cancelling while running
+        task.cancel()
+        task.wait(5)
+
+        # It is expected that the task finished without result
+        self.assertTrue(task.cancelled)
+        self.assertTrue(task.done)
+        self.assertIsNone(task.result)
+
+
+if __name__ == '__main__':
+    unittest.main()
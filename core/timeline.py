@@ -0,0 +1,137 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from core.transport import Commit, Observation
+
+
+class TimelineEntry:
+    """
+    One commit of the unified timeline and
+    all observed folders it was reported for
+    """
+    commit: Commit
+    folders: list[str]
+
+    def __init__(self, commit: Commit, folder: str):
+        """
+        Instantiates a new entry
+        :param commit: reported commit
+        :param folder: first folder the commit was reported for
+        """
+        self.commit = commit
+        self.folders = [folder]
+
+
+class Timeline:
+    """
+    Unified, time ordered view over all observed folders.
+    Per folder commit lists are already sorted by git, so they are combined
+    by a heap based k-way merge instead of sorting everything again.
+    Like GridStore, entries exceeding the configured size or age get evicted, oldest first
+    """
+    entries: list[TimelineEntry]
+    """
+    All entries, oldest first
+    """
+
+    def __init__(self, oldest_first: bool, max_entries: int = 0, max_age: timedelta | None = None):
+        """
+        Instantiates a new, empty timeline
+        :param oldest_first: TRUE when commits of an Observation are sorted oldest first, else newest first
+        :param max_entries: [Optional] maximum number of entries kept. 0 means unbounded
+        :param max_age: [Optional] maximum age of kept entries by commit date. None means unbounded
+        """
+        self.oldest_first = oldest_first
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.entries = []
+        self.__by_oid: dict[bytes, TimelineEntry] = dict()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[TimelineEntry]:
+        return iter(self.entries)
+
+    def merge(self, observations: list[Observation]) -> list[TimelineEntry]:
+        """
+        Merges the already sorted commits of all folders into one list.
+        A commit reported for several folders results in one entry tagged with all of them
+        :param observations: observation result of one iteration
+        :return: entries which are not part of timeline yet, oldest first
+        """
+        streams = [[(commit, folder.name) for commit in folder.commits] for folder in observations]
+        merged = heapq.merge(*streams, key=lambda item: item[0].date, reverse=not self.oldest_first)
+
+        delta: list[TimelineEntry] = []
+        for commit, folder in merged:
+            entry = self.__by_oid.get(commit.oid)
+            if entry:
+                if folder not in entry.folders:
+                    entry.folders.append(folder)
+                continue
+            entry = TimelineEntry(commit, folder)
+            self.__by_oid[commit.oid] = entry
+            delta.append(entry)
+
+        if not self.oldest_first:
+            delta.reverse()
+        return delta
+
+    def extend(self, observations: list[Observation]) -> list[TimelineEntry]:
+        """
+        Adds a new observation result to the timeline.
+        Usually the new entries are newer than all known ones and just get appended,
+        otherwise only the overlapping tail is merged again. Afterwards, entries out of bounds get evicted
+        :param observations: observation result of one iteration
+        :return: newly added entries, oldest first
+        """
+        delta = self.merge(observations)
+        if len(delta) == 0:
+            return delta
+
+        oldest = delta[0].commit.date
+        if len(self.entries) == 0 or self.entries[-1].commit.date <= oldest:
+            self.entries.extend(delta)
+        else:
+            pos = bisect_right(self.entries, oldest, key=lambda entry: entry.commit.date)
+            tail = self.entries[pos:]
+            self.entries[pos:] = heapq.merge(tail, delta, key=lambda entry: entry.commit.date)
+        self.evict()
+        return delta
+
+    def evict(self, now: datetime = None) -> int:
+        """
+        Removes the oldest entries as long as the timeline exceeds
+        either configured entry count or commit age
+        :param now: reference time point for age calculation. DEFAULT: now
+        :return: number of removed entries
+        """
+        count = 0
+        if self.max_entries > 0:
+            count = max(count, len(self.entries) - self.max_entries)
+        if self.max_age is not None:
+            oldest_allowed = (now if now else datetime.now().astimezone()) - self.max_age
+            count = max(count, bisect_left(self.entries, oldest_allowed, key=lambda entry: entry.commit.date))
+        return self.remove_oldest(count)
+
+    def shed(self, share: float) -> int:
+        """
+        Removes the given share of oldest entries, e.g. when memory budget is exceeded
+        :param share: share of entries between 0 and 1
+        :return: number of removed entries
+        """
+        return self.remove_oldest(int(len(self.entries) * share))
+
+    def remove_oldest(self, count: int) -> int:
+        """
+        Removes given number of oldest entries
+        :param count: number of entries
+        :return: number of removed entries
+        """
+        for entry in self.entries[:count]:
+            del self.__by_oid[entry.commit.oid]
+        del self.entries[:count]
+        return count
@@ -0,0 +1,198 @@
+from core.transport import Commit
+
+
+class ColumnGroup:
+    """
+    Observed folders sharing the same top level path prefix,
+    which may be collapsed into one single column
+    """
+    name: str
+    """
+    Shared path prefix
+    """
+
+    folders: list[int]
+    """
+    Indices of grouped folders in configured observation order
+    """
+
+    collapsed: bool
+    """
+    TRUE when group is shown as one column
+    """
+
+    def __init__(self, name: str, collapsed: bool = False):
+        self.name = name
+        self.folders = []
+        self.collapsed = collapsed
+
+
+class ColumnSpec:
+    """
+    Description of one folder column of the viewer grid.
+    Either represents one folder or a collapsed group of folders
+    """
+    title: str
+    folders: list[int]
+    group: ColumnGroup | None
+
+    def __init__(self, title: str, folders: list[int], group: ColumnGroup | None = None):
+        """
+        Instantiates a new column description
+        :param title: heading text
+        :param folders: indices of folders shown in this column
+        :param group: group this column belongs to, None if folder is not grouped
+        """
+        self.title = title
+        self.folders = folders
+        self.group = group
+
+
+class ColumnLayout:
+    """
+    Horizontal virtualization of folder columns.
+    Groups folders by their top level path prefix and only exposes a window
+    of columns, so the grid materializes what is on screen only
+    """
+    groups: list[ColumnGroup]
+    """
+    Folder groups in order of first occurrence
+    """
+
+    specs: list[ColumnSpec]
+    """
+    All columns after applying collapsed groups
+    """
+
+    offset: int
+    """
+    Index of first visible column in specs
+    """
+
+    def __init__(self, folders: list[str], visible: int, grouped: bool = False):
+        """
+        Instantiates a new layout for given folders
+        :param folders: observed folders in configured order
+        :param visible: maximum number of materialized folder columns
+        :param grouped: TRUE when folders sharing a path prefix start collapsed
+        """
+        self.folders = folders
+        self.visible = max(1, visible)
+        self.offset = 0
+        self.groups = self.get_groups(folders, grouped)
+        self.specs = []
+        self.update_specs()
+
+    @staticmethod
+    def get_prefix(folder: str) -> str:
+        """
+        Determines the top level path segment of given folder
+        :param folder: relative folder as configured
+        :return: prefix or folder itself, when not nested
+        """
+        parts = [part for part in folder.replace('\\', '/').split('/') if part and part != '.']
+        return parts[0] if parts else folder
+
+    @staticmethod
+    def get_groups(folders: list[str], collapsed: bool) -> list[ColumnGroup]:
+        """
+        Groups folders by their path prefix, keeping configured order
+        :param folders: observed folders
+        :param collapsed: initial collapse state of groups having several folders
+        :return: groups in order of first occurrence
+        """
+        groups: dict[str, ColumnGroup] = dict()
+        for idx, folder in enumerate(folders):
+            prefix = ColumnLayout.get_prefix(folder)
+            if prefix not in groups:
+                groups[prefix] = ColumnGroup(prefix, collapsed)
+            groups[prefix].folders.append(idx)
+        return list(groups.values())
+
+    def update_specs(self):
+        """
+        Rebuilds all column descriptions based on collapse state of groups
+        and keeps the window inside valid range
+        :return: None
+        """
+        specs: list[ColumnSpec] = []
+        for group in self.groups:
+            if len(group.folders) == 1:
+                specs.append(ColumnSpec(self.folders[group.folders[0]], group.folders))
+            elif group.collapsed:
+                specs.append(ColumnSpec(f'▸ {group.name}/* ({len(group.folders)})', group.folders, group))
+            else:
+                for idx in group.folders:
+                    specs.append(ColumnSpec(f'▾ {self.folders[idx]}', [idx], group))
+        self.specs = specs
+        self.offset = max(0, min(self.offset, len(self.specs) - self.visible))
+
+    def get_visible(self) -> list[ColumnSpec]:
+        """
+        Returns the columns currently inside the window
+        :return: visible column descriptions
+        """
+        return self.specs[self.offset:self.offset + self.visible]
+
+    def toggle(self, group: ColumnGroup):
+        """
+        Collapses an expanded group or expands a collapsed one
+        :param group: group to toggle
+        :return: None
+        """
+        group.collapsed = not group.collapsed
+        self.update_specs()
+
+    def scroll(self, delta: int) -> bool:
+        """
+        Moves the window by given amount of columns
+        :param delta: columns to move, negative moves left
+        :return: TRUE if window moved
+        """
+        return self.moveto_index(self.offset + delta)
+
+    def moveto(self, fraction: float) -> bool:
+        """
+        Moves the window to given relative position
+        :param fraction: position between 0.0 and 1.0
+        :return: TRUE if window moved
+        """
+        return self.moveto_index(round(fraction * len(self.specs)))
+
+    def moveto_index(self, offset: int) -> bool:
+        """
+        Moves the window to start with given column
+        :param offset: index of first visible column
+        :return: TRUE if window moved
+        """
+        offset = max(0, min(offset, len(self.specs) - self.visible))
+        if offset == self.offset:
+            return False
+        self.offset = offset
+        return True
+
+    def get_fractions(self) -> tuple[float, float]:
+        """
+        Calculates the visible part of all columns as used by scrollbars
+        :return: first and last visible fraction
+        """
+        if len(self.specs) == 0:
+            return 0.0, 1.0
+        first = self.offset / len(self.specs)
+        last = min(len(self.specs), self.offset + self.visible) / len(self.specs)
+        return first, last
+
+    @staticmethod
+    def get_cell(commits: list[Commit | None], spec: ColumnSpec) -> tuple[Commit | None, int, int]:
+        """
+        Determines the commit shown in a cell of given column.
+        A collapsed group shows its newest commit of the row
+        :param commits: commits of one row per folder
+        :param spec: column of cell
+        :return: shown commit or None, its folder index and the number of further commits hidden in cell
+        """
+        found = [idx for idx in spec.folders if idx < len(commits) and commits[idx]]
+        if len(found) == 0:
+            return None, -1, 0
+        newest = max(found, key=lambda idx: commits[idx].date)
+        return commits[newest], newest, len(found) - 1
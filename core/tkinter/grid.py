@@ -0,0 +1,221 @@
+from collections import deque
+from datetime import datetime, timedelta
+import itertools
+from itertools import islice
+from typing import Iterable, Iterator
+
+from core.transport import Commit
+
+
+class GridRow:
+    """
+    Representation of one row of the viewer grid holding
+    one commit (or None) per observed folder
+    """
+    key: str
+    """
+    Stable identifier of this row, assigned by GridStore. Used as TreeView item id
+    """
+
+    sequence: int
+    """
+    Insertion number of this row, assigned by GridStore. Higher is newer
+    """
+
+    commits: list[Commit | None]
+    """
+    Commits of this row in order of observed folders
+    """
+
+    label: str
+    """
+    Text of first column. Only filled for the first row of an observation block
+    """
+
+    folders: list[str]
+    """
+    Folders the commits of this row were observed in. Only filled in timeline mode
+    """
+
+    created: datetime
+    """
+    Time point, when row was added to grid
+    """
+
+    def __init__(self, commits: list[Commit | None], label: str = '', created: datetime = None,
+                 folders: list[str] = None):
+        """
+        Instantiates a new instance of GridRow
+        :param commits: commits per observed folder
+        :param label: text of first column
+        :param created: time point of creation. DEFAULT: now
+        :param folders: [Optional] folders the commits were observed in
+        """
+        self.key = ''
+        self.sequence = -1
+        self.commits = commits
+        self.label = label
+        self.created = created if created else datetime.now()
+        self.folders = folders if folders else []
+
+
+class GridStore:
+    """
+    Backing store of all rows known by the viewer grid.
+    Newest rows are prepended in constant time. Rows exceeding the configured
+    size or age get evicted from the end, so the store stays bounded regardless of session length
+    """
+    rows: deque[GridRow]
+    """
+    Rows sorted from newest (index 0) to oldest
+    """
+
+    keys: dict[str, GridRow]
+    """
+    Rows by their stable key for constant time lookup
+    """
+
+    def __init__(self, max_rows: int = 0, max_age: timedelta | None = None):
+        """
+        Instantiates a new instance of GridStore
+        :param max_rows: maximum number of rows kept. 0 means unbounded
+        :param max_age: maximum age of kept rows. None means unbounded
+        """
+        self.max_rows = max_rows
+        self.max_age = max_age
+        self.rows = deque()
+        self.keys = dict()
+        self.__key_sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[GridRow]:
+        return iter(self.rows)
+
+    def __getitem__(self, index: int) -> GridRow:
+        return self.rows[index]
+
+    def get(self, key: str) -> GridRow | None:
+        """
+        Looks up a row by its stable key
+        :param key: key assigned when row was prepended
+        :return: GridRow or None, if unknown or already evicted
+        """
+        return self.keys.get(key)
+
+    def prepend(self, row: GridRow):
+        """
+        Adds given row on top of the store and
+        assigns a new stable key to it
+        :param row: newest row
+        :return: None
+        """
+        row.sequence = next(self.__key_sequence)
+        row.key = f'R{row.sequence}'
+        self.rows.appendleft(row)
+        self.keys[row.key] = row
+
+    def ordered(self, keys: Iterable[str]) -> list[GridRow]:
+        """
+        Looks up rows by given keys and returns them in store order
+        :param keys: keys of requested rows. Unknown keys are skipped
+        :return: found rows, newest first
+        """
+        rows = [self.keys[key] for key in keys if key in self.keys]
+        rows.sort(key=lambda row: row.sequence, reverse=True)
+        return rows
+
+    def evict(self, now: datetime = None) -> list[GridRow]:
+        """
+        Removes the oldest rows as long as the store exceeds
+        either configured row count or row age
+        :param now: reference time point for age calculation. DEFAULT: now
+        :return: evicted rows
+        """
+        evicted: list[GridRow] = []
+        if self.max_rows > 0:
+            while len(self.rows) > self.max_rows:
+                evicted.append(self.rows.pop())
+
+        if self.max_age is not None:
+            oldest_allowed = (now if now else datetime.now()) - self.max_age
+            while self.rows and self.rows[-1].created < oldest_allowed:
+                evicted.append(self.rows.pop())
+
+        for row in evicted:
+            del self.keys[row.key]
+        return evicted
+
+    def shed(self, share: float) -> list[GridRow]:
+        """
+        Removes the given share of oldest rows, e.g. when memory budget is exceeded
+        :param share: share of rows between 0 and 1
+        :return: evicted rows
+        """
+        evicted = [self.rows.pop() for _ in range(int(len(self.rows) * share))]
+        for row in evicted:
+            del self.keys[row.key]
+        return evicted
+
+    def window(self, start: int, count: int) -> list[GridRow]:
+        """
+        Returns a slice of rows without copying the whole store
+        :param start: index of first row
+        :param count: maximum number of rows
+        :return: rows in range [start, start + count)
+        """
+        return list(islice(self.rows, start, start + count))
+
+
+class FilteredRows:
+    """
+    Subset of GridStore rows, e.g. matching a search.
+    Provides the same windowing like GridStore, so the viewer can show either of them
+    """
+    rows: deque[GridRow]
+    """
+    Rows sorted from newest (index 0) to oldest
+    """
+
+    def __init__(self, rows: Iterable[GridRow]):
+        """
+        Instantiates a new instance of FilteredRows
+        :param rows: rows sorted newest first
+        """
+        self.rows = deque(rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[GridRow]:
+        return iter(self.rows)
+
+    def prepend(self, row: GridRow):
+        """
+        Adds given row on top
+        :param row: newest row
+        :return: None
+        """
+        self.rows.appendleft(row)
+
+    def discard(self, store: GridStore) -> int:
+        """
+        Removes rows from the end, which are not part of given store anymore
+        :param store: store which evicted its oldest rows
+        :return: number of removed rows
+        """
+        removed = 0
+        while self.rows and store.get(self.rows[-1].key) is None:
+            self.rows.pop()
+            removed += 1
+        return removed
+
+    def window(self, start: int, count: int) -> list[GridRow]:
+        """
+        Returns a slice of rows without copying all rows
+        :param start: index of first row
+        :param count: maximum number of rows
+        :return: rows in range [start, start + count)
+        """
+        return list(islice(self.rows, start, start + count))
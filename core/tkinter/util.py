@@ -1,6 +1,6 @@
 from tkinter import Button, NONE, BOTH, DISABLED, VERTICAL, Text, Scrollbar, Frame, Tk, Toplevel, Entry, StringVar, \
     Checkbutton, BooleanVar
-from tkinter.constants import RIGHT, Y
+from tkinter.constants import END, NORMAL, RIGHT, Y
 
 from core.logger import Logger
 
@@ -53,6 +53,7 @@ class ToplevelModal(Toplevel):
         # Please note: this is to have a standalone form beside root (I guess)
         super().__init__(None)
         self.root = root
+        self.is_closed = False
         self.protocol('WM_DELETE_WINDOW', self.close)
         self.resizable(width=False, height=False)
         geo_loc = TkUtil.calculate_form_geometry(root, width_percent, height_percent)
@@ -66,10 +67,53 @@ class ToplevelModal(Toplevel):
         root for resuming its activity
         :return:
         """
+        self.is_closed = True
         self.destroy()
         self.root.deiconify()
 
 
+class MessageDialog(ToplevelModal):
+    """
+    A ToplevelModal showing a read-only, scrollable text
+    and a button "OK" to close dialog again.
+    The text may be replaced after the dialog is shown
+    """
+
+    def __init__(self, root: Tk, message_text: str):
+        """
+        Initializes a new dialog showing given text
+        :param root: root Tk
+        :param message_text: message to be shown
+        """
+        super().__init__(root)
+        default_bg = root.cget('bg')
+        message_root = Frame(self, bg=default_bg)
+        scroll_y = Scrollbar(message_root, orient=VERTICAL)
+        scroll_y.pack(side=RIGHT, fill=Y)
+
+        self.message = Text(master=message_root, bg=default_bg, height=10, yscrollcommand=scroll_y.set)
+        self.message.config(highlightthickness=0, borderwidth=0)
+        self.set_text(message_text)
+        message_root.pack(fill=BOTH, expand=True, padx=10, pady=5)
+        self.message.pack(anchor='nw', expand=True, fill=BOTH)
+
+        btn_close = Button(master=self, width=8, text='OK', command=self.close)
+        btn_close.pack(anchor='s', padx=12, pady=5, fill=NONE)
+
+    def set_text(self, message_text: str):
+        """
+        Replaces the shown text
+        :param message_text: message to be shown
+        :return: None
+        """
+        if self.is_closed:
+            return
+        self.message.config(state=NORMAL)
+        self.message.delete(1.0, END)
+        self.message.insert(index=1.0, chars=message_text)
+        self.message.config(state=DISABLED)
+
+
 class TkUtil:
 
     @staticmethod
@@ -134,25 +178,12 @@ class TkUtil:
         return f"{int(form_w)}x{int(form_h)}+{int(x)}+{int(y)}"
 
     @staticmethod
-    def show_message_dialog(root: Tk, message_text: str):
+    def show_message_dialog(root: Tk, message_text: str) -> MessageDialog:
         """
         Creates a Toplevel window based on given Tk root that shows
         passed message and a button "OK" to close dialog again
         :param root: Tk root
         :param message_text: message to be shown
-        :return: None
+        :return: the opened dialog, which allows to replace its text
         """
-        dialog = ToplevelModal(root)
-        default_bg = root.cget('bg')
-        message_root = Frame(dialog, bg=default_bg)
-        scroll_y = Scrollbar(message_root, orient=VERTICAL)
-        scroll_y.pack(side=RIGHT, fill=Y)
-
-        message = Text(master=message_root, bg=default_bg, height=10, yscrollcommand=scroll_y.set)
-        message.insert(index=1.0, chars=message_text)
-        message.config(state=DISABLED, highlightthickness=0, borderwidth=0)
-        message_root.pack(fill=BOTH, expand=True, padx=10, pady=5)
-        message.pack(anchor='nw', expand=True, fill=BOTH)
-
-        btn_close = Button(master=dialog, width=8, text='OK', command=dialog.close)
-        btn_close.pack(anchor='s', padx=12, pady=5, fill=NONE)
+        return MessageDialog(root, message_text)
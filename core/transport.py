@@ -10,29 +10,58 @@ class Commit:
     Representation of one single commit
     at time point with given author and title
     """
+    ABBREV: int = 12
+    """
+    Number of hexadecimal digits shown for a commit identifier
+    """
+
     origin: str
     author: str
     date: datetime
     message: str
-    sha1: str
+    oid: bytes
+    """
+    Full object identifier as raw bytes (20 bytes for SHA1 repositories, 32 bytes for SHA256)
+    """
     branch: str
 
     def __init__(self, author: str, date: datetime, message: str,
-                 commit_hash: str = None, branch: str = None, origin: str = None):
+                 commit_hash: str | bytes = None, branch: str = None, origin: str = None):
         """
         Instantiates a new instance of Commit
         :param author: committer name
         :param date: time stamp
         :param message: summary text
-        :param commit_hash: generated link using commit hash and argument 'origin'
+        :param commit_hash: full object identifier, either hexadecimal or raw bytes
         :param branch: branch name, if given
+        :param origin: prefix to build commit link from
         """
         self.origin = origin
         self.author = author
         self.date = date
         self.message = message
-        self.sha1 = commit_hash
+        if isinstance(commit_hash, str):
+            commit_hash = bytes.fromhex(commit_hash)
+        self.oid = commit_hash or b''
         self.branch = branch
+        self.__short_sha1: str | None = None
+
+    @property
+    def sha1(self) -> str:
+        """
+        :return: full hexadecimal object identifier
+        """
+        return self.oid.hex()
+
+    @property
+    def short_sha1(self) -> str:
+        """
+        Abbreviated identifier used for display and links, computed on first use
+        :return: abbreviated hexadecimal object identifier
+        """
+        if self.__short_sha1 is None:
+            self.__short_sha1 = self.oid[:(self.ABBREV + 1) // 2].hex()[:self.ABBREV]
+        return self.__short_sha1
 
 
 class Observation:
@@ -131,7 +160,7 @@ class ObservationUtil:
         author = lineinfo[0]
         date = datetime.fromisoformat(lineinfo[1])
         message = lineinfo[2]
-        commit_hash = lineinfo[3]
+        commit_hash = bytes.fromhex(lineinfo[3])
         branch = ''
         if lineinfo[4]:
             branch = lineinfo[4]
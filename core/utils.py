@@ -77,21 +77,33 @@ class TypeUtil:
     Utilities to handle several types
     """
 
+    TRUE_VALUES: tuple[str, ...] = ('true', '1', 'yes')
+    """
+    Lower case strings parsed as TRUE, all others are FALSE
+    """
+
     @staticmethod
     def parse_value(value: str, default_val):
         """
         Basically a string parser converting a string value
-        to list, bool, int or string
+        to list, bool, int, float or string.
+        Values already parsed, like lists and flags of argparse, are kept
         :param value: Input value that needs to be converted to Type of default_val
         :param default_val: default_val as template fpr output value
         :return: Any
         """
         if type(default_val) is list:
+            if type(value) is list:
+                return value
             return [item.strip() for item in value.split(',')]
         if type(default_val) is bool:
-            return bool(value)
+            if type(value) is bool:
+                return value
+            return value.strip().lower() in TypeUtil.TRUE_VALUES
         if type(default_val) is int:
             return int(value)
+        if type(default_val) is float:
+            return float(value)
         return value
 
 
@@ -0,0 +1,101 @@
+import faulthandler
+import tempfile
+import time
+from threading import Event as ThreadEvent, Lock, Thread, get_ident
+from typing import Callable
+
+from core.logger import Logger
+from core.runner import GitRunner
+
+
+class PollWatchdog:
+    """
+    Watches the deadline of each observer iteration. A git call waiting for credentials or a dead network
+    would otherwise block the observation forever, without anybody noticing.
+    When the deadline passes, the stacks of all threads are dumped to the log, the in-flight git processes
+    of the iteration get killed, so the blocked call returns and the iteration proceeds, and the stall is reported.
+    Processes started by other threads, like commit-graph maintenance or git show of the viewer, keep running
+    """
+
+    def __init__(self, runner: GitRunner, deadline: float, on_stall: Callable[[str], None]):
+        """
+        Instantiates a new watchdog, whose thread starts with the first iteration
+        :param runner: runner of the observer, whose processes get killed
+        :param deadline: seconds an iteration may take
+        :param on_stall: callable receiving the status message of a stalled iteration, e.g. OnStatus
+        """
+        self.logger = Logger(__name__).log_init
+        self.runner = runner
+        self.deadline = deadline
+        self.on_stall = on_stall
+        self.stalls = 0
+        self.__expires: float | None = None
+        self.__iteration_thread: int | None = None
+        self.__lock = Lock()
+        self.__changed = ThreadEvent()
+        self.__stop = ThreadEvent()
+        self.__thread: Thread | None = None
+
+    def arm(self):
+        """
+        Starts the deadline of an iteration, which runs in the calling thread
+        :return: None
+        """
+        with self.__lock:
+            self.__expires = time.monotonic() + self.deadline
+            self.__iteration_thread = get_ident()
+            if self.__thread is None:
+                self.__thread = Thread(target=self.__watch, name='PollWatchdog', daemon=True)
+                self.__thread.start()
+        self.__changed.set()
+
+    def disarm(self):
+        """
+        Ends the deadline of a finished iteration
+        :return: None
+        """
+        with self.__lock:
+            self.__expires = None
+
+    def stop(self):
+        self.__stop.set()
+        self.__changed.set()
+
+    def __watch(self):
+        while not self.__stop.is_set():
+            with self.__lock:
+                expires = self.__expires
+            remaining = None if expires is None else expires - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                self.bark()
+                continue
+            self.__changed.wait(remaining)
+            self.__changed.clear()
+
+    @staticmethod
+    def dump_stacks() -> str:
+        """
+        :return: current stacks of all threads, as dumped by faulthandler
+        """
+        # faulthandler writes to a file descriptor, not to a Python stream
+        with tempfile.TemporaryFile(mode='w+', encoding='utf-8') as dump:
+            faulthandler.dump_traceback(file=dump, all_threads=True)
+            dump.seek(0)
+            return dump.read()
+
+    def bark(self):
+        """
+        Handles a passed deadline. The deadline starts again, so an iteration stalling anew is handled again
+        :return: None
+        """
+        with self.__lock:
+            if self.__expires is None or time.monotonic() < self.__expires:
+                return
+            self.__expires = time.monotonic() + self.deadline
+            iteration_thread = self.__iteration_thread
+        self.stalls += 1
+        self.logger.error(f'Iteration exceeded its deadline of {self.deadline:g} s, stacks of all threads:\n'
+                          f'{self.dump_stacks()}')
+        killed = self.runner.kill_running(iteration_thread)
+        self.logger.error(f'Killed {killed} stuck git process(es)')
+        self.on_stall(f'Iteration stalled for {self.deadline:g} s, killed {killed} git process(es)')
@@ -0,0 +1,87 @@
+from threading import Event as ThreadEvent
+from threading import Thread
+from typing import Any, Callable
+
+
+class BackgroundTask:
+    """
+    Runs a callable on a daemon thread, so callers like the UI thread
+    are not blocked. The result is kept until the caller asks for it.
+    A cancelled task discards its result
+    """
+    result: Any
+    """
+    Return value of target, when done without error
+    """
+
+    error: Exception | None
+    """
+    Exception raised by target, if any
+    """
+
+    def __init__(self, target: Callable[[], Any], on_cancel: Callable[[], None] = None):
+        """
+        Instantiates a new task, which needs to be started
+        :param target: callable doing the actual work
+        :param on_cancel: [Optional] callable to abort the running work when cancelled
+        """
+        self.target = target
+        self.on_cancel = on_cancel
+        self.result = None
+        self.error = None
+        self.__done = ThreadEvent()
+        self.__cancelled = ThreadEvent()
+        self.__thread = Thread(target=self.__run, daemon=True)
+
+    @property
+    def done(self) -> bool:
+        """
+        TRUE when target returned or raised
+        """
+        return self.__done.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        TRUE when cancel was called
+        """
+        return self.__cancelled.is_set()
+
+    def start(self) -> 'BackgroundTask':
+        """
+        Starts the work on a new daemon thread
+        :return: this instance
+        """
+        self.__thread.start()
+        return self
+
+    def cancel(self):
+        """
+        Marks the task as cancelled, so its result gets discarded
+        and calls the optional cancel handler
+        :return: None
+        """
+        if self.cancelled:
+            return
+        self.__cancelled.set()
+        if self.on_cancel and not self.done:
+            self.on_cancel()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Blocks until the task is done
+        :param timeout: seconds to wait at maximum
+        :return: TRUE when done
+        """
+        return self.__done.wait(timeout)
+
+    def __run(self):
+        try:
+            result = self.target()
+            if not self.cancelled:
+                self.result = result
+        except Exception as e:
+            if not self.cancelled:
+                self.error = e
+        finally:
+            self.__done.set()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+"""
+End-to-end benchmark of the observer against throwaway git repositories.
+
+Builds local repositories of configurable size by git fast-import, observes every folder of them
+by GitObserver.load_observations, once cold and several times warm, and writes poll latency,
+number of git processes, peak RSS and commits per second into a JSON report.
+Each measurement runs in its own Python process, so peak RSS is not inherited between scenarios.
+
+Copyright (C) 2024  Pitcher Seven <https://github.com/PitcherSeven> and worstprgr <adam@seishin.io> GPG Key: key.seishin.io
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, peak RSS is not reported there
+    resource = None
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+class RepoSpec:
+    """
+    Size and shape of a synthetic repository
+    """
+
+    def __init__(self, commits: int, folders: int, branches: int, merge_ratio: float, message_length: int,
+                 seed: int = 0):
+        """
+        :param commits: number of commits, including merges
+        :param folders: number of top level folders commits are spread across
+        :param branches: number of branches commits are spread across
+        :param merge_ratio: share of commits merging another branch, between 0 and 1
+        :param message_length: number of characters of each commit message
+        :param seed: [Optional] seed of random generator
+        """
+        self.commits = commits
+        self.folders = folders
+        self.branches = max(1, branches)
+        self.merge_ratio = merge_ratio
+        self.message_length = message_length
+        self.seed = seed
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class RepoBuilder:
+    """
+    Builds a git repository of a RepoSpec with a single git fast-import call.
+    Commit dates are spread across the last six days, so all commits are within the observed week
+    """
+    AUTHORS: list[str] = [f'author.{index:02d}' for index in range(10)]
+
+    def __init__(self, spec: RepoSpec):
+        self.spec = spec
+        self.random = random.Random(spec.seed)
+
+    def get_message(self, number: int) -> str:
+        """
+        :param number: commit number
+        :return: commit message of configured length
+        """
+        message = f'Change {number} '
+        words = itertools.cycle(['refactor', 'parser', 'viewer', 'fix', 'observer', 'commit', 'folder'])
+        while len(message) < self.spec.message_length:
+            message += f'{next(words)} '
+        return message[:max(self.spec.message_length, len(f'Change {number}'))].strip()
+
+    @staticmethod
+    def get_data(content: str) -> bytes:
+        data = content.encode('utf-8')
+        return b'data %d\n%s\n' % (len(data), data)
+
+    def generate(self):
+        """
+        Generates the fast-import stream
+        :return: generator of stream chunks
+        """
+        end = datetime.now(timezone.utc) - timedelta(minutes=1)
+        step = timedelta(days=6) / max(1, self.spec.commits)
+        tips: dict[int, int] = dict()
+        for number in range(self.spec.commits):
+            mark = number + 1
+            branch = 0 if number == 0 else self.random.randrange(self.spec.branches)
+            folder = number % max(1, self.spec.folders)
+            author = self.AUTHORS[self.random.randrange(len(self.AUTHORS))]
+            epoch = int((end - step * (self.spec.commits - number)).timestamp())
+            chunk = [
+                f'commit refs/heads/branch{branch}\nmark :{mark}\n'.encode('utf-8'),
+                f'committer {author} <{author}@example.com> {epoch} +0000\n'.encode('utf-8'),
+                self.get_data(self.get_message(number))
+            ]
+            # New branches fork from the current tip of branch0
+            parent = tips.get(branch, tips.get(0))
+            if parent:
+                chunk.append(f'from :{parent}\n'.encode('utf-8'))
+            others = [tip for other, tip in tips.items() if other != branch and tip != parent]
+            if others and self.random.random() < self.spec.merge_ratio:
+                chunk.append(f'merge :{self.random.choice(others)}\n'.encode('utf-8'))
+            chunk.append(f'M 100644 inline folder{folder}/file{number % 7}.txt\n'.encode('utf-8'))
+            chunk.append(self.get_data(f'{number}\n'))
+            tips[branch] = mark
+            yield b''.join(chunk)
+
+    def build(self, directory: str):
+        """
+        Creates the repository in given directory
+        :param directory: empty directory
+        :return: None
+        """
+        subprocess.run(['git', 'init', '-q', '-b', 'branch0', directory], check=True)
+        with subprocess.Popen(['git', '-C', directory, 'fast-import', '--quiet'], stdin=subprocess.PIPE) as process:
+            for chunk in self.generate():
+                process.stdin.write(chunk)
+            process.stdin.close()
+            if process.wait() != 0:
+                raise RuntimeError('git fast-import failed')
+        subprocess.run(['git', '-C', directory, 'checkout', '-q', '-f', 'branch0'], check=True)
+
+
+class Measurement:
+    """
+    Observes a repository in the current process and measures each poll
+    """
+
+    def __init__(self, repository: str, folders: int, polls: int):
+        """
+        :param repository: Git root of observed repository
+        :param folders: number of observed folders
+        :param polls: number of warm polls after the cold one
+        """
+        self.repository = repository
+        self.folders = folders
+        self.polls = polls
+
+    def run(self) -> dict:
+        """
+        Runs one cold and several warm polls
+        :return: results of measurement
+        """
+        os.chdir(ROOT_DIR)
+        sys.path.insert(0, ROOT_DIR)
+        from core.config.management import ConfigManager
+        from observer import GitObserver
+
+        config = ConfigManager.get_defaults()
+        config.filepath = self.repository
+        config.logfolders = [f'folder{index}' for index in range(self.folders)]
+        config.once = False
+        observer = GitObserver(config)
+
+        cold = self.poll(observer)
+        observed = len(observer.known_hashes)
+        warm = [self.poll(observer) for _ in range(self.polls)]
+        warm_latency = statistics.median(result['latency_s'] for result in warm) if warm else None
+        observer.runner.kill_all()
+        return {
+            'observed_commits': observed,
+            'cold': cold,
+            'warm': warm,
+            'warm_median_latency_s': warm_latency,
+            'cold_commits_per_s': observed / cold['latency_s'] if cold['latency_s'] else None,
+            'warm_commits_per_s': observed / warm_latency if warm_latency else None,
+            'peak_rss_kib': self.get_peak_rss(resource.RUSAGE_SELF) if resource else None,
+            'peak_git_rss_kib': self.get_peak_rss(resource.RUSAGE_CHILDREN) if resource else None
+        }
+
+    @staticmethod
+    def poll(observer) -> dict:
+        """
+        Measures one call of load_observations
+        :param observer: GitObserver
+        :return: latency, number of git processes and reported commits
+        """
+        calls = sum(metrics.calls for metrics in observer.runner.metrics.values())
+        start = time.perf_counter()
+        observations = observer.load_observations()
+        latency = time.perf_counter() - start
+        return {
+            'latency_s': latency,
+            'git_processes': sum(metrics.calls for metrics in observer.runner.metrics.values()) - calls,
+            'reported_commits': sum(len(observation.commits) for observation in observations)
+        }
+
+    @staticmethod
+    def get_peak_rss(who: int) -> int:
+        """
+        :param who: resource.RUSAGE_SELF or resource.RUSAGE_CHILDREN
+        :return: peak resident set size in KiB
+        """
+        peak = resource.getrusage(who).ru_maxrss
+        # macOS reports bytes, Linux kibibytes
+        return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class Benchmark:
+    """
+    Runs the scenarios of all combinations of configured sizes and collects the report
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+
+    def get_specs(self) -> list[RepoSpec]:
+        return [RepoSpec(commits, folders, branches, merge_ratio, self.args.message_length, self.args.seed)
+                for commits, folders, branches, merge_ratio
+                in itertools.product(self.args.commits, self.args.folders, self.args.branches, self.args.merge_ratio)]
+
+    def run_scenario(self, spec: RepoSpec, directory: str) -> dict:
+        """
+        Builds the repository of a scenario and measures it in a new Python process
+        :param spec: size of repository
+        :param directory: directory to build the repository in
+        :return: scenario of report
+        """
+        start = time.perf_counter()
+        RepoBuilder(spec).build(directory)
+        build_duration = time.perf_counter() - start
+        measure_cmd = [sys.executable, os.path.abspath(__file__), '--measure', directory,
+                       '--folders', str(spec.folders), '--polls', str(self.args.polls)]
+        output = subprocess.run(measure_cmd, check=True, capture_output=True, text=True).stdout
+        return {'spec': spec.to_dict(), 'build_s': build_duration, **json.loads(output.splitlines()[-1])}
+
+    def run(self) -> dict:
+        """
+        Runs all scenarios
+        :return: report
+        """
+        git_version = subprocess.run(['git', '--version'], capture_output=True, text=True).stdout.strip()
+        report = {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'git': git_version,
+            'scenarios': []
+        }
+        for spec in self.get_specs():
+            print(f'Scenario: {spec.to_dict()}', file=sys.stderr)
+            with tempfile.TemporaryDirectory(prefix='git-observer-bench-') as directory:
+                report['scenarios'].append(self.run_scenario(spec, directory))
+        return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='End-to-end benchmark of the observer against throwaway repositories')
+    parser.add_argument('-c', '--commits', type=int, nargs='+', default=[1000, 10000],
+                        help='Number of commits per repository')
+    parser.add_argument('-f', '--folders', type=int, nargs='+', default=[10, 100],
+                        help='Number of folders per repository, all of them are observed')
+    parser.add_argument('-b', '--branches', type=int, nargs='+', default=[4],
+                        help='Number of branches per repository')
+    parser.add_argument('-m', '--merge-ratio', type=float, nargs='+', default=[0.1],
+                        help='Share of merge commits between 0 and 1')
+    parser.add_argument('-l', '--message-length', type=int, default=60,
+                        help='Number of characters of each commit message')
+    parser.add_argument('-p', '--polls', type=int, default=3,
+                        help='Number of warm polls after the cold one')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='Seed of random generator building the repositories')
+    parser.add_argument('-o', '--output', default='benchmark-report.json',
+                        help='File of JSON report')
+    parser.add_argument('--measure', default=None,
+                        help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.measure:
+        # Child process measuring one built repository
+        print(json.dumps(Measurement(args.measure, args.folders[0], args.polls).run()))
+        return
+    report = Benchmark(args).run()
+    with open(args.output, mode='w', encoding='utf-8') as output:
+        json.dump(report, output, indent=2)
+    print(f'Report written to {args.output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -21,13 +21,20 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import sys
 from argparse import Namespace
+from datetime import timedelta
 from time import sleep
 
 import _version
+import core.paths
 from core.envcheck import EnvironmentCheck
 from core.config.management import ConfigManager
-from core.transport import Observation, ObservationUtil
+from core.journal import PollJournal
+from core.profiler import ObserverProfiler
+from core.store import ObservationStore
+from core.timeline import Timeline, TimelineEntry
+from core.transport import Commit, Observation, ObservationUtil
 from observer import GitObserver
 from viewer import GitObserverViewer
 from core.utils import SignalReceiver, EnvUtils
@@ -37,6 +44,7 @@ from core.logger import Logger
 EnvironmentCheck().env_check()
 
 log = Logger(__name__).log_init
+c_paths = core.paths.Paths()
 __run_main = True
 
 
@@ -64,21 +72,188 @@ def call_shell(config: Namespace, interval_ms: int) -> None:
 
     log.info(f"Starting Observer for Git {_version.__version__} shell")
     observer = GitObserver(config)
+    timeline = create_timeline(config)
+    if timeline is not None:
+        observer.OnMemoryExceeded += timeline.shed
     ms_since_last_iteration = 0
-    while __run_main:
-        if ms_since_last_iteration % interval_ms == 0:
-            observations: list[Observation] = observer.load_observations()
+    try:
+        while __run_main:
+            if ms_since_last_iteration % interval_ms == 0:
+                observations: list[Observation] = observer.load_observations()
+                if not ObservationUtil.is_empty(observations):
+                    with observer.poll.measure('dispatch'):
+                        print_result(observations, timeline, config.descending)
+                    ms_since_last_iteration = 0
+                observer.complete_poll()
+            sleep(0.1)
+            ms_since_last_iteration += 100
+    finally:
+        # Also on Ctrl-C, buffered records would be lost otherwise
+        observer.close_journal()
+
+
+def call_once(config: Namespace) -> int:
+    """
+    Observes once, prints commits not reported by a previous run
+    and adds them to the checkpoint file. Intended for cron-style calls
+    :param config: configuration of command line tool
+    :return: exit code
+    """
+    if not config.checkpoint:
+        log.error('No checkpoint file given. Can not observe once.')
+        return 1
+
+    observer = GitObserver(config)
+    observations = observer.load_observations()
+    if not ObservationUtil.is_empty(observations):
+        timeline = create_timeline(config)
+        with observer.poll.measure('dispatch'):
+            print_result(observations, timeline, config.descending)
+    observer.complete_poll()
+    # Persisted after printing, an interrupted run reports its commits again rather than losing them
+    observer.checkpoint.save()
+    observer.checkpoint.close()
+    observer.close_journal()
+    if observer.maintenance_task:
+        # Finish commit-graph refresh, so the next run profits from it
+        observer.maintenance_task.wait()
+    observer.runner.log_metrics()
+    return 0
+
+
+def create_timeline(config: Namespace) -> Timeline | None:
+    """
+    Creates the timeline, if configured, bounded by the same row count and age as the viewer
+    :param config: configuration of command line tool
+    :return: Timeline or None
+    """
+    if not config.timeline:
+        return None
+    max_age = timedelta(hours=int(config.viewer_max_age_h)) if int(config.viewer_max_age_h) > 0 else None
+    return Timeline(config.descending, int(config.viewer_max_rows), max_age)
+
+
+def print_result(observations: list[Observation], timeline: Timeline | None, descending: bool) -> None:
+    """
+    Prints the observation result of one iteration, either folder by folder or in timeline order
+    :param observations: observation result of one iteration
+    :param timeline: [Optional] timeline to merge the result into
+    :param descending: flag if output is descending
+    :return: None
+    """
+    if timeline is not None:
+        # Same order like folder wise output, which is newest first unless descending
+        print_timeline(timeline.extend(observations), not descending)
+    else:
+        print_observations(observations)
+
+
+def print_observations(observations: list[Observation]) -> None:
+    """
+    Prints observed commits folder by folder
+    :param observations: observation result of one iteration
+    :return: None
+    """
+    for folder in observations:
+        print(f'--- {folder.name} ---')
+        for cmt in folder.commits:
+            print_commit(cmt)
+
+
+def print_timeline(entries: list[TimelineEntry], newest_first: bool) -> None:
+    """
+    Prints observed commits of all folders in time order,
+    each tagged with the folders it was observed in
+    :param entries: new timeline entries, oldest first
+    :param newest_first: flag if newest commit should be printed first
+    :return: None
+    """
+    for entry in reversed(entries) if newest_first else entries:
+        print_commit(entry.commit, entry.folders)
+
+
+def print_commit(cmt: Commit, folders: list[str] = None) -> None:
+    """
+    Prints one commit including its link to origin
+    :param cmt: commit to print
+    :param folders: [Optional] folders to tag the commit with
+    :return: None
+    """
+    branch = f'{cmt.branch}\n' if cmt.branch else ''
+    tags = f'[{", ".join(folders)}] ' if folders else ''
+    print(f"{tags}{cmt.author} ({cmt.date}): {cmt.message}\n" +
+          f"{branch}" +
+          f"{cmt.origin or ''}{cmt.short_sha1}\n")
+
+
+def call_query(args: list[str]) -> int:
+    """
+    Calls the query command line of the persistent observation store
+    and prints matching commits, newest first
+    :param args: command line arguments following the subcommand
+    :return: exit code
+    """
+    query_args = ObservationStore.build_query_parser().parse_args(args)
+    store = ObservationStore(query_args.store)
+    try:
+        results = store.query(query_args.filepath, query_args.logfolder, query_args.author,
+                              query_args.since, query_args.until, query_args.limit)
+    finally:
+        store.close()
+    for result in results:
+        print_commit(result.commit, [result.folder])
+    return 0
+
+
+def call_profile(config: Namespace) -> int:
+    """
+    Profiles the configured number of iterations, writes the profile files
+    and prints the hot functions
+    :param config: configuration of command line tool
+    :return: exit code
+    """
+    output = config.profile_output or str(c_paths.LOG_DIR / 'profile')
+    observer = GitObserver(config)
+    with ObserverProfiler(output, not config.profile_sampling) as profiler:
+        for _ in range(config.profile):
+            observations = observer.load_observations()
             if not ObservationUtil.is_empty(observations):
-                for folder in observations:
-                    print(f'--- {folder} ---')
-                    for cmt in folder.commits:
-                        branch = f'{cmt.branch}\n' if cmt.branch else ''
-                        print(f"{cmt.author} ({cmt.date}): {cmt.message}\n" +
-                              f"{branch}" +
-                              f"{cmt.origin}{cmt.sha1}\n")
-                ms_since_last_iteration = 0
-        sleep(0.1)
-        ms_since_last_iteration += 100
+                with observer.poll.measure('dispatch'):
+                    print_result(observations, None, config.descending)
+            observer.complete_poll()
+    observer.close_journal()
+    print(profiler.format_top())
+    for file in profiler.save():
+        print(f'Profile written to {file}')
+    observer.runner.log_metrics()
+    return 0
+
+
+def call_journal(args: list[str]) -> int:
+    """
+    Calls the summary command line of the journal
+    and prints latency percentiles of the recorded iterations
+    :param args: command line arguments following the subcommand
+    :return: exit code
+    """
+    journal_args = PollJournal.build_summary_parser().parse_args(args)
+    records = PollJournal.read(journal_args.journal, journal_args.since, journal_args.until, journal_args.filepath)
+    summary = PollJournal.summarize(records)
+    if summary['polls'] == 0:
+        print('No iterations recorded in given time range')
+        return 1
+    print(PollJournal.format_summary(summary))
+    return 0
+
+
+SUBCOMMANDS = {
+    'query': call_query,
+    'journal': call_journal
+}
+"""
+Commands that are called by their name as first argument,
+instead of starting an observation
+"""
 
 
 def call_viewer(config: Namespace, sig_recv: SignalReceiver) -> None:
@@ -96,6 +271,9 @@ def call_viewer(config: Namespace, sig_recv: SignalReceiver) -> None:
 
 
 if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        sys.exit(SUBCOMMANDS[sys.argv[1]](sys.argv[2:]))
+
     app_config = ConfigManager.get_app_config()
     has_desktop = EnvUtils().is_desktop()
 
@@ -103,6 +281,12 @@ if __name__ == '__main__':
     signal_receiver = SignalReceiver()
     signal_receiver.OnTerminate += global_sigterm
 
+    if app_config.profile > 0:
+        sys.exit(call_profile(app_config))
+
+    if app_config.once:
+        sys.exit(call_once(app_config))
+
     if app_config.show_viewer:
         if has_desktop:
             call_viewer(app_config, signal_receiver)
@@ -1,17 +1,31 @@
 #!/bin/env python
-import subprocess
+import hashlib
+from bisect import insort
 from argparse import Namespace
+from datetime import datetime, timedelta
 from logging import INFO
-from threading import Thread
-from time import sleep
-from typing import IO
+from threading import Thread, current_thread
+from itertools import islice, takewhile
+from time import perf_counter, sleep, time
 from core.event import Event, StatusEvent
 
 import core.paths
 from core.transport import Commit, ObservationUtil, ObservationEvent
 from core.transport import Observation
+from core.checkpoint import SeenCheckpoint
+from core.filter import CommitFilter, FilterPlan, MergeMode, RefScope
+from core.governor import ResourceGovernor
+from core.journal import PollJournal
 from core.logger import Logger
+from core.maintenance import RepositoryMaintenance
+from core.memory import MemoryAccountant, MemoryEvent
+from core.metrics import MetricsEvent, ObserverMetrics, PollMetrics
+from core.replay import FixtureSet, RecordingRunner, ReplayProcess, ReplayRunner
+from core.runner import CancelToken, CommandMetrics, FinishedProcess, GitProcess, GitRunner
+from core.store import ObservationStore
+from core.watchdog import PollWatchdog
 from core.utils import TimeUtil
+from core.worker import BackgroundTask
 
 c_paths = core.paths.Paths()
 
@@ -22,6 +36,26 @@ class GitObserver:
     filtering for ignored authors and specific folders to observe
     """
     OnStatus: Event
+    OnMetrics: MetricsEvent
+    """
+    Public event that can be subscribed.
+    Will be called after each iteration and contribute its PollMetrics
+    """
+    OnMemoryExceeded: MemoryEvent
+    """
+    Public event that can be subscribed.
+    Will be called when the memory budget is exceeded and contribute the share of oldest observations to evict
+    """
+
+    SINCE_DEFAULT = timedelta(weeks=1)
+    """
+    Time span observed, matching since
+    """
+
+    CLOCK_SKEW = timedelta(hours=1)
+    """
+    Time span known commits are kept beyond the observed one, as committer clocks may be ahead
+    """
 
     def __init__(self, config: Namespace, is_test_instance: bool = False):
         """
@@ -32,10 +66,17 @@ class GitObserver:
         :param is_test_instance: [Optional] flag if test mode
         """
         self.OnStatus = StatusEvent()
+        self.OnMetrics = MetricsEvent()
+        self.OnMemoryExceeded = MemoryEvent()
 
         self.logger = Logger(__name__).log_init
         self.is_test = is_test_instance
-        self.known_hashes: list[str] = []
+        # Time each commit was seen first by oid, in order of being seen
+        self.known_hashes: dict[bytes, float] = dict()
+        # Commits reported within current iteration. In timeline mode, a commit also touching
+        # a folder observed later is reported for it again, so the timeline tags it with all its folders
+        self.reported_hashes: set[bytes] = set()
+        self.tag_folders: bool = config.timeline
 
         # May encapsulate config in exclusive var
         self.origin = config.origin
@@ -43,7 +84,50 @@ class GitObserver:
         self.logfolders = config.logfolders
         self.ignore = config.ignore
         self.descending = config.descending
+        self.streaming = config.streaming
         self.since: str = '1 week ago'
+        # All git calls go through one runner, applying timeouts,
+        # its governor limits git processes of all observed repositories together
+        governor = ResourceGovernor.shared(config.git_concurrency, config.git_cpu_budget_s, config.max_load,
+                                           config.git_nice)
+        self.runner = self.create_runner(config, governor)
+        self.commit_filter = CommitFilter(config.ignore, config.include_messages, config.exclude_messages)
+        self.ref_scope = RefScope(config.branches, config.exclude_branches)
+        self.merge_mode = MergeMode(config.merges, config.folder_merges)
+
+        # Persistent store allows a warm start, commits known from it are not reported again.
+        # The whole time span is still observed, commits pushed late may carry an older committer date
+        self.store: ObservationStore | None = None
+        if config.store:
+            self.store = self.create_store(config)
+            observed_since = datetime.now().astimezone() - (self.SINCE_DEFAULT + self.CLOCK_SKEW)
+            self.known_hashes.update(dict.fromkeys(self.store.load_hashes(self.filepath, observed_since), time()))
+
+        # Checkpoint of a one-shot run, commits in it have been reported by a previous run
+        self.checkpoint: SeenCheckpoint | None = None
+        if config.once and config.checkpoint:
+            self.checkpoint = SeenCheckpoint(config.checkpoint)
+        # Commit-graph maintenance makes date and path limited logs cheap
+        self.maintenance = RepositoryMaintenance(self.filepath, self.runner)
+        self.maintain_graph = config.maintain_graph
+        self.maintenance_task: BackgroundTask | None = None
+        self.graph_speedup: float | None = None
+        # Metrics of current iteration, aggregated by complete_poll
+        self.metrics = ObserverMetrics(self.filepath, config.metrics_file)
+        self.poll = PollMetrics()
+        self.poll_git_metrics: dict[str, CommandMetrics] = dict()
+        # Journal of iterations for performance trending, written in batches
+        self.journal = PollJournal(config.journal) if config.journal else None
+        # Memory accounting reports growth and enforces a budget, both traced by tracemalloc
+        self.memory: MemoryAccountant | None = None
+        if config.memory_trace or config.memory_budget_mb > 0:
+            interval = config.memory_interval if config.memory_trace else 0
+            self.memory = MemoryAccountant(self.logger, config.memory_budget_mb, interval)
+            self.memory.start()
+        # Watchdog kills git processes of an iteration exceeding its deadline, so the next one can start
+        self.watchdog: PollWatchdog | None = None
+        if config.poll_deadline_s > 0:
+            self.watchdog = PollWatchdog(self.runner, config.poll_deadline_s, self.on_stall)
         self.git_fetch = [
             'git',
             f'--git-dir={self.filepath}/.git/',
@@ -52,10 +136,36 @@ class GitObserver:
             '--all'
         ]
 
-        # Paths
-        self.gitlog_dummy_file: str = c_paths.GITLOG_DUMMY
+        self.filter_plan: FilterPlan = self.plan_filter()
         self.log_config()
 
+    def create_runner(self, config: Namespace, governor: ResourceGovernor) -> GitRunner:
+        """
+        Creates the runner of git calls. Test instances replay the static dummy file for every git log,
+        a configured replay serves recorded fixtures or a synthetic repository instead of calling git
+        :param config: Configuration provided by caller
+        :param governor: governor shared by all observers
+        :return: GitRunner
+        """
+        if self.is_test:
+            return ReplayRunner(FixtureSet(log_file=str(c_paths.GITLOG_DUMMY)))
+        if config.replay:
+            return ReplayRunner(ReplayRunner.create_source(config.replay), governor, config.replay_latency)
+        if config.record:
+            return RecordingRunner(FixtureSet(config.record), governor, config.git_timeout_s)
+        return GitRunner(governor, config.git_timeout_s)
+
+    def create_store(self, config: Namespace) -> ObservationStore:
+        """
+        Opens the persistent store. Its retention never undercuts the observed time span,
+        commits pruned within it would be reported again on restart
+        :param config: Configuration provided by caller
+        :return: ObservationStore
+        """
+        retention_d = int(config.store_retention_d)
+        retention = max(timedelta(days=retention_d), self.SINCE_DEFAULT + self.CLOCK_SKEW) if retention_d > 0 else None
+        return ObservationStore(config.store, retention)
+
     def log_config(self):
         """
         Logs the given configuration to current instance log
@@ -66,11 +176,60 @@ class GitObserver:
             return
         self.log_info(f'Origin: "{self.origin}"')
         self.log_info(f'Git root: "{self.filepath}"')
+        if isinstance(self.runner, ReplayRunner):
+            self.log_info(f'Replay: git calls are answered by {type(self.runner.source).__name__}')
+        elif isinstance(self.runner, RecordingRunner):
+            self.log_info(f'Record: git calls are recorded to "{self.runner.fixtures.directory}"')
+        self.log_diagnostics()
         self.log_info(f'Descending: {self.descending}')
+        if self.streaming:
+            self.log_info('Streaming: git log output is ordered by observer')
         if self.logfolders and len(self.logfolders) > 0:
             self.log_info(f'Observed folders: {str.join(", ", self.logfolders)}')
-        if self.ignore and len(self.ignore) > 0:
-            self.log_info(f'Ignored authors: {str.join(", ", self.ignore)}')
+        self.log_filter()
+        if self.store:
+            self.log_info(f'Store: "{self.store.db_file}" ({len(self.known_hashes)} known commits)')
+        if self.checkpoint is not None:
+            self.log_info(f'Checkpoint: "{self.checkpoint.file}" ({len(self.checkpoint)} known commits)')
+        graph_status = self.maintenance.get_status()
+        self.log_info(f'Repository: {graph_status}')
+        if not graph_status.complete and not self.maintain_graph:
+            self.log_info('Git log may be accelerated by --maintain-graph')
+
+    def log_diagnostics(self):
+        """
+        Logs the configured export of metrics and memory accounting
+        :return: None
+        """
+        if self.metrics.textfile:
+            self.log_info(f'Metrics: "{self.metrics.textfile}"')
+        if self.memory:
+            self.log_info(f'Memory: {self.memory}')
+        if self.journal:
+            self.log_info(f'Journal: "{self.journal.file}"')
+
+    def log_filter(self):
+        """
+        Logs the filter configuration and the part of it evaluated by git
+        :return: None
+        """
+        settings = [
+            ('Ignored authors', self.ignore or []),
+            ('Included messages', self.commit_filter.include_messages),
+            ('Excluded messages', self.commit_filter.exclude_messages),
+            ('Observed refs', self.ref_scope.include),
+            ('Skipped refs', self.ref_scope.exclude),
+            ('Merge mode by folder', [f'{folder}={mode}' for folder, mode in self.merge_mode.overrides.items()])
+        ]
+        if self.merge_mode.default != 'all':
+            self.log_info(f'Merge mode: {self.merge_mode.default}')
+        for title, values in settings:
+            if len(values) > 0:
+                self.log_info(f'{title}: {str.join(", ", values)}')
+        if len(self.filter_plan.git_args) > 0:
+            self.log_info(f'Filter passed to git: {" ".join(self.filter_plan.git_args)}')
+        if len(self.filter_plan.exclude_args) > 0:
+            self.log_info(f'Exclusion listed by git: {" ".join(self.filter_plan.exclude_args)}')
 
     def get_git_log_cmd(self, path: str) -> list[str]:
         """
@@ -79,21 +238,90 @@ class GitObserver:
         :param path: relative folder to receive log info for
         :return: argument list to be used when calling external git executable
         """
-        sort_flag = '--date-order'
-        if not self.descending:
-            sort_flag = '--reverse'
         return [
             'git',
             f'--git-dir={self.filepath}/.git/',
             f'--work-tree={self.filepath}',
             'log',
             f'--since="{self.since}"',
-            '--pretty=format:"%cn|%cI|%s|%h|%D"',
-            '--all',
-            sort_flag,
+            '--pretty=format:"%cn|%cI|%s|%H|%D"',
+            *self.ref_scope.get_traversal_args(),
+            *self.ref_scope.get_decoration_args(),
+            *self.filter_plan.git_args,
+            *self.merge_mode.get_args(path),
+            *self.get_sort_args(),
             f'{self.filepath}/{path}'
         ]
 
+    def get_excluded_cmd(self) -> list[str]:
+        """
+        Builds the git log listing commits of the observed time span and refs, which match an exclusion pattern.
+        Not limited to a folder, so one call serves all of them
+        :return: argument list to be used when calling external git executable
+        """
+        return [
+            'git',
+            f'--git-dir={self.filepath}/.git/',
+            'log',
+            f'--since="{self.since}"',
+            '--format=%H',
+            *self.ref_scope.get_traversal_args(),
+            *self.filter_plan.exclude_args
+        ]
+
+    def read_excluded(self) -> set[bytes] | None:
+        """
+        Lists commits excluded by message, if git evaluates exclusion besides inclusion
+        :return: raw object identifiers, None if git failed or got killed
+        """
+        result = self.runner.run(self.get_excluded_cmd())
+        if not result.ok:
+            return None
+        return {bytes.fromhex(sha1.decode('ascii')) for sha1 in result.stdout.split()}
+
+    def get_sort_args(self) -> list[str]:
+        """
+        Builds the ordering arguments of git log.
+        Both orders require git to finish its traversal before emitting the first commit,
+        so in streaming mode git emits its natural order and the observer sorts while reading
+        :return: ordering arguments
+        """
+        if self.streaming:
+            return []
+        if not self.descending:
+            return ['--reverse']
+        return ['--date-order']
+
+    def plan_filter(self) -> FilterPlan:
+        """
+        Decides which filter criteria are evaluated by git.
+        Replayed outputs are not filtered by git, so everything is evaluated in Python
+        :return: FilterPlan
+        """
+        if self.runner.replay:
+            return self.commit_filter.plan(pushdown=False)
+        # Probing is only worth a git call, if there is something to push down
+        commit_filter = self.commit_filter
+        pushed = commit_filter.authors or commit_filter.include_messages or commit_filter.exclude_messages
+        perl_regexp = bool(pushed) and self.has_perl_regexp()
+        return self.commit_filter.plan(perl_regexp=perl_regexp)
+
+    def has_perl_regexp(self) -> bool:
+        """
+        Checks if the git executable was built with support of perl compatible regular expressions
+        :return: TRUE if --perl-regexp is supported
+        """
+        probe = [
+            'git',
+            f'--git-dir={self.filepath}/.git/',
+            'log',
+            '-1',
+            '--perl-regexp',
+            '--grep=^',
+            '--format='
+        ]
+        return self.runner.run(probe, capture=False).ok
+
     def get_git_show_cmd(self, sha1: str) -> list[str]:
         """
         Builds a list of arguments passed to subprocess,
@@ -119,49 +347,204 @@ class GitObserver:
         :return: log info
         """
         observations: list[Observation] = []
+        if self.watchdog:
+            self.watchdog.arm()
+        self.poll = PollMetrics()
+        self.poll_git_metrics = self.runner.get_metrics()
+        self.reported_hashes.clear()
         if not self.is_test:
-            self.OnStatus("Git fetch...")
-            subprocess.run(self.git_fetch, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if self.runner.governor.defer('fetch'):
+                self.OnStatus("System busy, git fetch deferred")
+            else:
+                self.OnStatus("Git fetch...")
+                with self.poll.measure('fetch'):
+                    self.runner.run(self.git_fetch, capture=False)
+                self.refresh_graph()
+        if self.journal:
+            self.poll.fingerprint = self.get_ref_fingerprint()
+        if self.filter_plan.exclude_args:
+            with self.poll.measure('filter'):
+                excluded = self.read_excluded()
+            if excluded is None:
+                # Excluded commits would be reported and never be read again
+                self.OnStatus("Listing excluded commits failed, iteration skipped")
+                return observations
+            self.filter_plan.excluded = excluded
 
         for path in self.logfolders:
             messages = self.handle_observed_path(path)
             observations.append(Observation(path, messages))
         return observations
 
+    def complete_poll(self):
+        """
+        Finishes the metrics of current iteration, after its observations were dispatched,
+        aggregates them and notifies subscribers of OnMetrics
+        :return: None
+        """
+        if self.watchdog:
+            self.watchdog.disarm()
+        self.poll.count_commands(self.poll_git_metrics, self.runner.get_metrics())
+        self.poll.finish()
+        self.metrics.record(self.poll)
+        if self.journal:
+            self.journal.append(PollJournal.create_record(self.filepath, self.poll))
+        self.OnMetrics(self.poll)
+        if self.memory:
+            share = self.memory.account()
+            if share > 0:
+                self.evict_known()
+                if self.OnMemoryExceeded.eventhandler:
+                    self.OnMemoryExceeded(share)
+                else:
+                    self.shed_known(share)
+
+    def on_stall(self, message: str):
+        """
+        Handler of watchdog, reporting a stalled iteration
+        :param message: status message
+        :return: None
+        """
+        self.poll.errors.append(message)
+        self.OnStatus(message)
+
+    def get_ref_fingerprint(self) -> str:
+        """
+        Hashes the names and targets of all refs, so iterations of an unchanged repository can be told apart
+        :return: hash of refs, empty if git failed
+        """
+        refs_cmd = [
+            'git',
+            f'--git-dir={self.filepath}/.git/',
+            'for-each-ref',
+            '--format=%(objectname) %(refname)'
+        ]
+        result = self.runner.run(refs_cmd)
+        return hashlib.sha1(result.stdout).hexdigest()[:12] if result.ok else ''
+
+    def close_journal(self):
+        """
+        Writes buffered journal records, e.g. before exit
+        :return: None
+        """
+        if self.journal:
+            self.journal.close()
+
+    def evict_known(self) -> int:
+        """
+        Forgets known commits seen before the observed time span, git log can not return them again.
+        Commits seen within it are kept, forgetting them would report them again
+        :return: number of evicted commits
+        """
+        oldest_allowed = time() - (self.SINCE_DEFAULT + self.CLOCK_SKEW).total_seconds()
+        # Known commits are ordered by time seen, so the evicted ones are at the front
+        evicted = list(takewhile(lambda oid: self.known_hashes[oid] < oldest_allowed, self.known_hashes))
+        for oid in evicted:
+            del self.known_hashes[oid]
+        return len(evicted)
+
+    def shed_known(self, share: float) -> int:
+        """
+        Forgets the given share of commits seen first, when nobody else holds observations to evict,
+        e.g. in shell mode without timeline. The budget wins over deduplication, git log may report them again
+        :param share: share of known commits between 0 and 1
+        :return: number of forgotten commits
+        """
+        count = int(len(self.known_hashes) * share)
+        # Rebuilt instead of deleted from, a dict does not give memory of deleted entries back
+        self.known_hashes = dict(islice(self.known_hashes.items(), count, None))
+        self.logger.warning(f'Memory: no observations to evict, forgot {count} known commit(s), '
+                            f'git log may report them again')
+        return count
+
+    def refresh_graph(self):
+        """
+        Adds fetched commits to the commit-graph in background, if maintenance is enabled.
+        Skipped while the previous refresh is still running
+        :return: None
+        """
+        if not self.maintain_graph:
+            return
+        if self.maintenance_task and not self.maintenance_task.done:
+            return
+        if self.runner.governor.defer('maintenance'):
+            return
+        self.maintenance_task = BackgroundTask(self.write_graph).start()
+
+    def write_graph(self):
+        """
+        Writes the commit-graph at low priority and measures
+        its speedup of git log once per instance
+        :return: None
+        """
+        if not self.maintenance.write_graph():
+            self.log_info('Writing commit-graph failed')
+            return
+        self.log_info(f'Repository: {self.maintenance.get_status()}')
+        if self.graph_speedup is not None or not self.logfolders:
+            return
+        folder = self.logfolders[0]
+        self.graph_speedup = self.maintenance.measure_speedup(self.get_git_log_cmd(folder))
+        self.log_info(f'Commit-graph speeds up git log ({folder}) by factor {self.graph_speedup:.1f}')
+
     def read_git_commits(self, path: str) -> list[Commit]:
         """
         Returns the Git log as a string.
         If the test param is true, it returns the content of a .txt file instead,
         that represents a mockup of a gitlog.
 
+        In streaming mode each commit is inserted into a buffer sorted newest first while git still walks,
+        git emits roughly that order already, so insertion mostly appends.
+        Nothing is returned if git failed or got killed, so the commits are read again by the next iteration.
+
         :param path: Git-Paths from a repo.
         :return: The whole Git log as string.
         """
         git_log = []
-        with self.get_git_log_bytes(path) as response_stream:
+        start = perf_counter()
+        parse_duration = 0.0
+        log_process = self.get_git_log_bytes(path)
+        with log_process as response_stream:
             while True:
                 line = response_stream.readline()
                 if not line:
                     break
+                parse_start = perf_counter()
+                self.poll.bytes_read += len(line)
                 commit_line = line.decode("utf-8").rstrip()[1:-1]
                 commit = ObservationUtil.parse_commit_formatted(commit_line, self.origin)
                 if commit:
-                    git_log.append(commit)
+                    if self.streaming:
+                        insort(git_log, commit, key=lambda cmt: -cmt.date.timestamp())
+                    else:
+                        git_log.append(commit)
+                parse_duration += perf_counter() - parse_start
+        # Everything but parsing is waiting for and reading git output
+        log_duration = perf_counter() - start - parse_duration
+        self.poll.folders[path] = log_duration
+        self.poll.add('log', log_duration)
+        self.poll.add('parse', parse_duration)
+        if not log_process.result.ok:
+            # Output of a failed or killed call may be truncated, its missing commits would never be read
+            self.log_info(f'Git log ({path}) did not complete, its {len(git_log)} commit(s) are read again next time')
+            return []
+        if self.streaming and not self.descending:
+            # Same order like --reverse
+            git_log.reverse()
         return git_log
 
-    def get_git_log_bytes(self, path: str) -> IO:
+    def get_git_log_bytes(self, path: str) -> GitProcess | ReplayProcess | FinishedProcess:
         """
         Gets an IO stream of bytes representing the git log result.
-        Is a common file stream reading from static dummy in test case.
+        Is a replayed stream in test case.
 
-        PLEASE NOTE: the stream has to be closed by caller
+        PLEASE NOTE: needs to be used as context manager, which yields the stream
+        and reaps the git process afterwards
         :param path: observed folder
-        :return: IO byte stream to read from
+        :return: context manager of IO byte stream to read from, holding the result of the call afterwards
         """
-        if not self.is_test:
-            cmd = self.get_git_log_cmd(path)
-            return subprocess.Popen(cmd, stdout=subprocess.PIPE).stdout
-        return open(self.gitlog_dummy_file, mode='rb', buffering=-1, errors=None, closefd=True)
+        cmd = self.get_git_log_cmd(path)
+        return self.runner.stream(cmd)
 
     def handle_observed_path(self, path: str) -> list[Commit]:
         """
@@ -173,63 +556,90 @@ class GitObserver:
         self.OnStatus(f"Git log ({path})...")
         response = self.read_git_commits(path)
         self.OnStatus(f"Reading {path} commits...")
-        messages = self.filter_commit_result(response)
+        seen: list[Commit] = []
+        reported = len(self.reported_hashes)
+        with self.poll.measure('filter'):
+            messages = self.filter_commit_result(response, seen)
+        self.poll.commits_seen += len(response)
+        self.poll.commits_new += len(seen)
+        # Commits reported again for another folder are neither new nor ignored
+        self.poll.commits_ignored += len(seen) - (len(self.reported_hashes) - reported)
+        self.store_observed_path(path, seen)
         if len(messages) == 0:
             return []
         return messages
 
-    def filter_commit_result(self, commits: list[Commit]) -> list[Commit]:
+    def store_observed_path(self, path: str, seen: list[Commit]):
+        """
+        Persists newly seen commits of one observed path,
+        if a store is configured
+        :param path: observed path
+        :param seen: commits not known before
+        :return: None
+        """
+        if not self.store or len(seen) == 0:
+            return
+        self.store.save(self.filepath, path, seen)
+
+    def filter_commit_result(self, commits: list[Commit], seen: list[Commit] = None) -> list[Commit]:
         """
         Filters parsed commit messages by configured criteria
-        and removes already shown commits
+        and removes already shown commits. In timeline mode, commits reported
+        within current iteration for another folder are kept
         :param commits: list of parsed commits
+        :param seen: [Optional] list receiving all commits that were not known before, including ignored ones
         :return: filtered and sorted list
         """
         messages = []
         if len(commits) <= 0:
             return messages
 
+        # Commits of one call are seen at once, eviction does not need more precision
+        seen_time = time()
+        # Hot loop of every iteration, attributes are looked up once
+        known_hashes = self.known_hashes
+        reported_hashes = self.reported_hashes
+        tag_folders = self.tag_folders
+        checkpoint = self.checkpoint
+        accepts = self.filter_plan.accepts
         for commit in commits:
             if not commit:
                 continue
 
-            if commit.sha1 in self.known_hashes:
+            oid = commit.oid
+            # Seen by this instance, or by a previous run stored in checkpoint
+            if oid in known_hashes or (checkpoint is not None and oid in checkpoint):
+                if tag_folders and oid in reported_hashes:
+                    messages.append(commit)
                 continue
-            self.known_hashes.append(commit.sha1)
+            known_hashes[oid] = seen_time
+            if checkpoint is not None:
+                checkpoint.add(oid)
+            if seen is not None:
+                seen.append(commit)
 
-            if self.ignore_author(commit.author):
+            if not accepts(commit):
                 continue
+            reported_hashes.add(oid)
             messages.append(commit)
 
         if len(messages) > 0:
             messages.reverse()
         return messages
 
-    def ignore_author(self, author: str) -> bool:
-        """
-        Determines if the given author name is to be ignored.
-        If no ignore list is given by config, all authors are relevant
-        :param author: committer
-        :return: TRUE if author needs to be ignored
-        """
-        if self.ignore is None:
-            return False
-
-        for author_ignore in self.ignore:
-            if author == author_ignore:
-                return True
-        return False
-
-    def get_git_show(self, sha1: str) -> str:
+    def get_git_show(self, sha1: str, token: CancelToken = None) -> str:
         """
         Returns single commit identified by param SHA1
         using git command line
         :param sha1: SHA1
-        :return: git show result
+        :param token: [Optional] token allowing the caller to cancel the call
+        :return: git show result, or its error if it failed
         """
         git_show_cmd = self.get_git_show_cmd(sha1)
-        # Should be a utility for external calls instead of redundant
-        response = subprocess.run(git_show_cmd, stdout=subprocess.PIPE)
+        response = self.runner.run(git_show_cmd, urgent=True, token=token)
+        if not response.ok:
+            error = 'timed out' if response.timed_out else response.stderr.strip()
+            return f'Git show failed: {error}'
         return response.stdout.decode("utf-8")
 
     def log_info(self, message: str):
@@ -258,6 +668,10 @@ class GitObserverThread(Thread, GitObserver):
     """
     Signal flag to tell, if loop is active
     """
+    STOP_TIMEOUT: float = 5.0
+    """
+    Seconds stopping waits for the loop to finish its iteration
+    """
 
     def __init__(self, config: Namespace, is_test_instance: bool = False):
         """
@@ -280,18 +694,34 @@ class GitObserverThread(Thread, GitObserver):
         # May this should be configurable
         interval_ms = 1000 * 60
         ms_since_last_iteration = interval_ms + 1
+        last_status = ''
         while self.__run_thread:
             if ms_since_last_iteration >= interval_ms:
                 ms_since_last_iteration = 0
                 result = self.load_observations()
-                self.OnLoaded(result)
+                with self.poll.measure('dispatch'):
+                    self.OnLoaded(result)
+                self.complete_poll()
+                last_status = ''
             else:
                 delta = TimeUtil.calculate_countdown(interval_ms, ms_since_last_iteration)
                 status = f'Waiting for iteration {delta.min:02d}:{delta.second:02d}'
-                self.OnStatus(status)
+                # Countdown only changes each second, don't bother subscribers in between
+                if status != last_status:
+                    last_status = status
+                    self.OnStatus(status)
             sleep(0.25)
             ms_since_last_iteration += 250
+        # Only written once the loop ended, so the record of its last iteration is included
+        self.close_journal()
 
     def stop_observation(self):
         self.logger.info("Shutting down thread")
         self.__run_thread = False
+        if self.watchdog:
+            self.watchdog.stop()
+        self.runner.kill_all()
+        # Killed git calls return at once, so the loop completes its iteration and ends
+        if self.is_alive() and current_thread() is not self:
+            self.join(self.STOP_TIMEOUT)
+        self.runner.log_metrics()
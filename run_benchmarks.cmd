@@ -0,0 +1 @@
+python -m core.tests.benchmark %*
\ No newline at end of file
@@ -0,0 +1 @@
+python3 -m core.tests.benchmark "$@"
\ No newline at end of file
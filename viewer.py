@@ -1,7 +1,10 @@
 import webbrowser as wb
 from collections import namedtuple
-from datetime import datetime
-from tkinter import BOTH, BOTTOM, NORMAL, RIGHT, X, Y, ttk, PhotoImage, LEFT, Button, W
+from datetime import datetime, timedelta
+from queue import Empty, SimpleQueue
+from time import monotonic
+from typing import Any, Callable
+from tkinter import BOTH, BOTTOM, RIGHT, X, Y, ttk, PhotoImage, LEFT, Button, W
 from tkinter import Tk, Frame, Scrollbar, Label
 from tkinter.font import Font
 from tkinter.ttk import Sizegrip
@@ -9,10 +12,16 @@ from tkinter.ttk import Sizegrip
 import _version
 from core.event import StatusEventArgs
 from core.paths import Paths
-from core.tkinter.util import TkUtil, ZOOMED
+from core.runner import CancelToken
+from core.search import CommitIndex
+from core.timeline import Timeline, TimelineEntry
+from core.tkinter.util import MessageDialog, Textbox, TkUtil
 from core.tkinter.config import ConfigWindow
+from core.tkinter.columns import ColumnGroup, ColumnLayout
+from core.tkinter.grid import FilteredRows, GridRow, GridStore
 from core.transport import Observation, ObservationEventArgs, Commit
 from core.transport import ObservationUtil
+from core.worker import BackgroundTask
 from observer import GitObserverThread
 
 c_paths = Paths()
@@ -28,6 +37,26 @@ class GitObserverViewer(Tk):
     observations column wise
     """
 
+    DETAIL_POLL_MS = 50
+    """
+    Milliseconds between two checks of a pending commit detail request
+    """
+
+    OBSERVER_POLL_MS = 50
+    """
+    Milliseconds between two checks for events received from the observer thread
+    """
+
+    SEARCH_DELAY_MS = 150
+    """
+    Milliseconds between a change of search text and applying it
+    """
+
+    TIMELINE_COLUMN = 'Timeline'
+    """
+    Heading of the single commit column in timeline mode
+    """
+
     def __init__(self, app_config):
         """"
         Instantiates a new instance and passes given
@@ -39,12 +68,42 @@ class GitObserverViewer(Tk):
         self.config = app_config
         self.config.descending = True
 
-        # Instance wide store row number and two-dimensional rows and their commits (columns)
-        self.row_count: int = 0
-        self.grid_data: list[list[Commit | None]] = list()
+        # Instance wide store of rows and their commits (columns), bounded by size and age
+        max_age = timedelta(hours=int(self.config.viewer_max_age_h)) if int(self.config.viewer_max_age_h) > 0 else None
+        self.grid_store = GridStore(int(self.config.viewer_max_rows), max_age)
+
+        # Only a window of the store is materialized in TreeView, starting at view_offset
+        self.view_window: int = max(1, int(self.config.viewer_window))
+        self.view_offset: int = 0
+        self.view_count: int = 0
+        self.scroll_pending: bool = False
+
+        # Rows shown by TreeView, either whole grid_store or rows matching current search
+        self.view_source: GridStore | FilteredRows = self.grid_store
+        self.search_index = CommitIndex()
+        self.search_query: str = ''
+        self.search_scheduled: bool = False
+
+        # Status updates are coalesced to at most one label update per interval
+        self.status_interval_ms: int = max(0, int(self.config.status_interval_ms))
+        self.status_text: str = ''
+        self.status_pending: str = ''
+        self.status_scheduled: bool = False
+        self.status_last_update: float = 0.0
+
+        # While iconified, observations are collected and rendered in one batch on restore
+        self.is_iconified: bool = False
+        self.pending_observations: list[list[Observation]] = []
+
+        # Events of the observer thread are handed over to the UI thread, which is the only one calling Tk
+        self.observer_events: SimpleQueue[tuple[Callable[..., None], tuple[Any, ...]]] = SimpleQueue()
+        self.observer_poll_id: str | None = None
 
         # Get notified when closed
         self.protocol("WM_DELETE_WINDOW", self.root_delete)
+        # Get notified when minimized and restored
+        self.bind('<Unmap>', self.on_unmap)
+        self.bind('<Map>', self.on_map)
 
         # Open PhotoImage to be passed to created form
         icon = PhotoImage(file=c_paths.FAVICON)
@@ -68,8 +127,7 @@ class GitObserverViewer(Tk):
         self.view_scroll_y = Scrollbar(self.view_frame, orient='vertical')
         self.view_scroll_y.pack(side=RIGHT, fill=Y)
 
-        self.tv_commits = ttk.Treeview(self.view_frame, show="headings",
-                                       yscrollcommand=self.view_scroll_y.set, xscrollcommand=self.view_scroll_x.set)
+        self.tv_commits = ttk.Treeview(self.view_frame, show="headings", yscrollcommand=self.on_tree_scroll)
 
         # Bottom stack
         self.bottom_stack = Frame(self.view_frame, background='lightgray')
@@ -83,6 +141,12 @@ class GitObserverViewer(Tk):
         self.status_bar = Label(self.bottom_stack, text="Initializing...", background='lightgray', pady=0, padx=0)
         self.status_bar.pack(side=LEFT, anchor=W)
 
+        self.search_box = Textbox(master=self.bottom_stack, width=30)
+        self.search_box.text.trace_add('write', self.on_search_changed)
+        self.search_box.pack(side=RIGHT, padx=(1, 10))
+        self.search_label = Label(self.bottom_stack, text='Search:', background='lightgray', pady=0, padx=0)
+        self.search_label.pack(side=RIGHT)
+
         self.bottom_stack.pack(side=BOTTOM, fill=X)
 
         # Bind cell click event to open_link
@@ -90,14 +154,25 @@ class GitObserverViewer(Tk):
         self.tv_commits.bind('<Control-Button-1>', self.control_click)
         self.tv_commits.pack(fill=X, expand=True)
         self.view_scroll_y.config(command=self.tv_commits.yview)
-        self.view_scroll_x.config(command=self.tv_commits.xview)
-        self.create_columns(app_config.logfolders)
+        # Horizontal scrolling moves the window of materialized folder columns
+        self.view_scroll_x.config(command=self.on_column_scroll)
+        self.tv_commits.bind('<Shift-MouseWheel>', self.on_column_wheel)
+        self.tv_commits.bind('<Shift-Button-4>', self.on_column_wheel)
+        self.tv_commits.bind('<Shift-Button-5>', self.on_column_wheel)
+        self.column_layout: ColumnLayout | None = None
+        self.group_commands: dict[str, str] = dict()
+        # In timeline mode, commits of all folders share one column, bounded like the rows showing them
+        self.timeline = Timeline(self.config.descending, self.grid_store.max_rows, self.grid_store.max_age) \
+            if self.config.timeline else None
+        self.create_columns([self.TIMELINE_COLUMN] if self.timeline is not None else app_config.logfolders)
 
         # Finally instantiate GitObserver with received conf
         self.observer = GitObserverThread(self.config)
         self.observer.OnLoaded += self.observer_loaded
         self.observer.OnStatus += self.observer_status
+        self.observer.OnMemoryExceeded += self.observer_memory_exceeded
         self.observer.start()
+        self.observer_poll_id = self.after(self.OBSERVER_POLL_MS, self.poll_observer)
 
     def root_delete(self):
         """
@@ -106,92 +181,419 @@ class GitObserverViewer(Tk):
         :return: None
         """
         # Notify observer thread that its about to die
+        if self.observer_poll_id:
+            self.after_cancel(self.observer_poll_id)
         self.observer.stop_observation()
         self.destroy()
 
+    def poll_observer(self):
+        """
+        Handles all events received from the observer thread on the UI thread
+        and checks again after OBSERVER_POLL_MS
+        :return: None
+        """
+        while True:
+            try:
+                handler, args = self.observer_events.get_nowait()
+            except Empty:
+                break
+            handler(*args)
+        self.observer_poll_id = self.after(self.OBSERVER_POLL_MS, self.poll_observer)
+
     def observer_loaded(self, observation_args: ObservationEventArgs):
         """
         Event handler that reacts on external event
-        of successfully loaded observations
+        of successfully loaded observations.
+        Called by the observer thread, so the observations are only queued for the UI thread
         :param observation_args: newly loaded observations
         :return: None
         """
         if observation_args is None:
             return
-        self.update_view(observation_args.observations)
+        self.observer_events.put((self.update_view, (observation_args.observations,)))
 
     def observer_status(self, status_args: StatusEventArgs):
         """
         Event handler that react on status changed triggered
-        by class member observer
+        by class member observer.
+        Called by the observer thread, so the status is only queued for the UI thread
         :param status_args: current status of observer
         :return: None
         """
+        self.observer_events.put((self.schedule_status, (f'Status: {status_args.status}',)))
+
+    def schedule_status(self, status: str):
+        """
+        Remembers the status and schedules one label update per configured interval
+        :param status: status text to show
+        :return: None
+        """
         if not self.status_bar:
             return
 
-        # Either window is in normal state or its maximized
-        # which is called 'zoomed' using Windows
-        if self.wm_state() == NORMAL or self.wm_state() == ZOOMED:
-            status_text = f'Status: {status_args.status}'
-            self.status_bar.config(text=status_text)
+        self.status_pending = status
+        if self.status_scheduled:
+            return
+        self.status_scheduled = True
+        elapsed_ms = (monotonic() - self.status_last_update) * 1000
+        self.after(int(max(0.0, self.status_interval_ms - elapsed_ms)), self.flush_status)
+
+    def flush_status(self):
+        """
+        Applies the latest pending status to the status bar.
+        Skipped while iconified or if the text did not change
+        :return: None
+        """
+        self.status_scheduled = False
+        if self.is_iconified or self.status_pending == self.status_text:
+            return
+        self.status_text = self.status_pending
+        self.status_last_update = monotonic()
+        self.status_bar.config(text=self.status_text)
+
+    def on_unmap(self, event):
+        """
+        Event handler when root window gets minimized (or withdrawn)
+        :param event: Unmap event
+        :return: None
+        """
+        # Children of root propagate their events to root bindings as well
+        if event.widget is self:
+            self.is_iconified = True
+
+    def on_map(self, event):
+        """
+        Event handler when root window gets restored.
+        Renders observations and status received while iconified
+        :param event: Map event
+        :return: None
+        """
+        if event.widget is not self or not self.is_iconified:
+            return
+        self.is_iconified = False
+
+        pending = self.pending_observations
+        self.pending_observations = []
+        self.render_observations(pending)
+        self.flush_status()
 
     def update_view(self, observations: list[Observation]):
         """
         Update routine to get a list of Observation
         at the end of currently shown table.
-        Won't do anything if given list is empty (see is_empty)
+        Won't do anything if given list is empty (see is_empty).
+        While iconified, the observations are kept for rendering on restore
         :param observations: New observation results that should be appended
         :return: None
         """
         if ObservationUtil.is_empty(observations):
             return
 
-        # add data
+        if self.is_iconified:
+            self.pending_observations.append(observations)
+            return
+        self.render_observations([observations])
+
+    def render_observations(self, observation_blocks: list[list[Observation]]):
+        """
+        Adds all given observation blocks to grid store and search index
+        and renders them in one pass
+        :param observation_blocks: observation results in order of arrival
+        :return: None
+        """
+        added = 0
+        for observations in observation_blocks:
+            for row in self.build_rows(observations):
+                self.grid_store.prepend(row)
+                self.search_index.add(row.key, row.commits)
+                if self.view_source is self.grid_store:
+                    added += 1
+                elif self.search_index.matches(row.key, self.search_query):
+                    self.view_source.prepend(row)
+                    added += 1
+        evicted = self.grid_store.evict()
+
+        if added > 0:
+            self.render_prepended(added)
+        self.drop_evicted(evicted)
+
+    def drop_evicted(self, evicted: list[GridRow]):
+        """
+        Removes rows evicted from grid store from search index and TreeView
+        :param evicted: evicted rows
+        :return: None
+        """
+        for row in evicted:
+            self.search_index.remove(row.key)
+        if self.view_source is self.grid_store:
+            self.render_evicted(len(evicted))
+        else:
+            self.render_evicted(self.view_source.discard(self.grid_store))
+
+    def observer_memory_exceeded(self, share: float):
+        """
+        Event handler that reacts on exceeded memory budget of observer.
+        Called by the observer thread, so the share of oldest rows is evicted on the UI thread
+        :param share: share of rows to evict
+        :return: None
+        """
+        self.observer_events.put((self.shed_rows, (share,)))
+
+    def shed_rows(self, share: float):
+        """
+        Evicts the given share of oldest rows and timeline entries
+        :param share: share of rows to evict
+        :return: None
+        """
+        if self.timeline is not None:
+            self.timeline.shed(share)
+        self.drop_evicted(self.grid_store.shed(share))
+
+    def on_search_changed(self, *args):
+        """
+        Event handler of search box changes.
+        Applies the search shortly after typing paused
+        :param args: trace arguments of StringVar (unused)
+        :return: None
+        """
+        if self.search_scheduled:
+            return
+        self.search_scheduled = True
+        self.after(self.SEARCH_DELAY_MS, self.apply_search)
+
+    def apply_search(self):
+        """
+        Narrows the shown rows to those matching the current search text
+        and renders them from the top
+        :return: None
+        """
+        self.search_scheduled = False
+        query = self.search_box.get().strip()
+        if query == self.search_query:
+            return
+        self.search_query = query
+
+        if query:
+            matches = self.search_index.search(query)
+            self.view_source = FilteredRows(self.grid_store.ordered(matches))
+        else:
+            self.view_source = self.grid_store
+
+        self.tv_commits.delete(*self.tv_commits.get_children())
+        self.view_offset = 0
+        self.view_count = 0
+        self.render_prepended(min(self.view_window, len(self.view_source)))
+
+    def build_rows(self, observations: list[Observation]) -> list[GridRow]:
+        """
+        Converts observations into rows of the grid,
+        either column wise per folder or one row per commit in timeline mode
+        :param observations: New observation results
+        :return: rows in order of insertion (last one is the newest)
+        """
+        if self.timeline is not None:
+            return self.build_timeline_rows(self.timeline.extend(observations))
+        return self.build_folder_rows(observations)
+
+    @staticmethod
+    def build_folder_rows(observations: list[Observation]) -> list[GridRow]:
+        """
+        Converts column wise observations into rows of the grid.
+        The last row of the block is labeled with current time stamp
+        :param observations: New observation results
+        :return: rows in order of insertion (last one is the newest)
+        """
         update_row_count = 0
         for folder in observations:
             commit_count = len(folder.commits)
             if commit_count > update_row_count:
                 update_row_count = commit_count
 
+        rows: list[GridRow] = []
         for row_idx in range(0, update_row_count):
-            row_values = []
-            row_commits: list[Commit | None] = list()
+            label = ''
             if row_idx == (update_row_count - 1):
-                row_values.append(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-            else:
-                row_values.append('')
+                label = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
+            row_commits: list[Commit | None] = list()
             for folder in observations:
-                if row_idx >= len(folder.commits):
-                    row_values.append('')
-                    row_commits.append(None)
-                    continue
-                commit = folder.commits[row_idx]
-                value = f"{commit.author}: {commit.message} ({commit.date.strftime('%Y-%m-%d %H:%M:%S')})"
-                row_values.append(value)
-                row_commits.append(commit)
-            self.grid_data.insert(0, row_commits)
-            self.tv_commits.insert(parent='', index=0, values=row_values)
-            self.row_count += 1
-
-        self.tv_commits.pack_forget()
-        self.tv_commits.pack(fill=BOTH, expand=True)
+                row_commits.append(folder.commits[row_idx] if row_idx < len(folder.commits) else None)
+            rows.append(GridRow(row_commits, label))
+        return rows
+
+    @staticmethod
+    def build_timeline_rows(entries: list[TimelineEntry]) -> list[GridRow]:
+        """
+        Converts new timeline entries into one row per commit.
+        The last row of the block is labeled with current time stamp
+        :param entries: New timeline entries, oldest first
+        :return: rows in order of insertion (last one is the newest)
+        """
+        rows: list[GridRow] = []
+        for idx, entry in enumerate(entries):
+            label = datetime.now().strftime('%Y-%m-%d %H:%M:%S') if idx == len(entries) - 1 else ''
+            rows.append(GridRow([entry.commit], label, folders=entry.folders))
+        return rows
+
+    def get_row_values(self, row: GridRow) -> list[str]:
+        """
+        Formats the cell texts of visible columns of given row
+        :param row: row to be shown
+        :return: values per column
+        """
+        row_values = [row.label]
+        for spec in self.column_layout.get_visible():
+            commit, folder_idx, hidden = ColumnLayout.get_cell(row.commits, spec)
+            if not commit:
+                row_values.append('')
+                continue
+            value = f"{commit.author}: {commit.message} ({commit.date.strftime('%Y-%m-%d %H:%M:%S')})"
+            if len(spec.folders) > 1:
+                value = f'[{self.column_layout.folders[folder_idx]}] {value}'
+            elif row.folders:
+                value = f'[{", ".join(row.folders)}] {value}'
+            if hidden > 0:
+                value = f'{value} +{hidden}'
+            row_values.append(value)
+        return row_values
+
+    def render_prepended(self, added: int):
+        """
+        Materializes newly prepended rows on top of TreeView,
+        if the top of the store is currently shown
+        :param added: number of rows prepended to store
+        :return: None
+        """
+        if self.view_offset > 0:
+            # User is browsing older rows, new ones get rendered when scrolling back to top
+            self.view_offset += added
+            return
+
+        # Rows beyond the window would be trimmed right away, a large burst only materializes the window
+        rendered = min(added, self.view_window)
+        for idx, row in enumerate(self.view_source.window(0, rendered)):
+            self.tv_commits.insert(parent='', index=idx, iid=row.key, values=self.get_row_values(row))
+        self.view_count += rendered
+        self.trim_view(min(self.view_window, len(self.view_source)))
+
+    def render_evicted(self, evicted: int):
+        """
+        Removes materialized rows, which got evicted from store
+        :param evicted: number of rows evicted from end of store
+        :return: None
+        """
+        if evicted <= 0:
+            return
+        available = len(self.view_source) - self.view_offset
+        if available < 0:
+            # Whole window got evicted, restart at top of store
+            self.view_offset = 0
+            self.view_count = 0
+            self.tv_commits.delete(*self.tv_commits.get_children())
+            self.render_prepended(min(self.view_window, len(self.view_source)))
+            return
+        self.trim_view(available)
+
+    def trim_view(self, limit: int):
+        """
+        Deletes materialized rows from bottom of TreeView
+        until given limit is reached
+        :param limit: maximum number of materialized rows
+        :return: None
+        """
+        surplus = self.view_count - limit
+        if surplus <= 0:
+            return
+        children = self.tv_commits.get_children()
+        self.tv_commits.delete(*children[-surplus:])
+        self.view_count -= surplus
+
+    def on_tree_scroll(self, first: str, last: str):
+        """
+        Handler of TreeView vertical scroll changes.
+        Updates scrollbar and moves materialized window when reaching its edges
+        :param first: fraction of top visible position
+        :param last: fraction of bottom visible position
+        :return: None
+        """
+        self.view_scroll_y.set(first, last)
+        if self.scroll_pending:
+            return
+
+        has_rows_below = self.view_offset + self.view_count < len(self.view_source)
+        if float(last) >= 1.0 and has_rows_below:
+            self.scroll_pending = True
+            self.after_idle(self.shift_view_down)
+        elif float(first) <= 0.0 and self.view_offset > 0:
+            self.scroll_pending = True
+            self.after_idle(self.shift_view_up)
+
+    def shift_view_down(self):
+        """
+        Materializes the next page of older rows at the bottom
+        and drops the same amount of rows at the top
+        :return: None
+        """
+        self.scroll_pending = False
+        page = self.view_source.window(self.view_offset + self.view_count, max(1, self.view_window // 2))
+        if len(page) == 0:
+            return
+        children = self.tv_commits.get_children()
+        for row in page:
+            self.tv_commits.insert(parent='', index='end', iid=row.key, values=self.get_row_values(row))
+        self.view_count += len(page)
+
+        surplus = max(0, self.view_count - self.view_window)
+        if surplus > 0:
+            self.tv_commits.delete(*children[:surplus])
+            self.view_count -= surplus
+            self.view_offset += surplus
+        if len(children) > surplus:
+            self.tv_commits.see(children[-1])
+
+    def shift_view_up(self):
+        """
+        Materializes the previous page of newer rows at the top
+        and drops the same amount of rows at the bottom
+        :return: None
+        """
+        self.scroll_pending = False
+        page_size = min(self.view_offset, max(1, self.view_window // 2))
+        if page_size <= 0:
+            return
+        children = self.tv_commits.get_children()
+        self.view_offset -= page_size
+        for idx, row in enumerate(self.view_source.window(self.view_offset, page_size)):
+            self.tv_commits.insert(parent='', index=idx, iid=row.key, values=self.get_row_values(row))
+        self.view_count += page_size
+        self.trim_view(self.view_window)
+        if len(children) > 0:
+            self.tv_commits.see(children[0])
 
     def create_columns(self, observations: list[str]):
         """
-        Initially creates columns based on first found
-        Observation list.
+        Initially creates the column layout based on observed folders.
+        Only a window of folder columns gets materialized, see ColumnLayout.
         Won't do anything if columns already present
-        :param observations: first ever loaded observation result
+        :param observations: observed folders
         :return: None
         """
-        if len(self.tv_commits['columns']) > 0:
+        if self.column_layout is not None:
             return
 
-        column_names = ['Last updated']
-        for folder in observations:
-            column_names.append(f'{folder}')
+        self.column_layout = ColumnLayout(observations, int(self.config.viewer_columns),
+                                          bool(self.config.viewer_group_folders))
+        self.apply_columns()
+        self.tv_commits.pack(fill=BOTH, expand=True)
+
+    def apply_columns(self):
+        """
+        Materializes the currently visible columns of the layout
+        and refreshes the values of all materialized rows
+        :return: None
+        """
+        visible = self.column_layout.get_visible()
+        column_names = ['Last updated'] + [spec.title for spec in visible]
 
         # define our column
         self.tv_commits['columns'] = column_names
@@ -200,10 +602,64 @@ class GitObserverViewer(Tk):
         self.tv_commits.column(0, anchor="nw", minwidth=145, stretch=False, width=145)
 
         # format our column
-        for col_idx in range(1, len(column_names)):
-            self.tv_commits.heading(col_idx, anchor="nw", text=column_names[col_idx])
-            self.tv_commits.column(col_idx, anchor="nw", minwidth=150, stretch=True, width=150)
-        self.tv_commits.pack(fill=BOTH, expand=True)
+        for col_idx, spec in enumerate(visible, start=1):
+            command = self.get_group_command(spec.group) if spec.group else ''
+            self.tv_commits.heading(col_idx, anchor="nw", text=spec.title, command=command)
+            self.tv_commits.column(col_idx, anchor="nw", minwidth=100, stretch=True, width=150)
+
+        for iid in self.tv_commits.get_children():
+            row = self.grid_store.get(iid)
+            if row:
+                self.tv_commits.item(iid, values=self.get_row_values(row))
+        self.view_scroll_x.set(*self.column_layout.get_fractions())
+
+    def get_group_command(self, group: ColumnGroup) -> str:
+        """
+        Registers the heading command of given group once
+        and returns its Tcl name for every further heading
+        :param group: group to toggle by command
+        :return: Tcl command name
+        """
+        if group.name not in self.group_commands:
+            self.group_commands[group.name] = self.register(lambda: self.toggle_group(group))
+        return self.group_commands[group.name]
+
+    def toggle_group(self, group: ColumnGroup):
+        """
+        Event handler of group column headings.
+        Collapses or expands the folders of given group
+        :param group: group of clicked heading
+        :return: None
+        """
+        self.column_layout.toggle(group)
+        self.apply_columns()
+
+    def on_column_scroll(self, *args):
+        """
+        Handler of horizontal scrollbar, moving the window of materialized columns
+        :param args: scrollbar command, either ('moveto', fraction) or ('scroll', amount, 'units'|'pages')
+        :return: None
+        """
+        moved = False
+        if args[0] == 'moveto':
+            moved = self.column_layout.moveto(float(args[1]))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= self.column_layout.visible
+            moved = self.column_layout.scroll(amount)
+        if moved:
+            self.apply_columns()
+
+    def on_column_wheel(self, event):
+        """
+        Event handler of horizontal mouse wheel (Shift + wheel)
+        :param event: mouse wheel event
+        :return: None
+        """
+        delta = -1 if event.num == 4 or event.delta > 0 else 1
+        if self.column_layout.scroll(delta):
+            self.apply_columns()
 
     def control_click(self, event):
         """
@@ -216,10 +672,9 @@ class GitObserverViewer(Tk):
         if not commit:
             return
 
-        sha1 = commit.sha1
-        if len(sha1) > 0:
+        if len(commit.oid) > 0:
             # Extract link from clicked and found cell
-            link = f"{self.config.origin}{sha1}"
+            link = f"{self.config.origin}{commit.short_sha1}"
             # open the link in default browser
             wb.open_new_tab(link)
         for item in self.tv_commits.selection():
@@ -228,7 +683,8 @@ class GitObserverViewer(Tk):
     def cell_double_click(self, event):
         """
         Event handler for TreeView purpose when double-clicking.
-        Will get currently selected Commit and opens a detail form for whole commit info
+        Will get currently selected Commit and opens a detail form for whole commit info.
+        The details are loaded in background, while the form shows a loading state
         :param event: Mouse click event
         :return: None
         """
@@ -238,8 +694,30 @@ class GitObserverViewer(Tk):
         # Extract link from next cell of clicked cell
         sha1 = commit.sha1
         if len(sha1) > 0:
-            git_medium_info = self.observer.get_git_show(sha1)
-            TkUtil.show_message_dialog(self, git_medium_info)
+            token = CancelToken()
+            task = BackgroundTask(lambda: self.observer.get_git_show(sha1, token), on_cancel=token.cancel).start()
+            dialog = TkUtil.show_message_dialog(self, f'Loading commit {commit.short_sha1}...')
+            self.after(self.DETAIL_POLL_MS, self.poll_detail, task, dialog)
+
+    def poll_detail(self, task: BackgroundTask, dialog: MessageDialog):
+        """
+        Checks a pending detail request and fills the dialog when done.
+        Cancels the request when the dialog got closed in the meantime
+        :param task: background task running git show
+        :param dialog: dialog waiting for the result
+        :return: None
+        """
+        if dialog.is_closed:
+            task.cancel()
+            return
+        if not task.done:
+            self.after(self.DETAIL_POLL_MS, self.poll_detail, task, dialog)
+            return
+
+        if task.error:
+            dialog.set_text(f'Failed to load commit details: {task.error}')
+        else:
+            dialog.set_text(task.result)
 
     def get_row_on_position(self, pos: Point) -> Commit | None:
         """
@@ -252,9 +730,10 @@ class GitObserverViewer(Tk):
         tree = self.tv_commits
         # Try to get region by position
         region = tree.identify_region(pos.x, pos.y)
+        if not region == 'cell':
+            return None
+
         col = tree.identify_column(pos.x)
-        iid = tree.identify('item', pos.x, pos.y)
-        row_idx = tree.index(iid)
         # The identifier of columns has a trailing '#' which needs to be removed
         col_num = int(col.split('#')[1])
         # Return on Date click
@@ -264,10 +743,13 @@ class GitObserverViewer(Tk):
         # Adjust number to ignore first date column (e.g. col 2 is col 1 in data)
         col_num -= 1
 
-        if not region == 'cell':
+        # Each TreeView item id is the stable key of its row in grid_store
+        row = self.grid_store.get(tree.identify_row(pos.y))
+        visible = self.column_layout.get_visible()
+        if not row or col_num > len(visible):
             return None
-
-        return self.grid_data[row_idx][col_num - 1]
+        commit, _, _ = ColumnLayout.get_cell(row.commits, visible[col_num - 1])
+        return commit
 
     def on_config(self):
         config_window = ConfigWindow(self, self.config)